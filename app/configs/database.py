@@ -36,6 +36,47 @@ configs: dict = {
         'ssl': _get_boolean_env('MONGO_SSL', False)
     },
 
+    # MongoDB 백그라운드 bulk writer (app/services/contracts/drivers/bulk_writer.py)
+    'bulk_writer': {
+        # 기록 대기열에 쌓아 둘 최대 배치 수 (초과 시 submit 이 블록되어 조회 속도를 늦춤)
+        'max_pending': Env.get('MONGO_BULK_MAX_PENDING', '8'),
+        # 하나의 bulk_write 로 합칠 최대 문서 수
+        'coalesce_size': Env.get('MONGO_BULK_COALESCE_SIZE', '5000'),
+    },
+
+    # 빌드 배치 단위 쓰기 버퍼 (app/services/contracts/drivers/unit_of_work.py)
+    'unit_of_work': {
+        # 버퍼에 모아 둘 최대 문서 수 (초과 시 자동 flush)
+        'max_items': Env.get('MONGO_UOW_MAX_ITEMS', '5000'),
+    },
+
+    # 목록 조회 전체 건수(total) 계산 방식 (app/services/contracts/drivers/document_counter.py)
+    'count': {
+        # exact / estimated / cached / none (조회 인자 'count' 로 호출별 지정 가능)
+        'mode': Env.get('MONGO_COUNT_MODE', 'exact'),
+        # cached 모드에서 같은 필터의 건수를 재사용할 시간(초)
+        'ttl': Env.get('MONGO_COUNT_CACHE_TTL', '300'),
+    },
+
+    # 드라이버 선언 기반 컬렉션 생성 옵션 (mongodb_index:* 명령어)
+    'collection': {
+        # 신규 컬렉션 블록 압축 방식 (zstd / snappy / zlib / 빈 값이면 서버 기본값)
+        'block_compressor': Env.get('MONGO_BLOCK_COMPRESSOR', 'zstd'),
+    },
+
+    # 원천 컬렉션 Parquet 스냅샷 내보내기 (mongodb_export:parquet 명령어)
+    'export': {
+        # 출력 디렉토리 (빈 값이면 {storage_root}/parquet)
+        'parquet_path': Env.get('PARQUET_EXPORT_PATH', ''),
+        # Parquet 파일/row group 당 최대 행 수
+        'row_group_size': Env.get('PARQUET_ROW_GROUP_SIZE', '100000'),
+        # 파티션 버퍼 전체에 보관할 최대 행 수 (초과 시 큰 파티션부터 기록)
+        'max_buffered_rows': Env.get('PARQUET_MAX_BUFFERED_ROWS', '500000'),
+        'compression': Env.get('PARQUET_COMPRESSION', 'zstd'),
+        # 스키마를 정할 때 $sample 로 읽을 문서 수 (표본에 없던 필드는 내보내는 중에 문자열 컬럼으로 추가)
+        'schema_sample_size': Env.get('PARQUET_SCHEMA_SAMPLE_SIZE', '10000'),
+    },
+
     # MySQL 설정
     'mysql': {
         'connection': 'mysql',
@@ -10,6 +10,12 @@ configs: dict = {
     'service_key': Env.get('DATA_GO_KR_API_KEY', ''),
 
     'host': Env.get('DATA_GO_KR_HOST', ''),
+
+    # 비동기 크롤 엔진의 API 동시 요청 수 (1 이면 기존 순차 수집)
+    'concurrency': Env.get('DATA_GO_KR_CONCURRENCY', '8'),
+
+    # building_raw:all 에서 (서비스, 법정동) 작업을 처리할 워커 프로세스 수
+    'sync_workers': Env.get('DATA_GO_KR_SYNC_WORKERS', '6'),
 }
 
 __all__ = ['configs']
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""외부 API 공용 HTTP 전송 계층 설정 모듈.
+
+DGK(공공데이터), VWorld, JGK(주소), Slack 등 외부 API 드라이버가 공유하는
+커넥션 풀, 재시도, 타임아웃 정책을 관리합니다.
+"""
+
+from app.core.helpers.env import Env
+
+configs: dict = {
+    # 호스트별로 유지할 커넥션 풀 개수 (requests HTTPAdapter pool_connections)
+    'pool_connections': Env.get('HTTP_POOL_CONNECTIONS', '10'),
+
+    # 호스트당 최대 keep-alive 커넥션 수 (requests HTTPAdapter pool_maxsize / httpx max_keepalive)
+    'pool_maxsize': Env.get('HTTP_POOL_MAXSIZE', '32'),
+
+    # 요청 타임아웃 (초)
+    'timeout': Env.get('HTTP_TIMEOUT', '10'),
+
+    # 비동기 클라이언트에서 HTTP/2 사용 여부 (h2 패키지가 설치된 경우에만 적용)
+    'http2': Env.get('HTTP_HTTP2', 'true'),
+
+    # 페이지 플래너(PaginationPlanner)의 기본 동시 페이지 조회 수
+    'page_concurrency': Env.get('HTTP_PAGE_CONCURRENCY', '4'),
+
+    # 외부 API 원본 응답 디스크 캐시 (app/core/helpers/response_cache.py)
+    'cache': {
+        # off: 사용 안 함 / on: 캐시 우선 + 미스 시 저장 / replay: 캐시만 사용 (네트워크 호출 없음)
+        'mode': Env.get('HTTP_CACHE_MODE', 'off'),
+        # 캐시 디렉토리 (상대 경로면 storage_root 기준)
+        'path': Env.get('HTTP_CACHE_PATH', 'http_cache'),
+        # 캐시 유효 기간 (초, 0 이면 만료 없음 / replay 모드에서는 무시)
+        'ttl': Env.get('HTTP_CACHE_TTL', '604800'),
+        # 압축 레벨 (zstd, 미설치 시 zlib)
+        'level': Env.get('HTTP_CACHE_LEVEL', '3'),
+    },
+
+    # 공통 재시도 정책
+    'retry': {
+        'total': Env.get('HTTP_RETRY_TOTAL', '3'),
+        'backoff_factor': Env.get('HTTP_RETRY_BACKOFF_FACTOR', '1'),
+        'status_forcelist': [429, 500, 502, 503, 504],
+    },
+}
+
+__all__ = ['configs']
@@ -10,6 +10,18 @@ configs: dict = {
     'service_key': Env.get('JUSO_GO_KR_API_KEY', ''),
 
     'host': Env.get('JUSO_GO_KR_HOST', ''),
+
+    # 주소DB 텍스트 파일 임포트 (location_raw:road_code / road_address / block_address / building_group 명령어)
+    'import': {
+        # 파싱한 행을 몇 건씩 묶어 저장할지 (파일 크기와 무관하게 메모리 사용량을 제한)
+        'chunk_size': Env.get('JUSO_IMPORT_CHUNK_SIZE', '5000'),
+        # --parallel 실행 시 파일을 나누어 임포트할 프로세스 수
+        'workers': Env.get('JUSO_IMPORT_WORKERS', '4'),
+        # 임포트 원본 (zip: 받은 ZIP 에서 바로 읽고 current/ 압축 해제 생략, current: current/ 에 풀어서 읽기)
+        'source': Env.get('JUSO_IMPORT_SOURCE', 'zip'),
+        # 텍스트 파서 (line: 줄 단위 split, arrow: pyarrow CSV 리더 열 단위 변환 / benchmark:juso_parser 로 비교)
+        'parser': Env.get('JUSO_IMPORT_PARSER', 'line'),
+    },
 }
 
 __all__ = ['configs']
\ No newline at end of file
@@ -68,6 +68,9 @@ configs: dict = {
 
     'slack': _create_logging_config('slack', 'slack.log'),
 
+    # 외부 API 호출 제한 (토큰 버킷 / 일일 쿼터)
+    'rate_limiter': _create_logging_config('rate_limiter', 'rate_limiter.log'),
+
     'building_raw': _create_logging_config('building_raw', 'building_raw.log'),
     'building_raw_group_info': _create_logging_config('building_raw_group_info', 'building_raw/building_raw_group_info.log'),
     'building_raw_title_info': _create_logging_config('building_raw_title_info', 'building_raw/building_raw_title_info.log'),
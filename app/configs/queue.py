@@ -0,0 +1,27 @@
+"""Celery 큐(분산 수집) 설정 모듈.
+
+building_raw:* / location_raw:address_* 커맨드의 --distributed 실행 시
+작업을 샤드로 나누어 Queue.dispatch 로 여러 워커 컨테이너에 분배하는 정책을 관리합니다.
+"""
+
+from app.core.helpers.env import Env
+
+configs: dict = {
+    # 워커 컨테이너 하나가 동시에 처리할 작업 수 (celery worker --concurrency)
+    'worker_concurrency': Env.get('QUEUE_WORKER_CONCURRENCY', '1'),
+
+    # 건축물대장 수집 시 샤드 하나에 담을 법정동 수
+    'township_shard_size': Env.get('QUEUE_TOWNSHIP_SHARD_SIZE', '200'),
+
+    # 주소 동기화 시 샤드 하나에 담을 문서(_id 범위) 수
+    'id_shard_size': Env.get('QUEUE_ID_SHARD_SIZE', '50000'),
+
+    # 주소 동기화 샤드 Job 의 워커 내 동시 처리 스레드 수
+    # (Celery prefork 자식 프로세스는 multiprocessing.Pool 을 만들 수 없어 스레드 풀을 사용)
+    'address_threads': Env.get('QUEUE_ADDRESS_THREADS', '4'),
+
+    # --wait 실행 시 결과 백엔드 조회 주기 (초)
+    'poll_interval': Env.get('QUEUE_POLL_INTERVAL', '10'),
+}
+
+__all__ = ['configs']
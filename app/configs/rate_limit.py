@@ -0,0 +1,57 @@
+"""외부 API 호출 제한(Rate Limit) 설정 모듈.
+
+공공데이터(DGK), VWorld, 주소(JGK) API 의 초당 호출량, 일일 쿼터, 서비스 키 풀을 관리합니다.
+버킷/쿼터 상태는 MongoDB 에 저장되어 여러 프로세스와 Celery 워커가 같은 한도를 공유합니다.
+"""
+
+from app.core.helpers.env import Env
+
+
+def _get_keys(list_env_key: str, single_env_key: str) -> list:
+    """콤마로 구분된 키 목록 환경변수를 우선 사용하고, 없으면 단일 키 환경변수를 사용합니다."""
+    raw = str(Env.get(list_env_key, '') or Env.get(single_env_key, '') or '')
+    return [key.strip() for key in raw.split(',') if key.strip()]
+
+
+configs: dict = {
+    # 비활성화 시 토큰 대기/쿼터 집계 없이 기본 키를 그대로 사용합니다.
+    'enabled': Env.get('RATE_LIMIT_ENABLED', 'true'),
+
+    # 상태 저장 컬렉션 (landmark DB)
+    'bucket_collection': 'api_rate_limits',
+    'quota_collection': 'api_quota_usages',
+
+    # 429/503 응답 시 감속 정책
+    'slow_down': {
+        'status_codes': [429, 503],
+        # 감속 시 충전 속도 배율 (연속 발생 시 누적 곱)
+        'factor': 0.5,
+        'min_factor': 0.1,
+        # 감속 유지 시간 (초)
+        'cooldown': Env.get('RATE_LIMIT_SLOW_DOWN_COOLDOWN', '60'),
+    },
+
+    # 공급자별 설정 (rate: 초당 토큰 충전량, burst: 최대 적립 토큰, daily_quota: 키당 일일 호출 한도, 0 이면 무제한)
+    'providers': {
+        'dgk': {
+            'rate': Env.get('DATA_GO_KR_RATE_LIMIT', '30'),
+            'burst': Env.get('DATA_GO_KR_RATE_BURST', '30'),
+            'daily_quota': Env.get('DATA_GO_KR_DAILY_QUOTA', '1000000'),
+            'keys': _get_keys('DATA_GO_KR_API_KEYS', 'DATA_GO_KR_API_KEY'),
+        },
+        'vworld': {
+            'rate': Env.get('V_WORLD_RATE_LIMIT', '20'),
+            'burst': Env.get('V_WORLD_RATE_BURST', '20'),
+            'daily_quota': Env.get('V_WORLD_DAILY_QUOTA', '0'),
+            'keys': _get_keys('V_WORLD_API_KEYS', 'V_WORLD_API_KEY'),
+        },
+        'jgk': {
+            'rate': Env.get('JUSO_GO_KR_RATE_LIMIT', '20'),
+            'burst': Env.get('JUSO_GO_KR_RATE_BURST', '20'),
+            'daily_quota': Env.get('JUSO_GO_KR_DAILY_QUOTA', '0'),
+            'keys': _get_keys('JUSO_GO_KR_API_KEYS', 'JUSO_GO_KR_API_KEY'),
+        },
+    },
+}
+
+__all__ = ['configs']
@@ -0,0 +1,143 @@
+import importlib.util
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import Config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경에서는 표준 json 으로 동작
+    orjson = None
+
+
+class Http:
+    """
+    외부 API 드라이버가 공유하는 프로세스 단위 HTTP 전송 계층입니다.
+
+    - requests.Session 을 프로세스당 1개만 만들어 호스트별 keep-alive 커넥션 풀을 재사용합니다.
+      (multiprocessing fork 이후에는 소켓을 공유하지 않도록 pid 기준으로 새로 생성)
+    - 재시도/타임아웃 정책은 app/configs/http.py 한 곳에서 관리합니다.
+    - 비동기 수집용 httpx.AsyncClient 도 같은 정책으로 생성하며, h2 가 설치되어 있으면 HTTP/2 를 사용합니다.
+    - JSON 디코딩은 orjson 이 설치되어 있으면 이를 사용합니다.
+
+    Attributes:
+        _sessions (dict): pid 별 requests.Session 캐시
+    """
+    _sessions: Dict[int, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def session() -> requests.Session:
+        """현재 프로세스의 공유 Session 을 반환합니다."""
+        pid = os.getpid()
+        session = Http._sessions.get(pid)
+        if session is not None:
+            return session
+
+        with Http._lock:
+            if pid not in Http._sessions:
+                # fork 로 상속된 부모 프로세스의 세션은 버립니다.
+                Http._sessions.clear()
+                Http._sessions[pid] = Http._create_session()
+            return Http._sessions[pid]
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        retry_strategy = Retry(
+            total=int(Config.get('http.retry.total', 3)),
+            backoff_factor=float(Config.get('http.retry.backoff_factor', 1)),
+            status_forcelist=Http.retry_status_codes(),
+            allowed_methods=["GET", "HEAD"]
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=int(Config.get('http.pool_connections', 10)),
+            pool_maxsize=int(Config.get('http.pool_maxsize', 32)),
+            max_retries=retry_strategy
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def timeout() -> float:
+        return float(Config.get('http.timeout', 10))
+
+    @staticmethod
+    def retry_status_codes() -> list:
+        return list(Config.get('http.retry.status_forcelist', [429, 500, 502, 503, 504]))
+
+    @staticmethod
+    def get(url: str, params: Optional[dict] = None, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        return Http.session().get(url, params=params, timeout=timeout or Http.timeout(), **kwargs)
+
+    @staticmethod
+    def post(url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        return Http.session().post(url, timeout=timeout or Http.timeout(), **kwargs)
+
+    @staticmethod
+    def get_json(url: str, params: Optional[dict] = None, timeout: Optional[float] = None) -> Any:
+        """GET 요청 후 상태 코드를 검사하고 JSON 으로 디코딩하여 반환합니다."""
+        return Http.loads(Http.get_content(url, params=params, timeout=timeout))
+
+    @staticmethod
+    def get_content(url: str, params: Optional[dict] = None, timeout: Optional[float] = None) -> bytes:
+        """GET 요청 후 상태 코드를 검사하고 응답 본문(bytes)을 반환합니다."""
+        response = Http.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    @staticmethod
+    def status_history(response: requests.Response) -> List[int]:
+        """urllib3 재시도 이력을 포함한 응답 상태 코드 목록을 반환합니다. (Rate Limiter 보고용)"""
+        codes = []
+        retries = getattr(response.raw, 'retries', None)
+        for history in getattr(retries, 'history', None) or ():
+            if history.status:
+                codes.append(history.status)
+        codes.append(response.status_code)
+        return codes
+
+    @staticmethod
+    def loads(content: Union[str, bytes]) -> Any:
+        """JSON 디코딩 (orjson 우선, 실패 시 ValueError 계열 예외 발생)"""
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
+    @staticmethod
+    def async_client(max_connections: Optional[int] = None, **kwargs) -> httpx.AsyncClient:
+        """
+        공통 정책이 적용된 httpx.AsyncClient 를 생성합니다.
+        AsyncClient 는 이벤트 루프에 묶이므로 캐시하지 않고 호출자가 async with 로 수명을 관리합니다.
+        """
+        max_keepalive = int(Config.get('http.pool_maxsize', 32))
+        max_connections = max_connections or max_keepalive
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, max_keepalive)
+        )
+
+        return httpx.AsyncClient(
+            timeout=Http.timeout(),
+            limits=limits,
+            http2=Http._http2_available(),
+            **kwargs
+        )
+
+    @staticmethod
+    def _http2_available() -> bool:
+        return bool(Config.get('http.http2', True)) and importlib.util.find_spec('h2') is not None
+
+
+# 외부로 노출할 클래스 목록을 정의합니다.
+__all__ = ['Http']
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import time
+import zlib
+from typing import Any, Callable, Optional
+
+from .config import Config
+from .http import Http
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard 미설치 환경에서는 zlib 으로 압축
+    zstandard = None
+
+
+class CacheMissError(Exception):
+    """replay 모드에서 캐시에 없는 요청을 만났을 때 발생합니다."""
+    pass
+
+
+class ResponseCache:
+    """
+    외부 API 원본 응답의 디스크 캐시입니다. (content-addressed)
+
+    - 요청은 (공급자, URL, 정규화된 파라미터) 해시로 식별하며, 서비스 키 등 인증 파라미터는 키에서 제외합니다.
+    - 응답 본문은 내용 해시(sha256)로 한 번만 저장하고(blobs/), 요청 인덱스는 해당 blob 을 가리킵니다.
+      (빈 페이지처럼 같은 응답이 반복되면 저장 공간을 공유)
+    - 본문은 zstandard 가 설치되어 있으면 zstd, 아니면 zlib 으로 압축합니다.
+    - 모드 (app/configs/http.py cache.mode)
+        off    : 사용 안 함
+        on     : TTL 이내 캐시가 있으면 사용하고, 없으면 호출 후 저장
+        replay : 캐시만 사용 (TTL 무시, 없으면 CacheMissError) → 네트워크 없이 재처리/벤치마크
+    """
+    MODE_OFF = 'off'
+    MODE_ON = 'on'
+    MODE_REPLAY = 'replay'
+
+    # 캐시 키에서 제외할 인증/환경 파라미터
+    SECRET_PARAMS = ('serviceKey', 'confmKey', 'key', 'domain')
+
+    _mode_override: Optional[str] = None
+
+    @staticmethod
+    def mode() -> str:
+        if ResponseCache._mode_override:
+            return ResponseCache._mode_override
+        return str(Config.get('http.cache.mode', ResponseCache.MODE_OFF) or ResponseCache.MODE_OFF).lower()
+
+    @staticmethod
+    def set_mode(mode: Optional[str]):
+        """현재 프로세스의 캐시 모드를 변경합니다. (None 이면 설정값 사용)"""
+        if mode not in (None, ResponseCache.MODE_OFF, ResponseCache.MODE_ON, ResponseCache.MODE_REPLAY):
+            raise ValueError(f"지원하지 않는 캐시 모드입니다: {mode}")
+        ResponseCache._mode_override = mode
+
+    @staticmethod
+    def key(provider: str, url: str, params: Optional[dict] = None) -> str:
+        """공급자 + URL + 정규화된 파라미터(인증 파라미터 제외) 기준 요청 키"""
+        normalized = {
+            str(k): str(v) for k, v in (params or {}).items()
+            if k not in ResponseCache.SECRET_PARAMS and v is not None
+        }
+        payload = json.dumps([provider, url, normalized], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def fetch(provider: str, url: str, params: Optional[dict], request: Callable[[], bytes],
+              decode: Callable[[bytes], Any] = Http.loads,
+              should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        캐시를 거쳐 응답을 조회합니다.
+
+        Args:
+            provider: 공급자 구분 (dgk / vworld / jgk)
+            url: 요청 URL
+            params: 요청 파라미터 (캐시 키 생성용)
+            request: 캐시 미스 시 실제 호출을 수행하고 응답 본문(bytes)을 반환하는 함수
+            decode: 응답 본문 디코딩 함수 (디코딩에 성공한 응답만 저장)
+            should_cache: 디코딩한 응답의 저장 여부 판단 함수
+                (HTTP 200 으로 내려오는 API 오류 응답이 TTL 동안 재사용되지 않도록 공급자별 성공 상태만 저장)
+        """
+        cache_key = ResponseCache.key(provider, url, params)
+
+        content = ResponseCache.get(provider, cache_key)
+        if content is not None:
+            return decode(content)
+
+        content = request()
+        data = decode(content)
+        if should_cache is None or should_cache(data):
+            ResponseCache.put(provider, cache_key, content)
+        return data
+
+    @staticmethod
+    def get(provider: str, cache_key: str) -> Optional[bytes]:
+        """
+        캐시된 응답 본문을 반환합니다. 없거나 만료되었으면 None
+        (replay 모드에서는 CacheMissError)
+        """
+        mode = ResponseCache.mode()
+        if mode == ResponseCache.MODE_OFF:
+            return None
+
+        index_path = ResponseCache._index_path(provider, cache_key)
+        try:
+            ttl = int(Config.get('http.cache.ttl', 0))
+            if mode != ResponseCache.MODE_REPLAY and ttl > 0 and time.time() - os.path.getmtime(index_path) > ttl:
+                return None
+
+            with open(index_path, 'r') as f:
+                blob_name = f.read().strip()
+            with open(os.path.join(ResponseCache._root(), 'blobs', blob_name[:2], blob_name), 'rb') as f:
+                return ResponseCache._decompress(blob_name, f.read())
+
+        except (FileNotFoundError, zlib.error, ValueError):
+            if mode == ResponseCache.MODE_REPLAY:
+                raise CacheMissError(f"[{provider}] 캐시에 없는 요청입니다: {cache_key}")
+            return None
+
+    @staticmethod
+    def put(provider: str, cache_key: str, content: bytes):
+        """응답 본문을 내용 해시로 저장하고 요청 인덱스를 갱신합니다. (on 모드에서만)"""
+        if ResponseCache.mode() != ResponseCache.MODE_ON:
+            return
+
+        extension = 'zst' if zstandard is not None else 'zz'
+        blob_name = f"{hashlib.sha256(content).hexdigest()}.{extension}"
+        blob_path = os.path.join(ResponseCache._root(), 'blobs', blob_name[:2], blob_name)
+
+        if not os.path.exists(blob_path):
+            ResponseCache._write_atomic(blob_path, ResponseCache._compress(content))
+
+        ResponseCache._write_atomic(ResponseCache._index_path(provider, cache_key), blob_name.encode('utf-8'))
+
+    @staticmethod
+    def _root() -> str:
+        path = str(Config.get('http.cache.path', 'http_cache'))
+        if not os.path.isabs(path):
+            path = os.path.join(Config.get('app.storage_root'), path)
+        return path
+
+    @staticmethod
+    def _index_path(provider: str, cache_key: str) -> str:
+        return os.path.join(ResponseCache._root(), 'index', provider, cache_key[:2], cache_key)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        """여러 프로세스가 동시에 쓰더라도 깨진 파일이 남지 않도록 임시 파일 작성 후 교체합니다."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _compress(content: bytes) -> bytes:
+        level = int(Config.get('http.cache.level', 3))
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=level).compress(content)
+        return zlib.compress(content, level)
+
+    @staticmethod
+    def _decompress(blob_name: str, data: bytes) -> bytes:
+        if blob_name.endswith('.zst'):
+            if zstandard is None:
+                raise ValueError("zstd 로 압축된 캐시를 읽으려면 zstandard 패키지가 필요합니다.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+
+# 외부로 노출할 클래스 목록을 정의합니다.
+__all__ = ['ResponseCache', 'CacheMissError']
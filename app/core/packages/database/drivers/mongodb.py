@@ -25,17 +25,22 @@ class MongoDB(AbstractDriver):
         self.default_database = conn['name']
 
         # MongoDB 클라이언트 생성
-        # 사용자 이름과 비밀번호를 URL 인코딩하여 연결 문자열을 안전하게 구성합니다.
+        self.client = pymongo.MongoClient(self._uri(conn))
 
+        return self
 
-        self.client = pymongo.MongoClient(
+    @staticmethod
+    def _uri(conn: dict) -> str:
+        """
+        연결 문자열을 생성합니다.
+        사용자 이름과 비밀번호를 URL 인코딩하여 연결 문자열을 안전하게 구성합니다.
+        """
+        return (
             f"mongodb://{conn['user']}:{urllib.parse.quote(conn['password'])}"
             f"@{conn['host']}:{conn['port']}/{conn['name']}?"
             f"authMechanism=SCRAM-SHA-1&retryWrites=false&ssl=false"
         )
 
-        return self
-
     def get_connection(self) -> pymongo.MongoClient:
         """
         MongoDB 연결 객체를 반환합니다.
@@ -60,5 +65,41 @@ class MongoDB(AbstractDriver):
         """
         raise ValueError('MongoDB 연결이 준비되지 않았습니다.')
 
+
+class AsyncMongoDB(MongoDB):
+    """
+    비동기 MongoDB 연결을 관리하는 클래스입니다.
+    동기 클라이언트와 같은 연결 설정으로 pymongo AsyncMongoClient 를 생성합니다.
+    AsyncMongoClient 는 처음 사용한 이벤트 루프에 묶이므로 루프마다 따로 생성해야 합니다.
+    """
+
+    client: pymongo.AsyncMongoClient = None  # 비동기 MongoDB 클라이언트 객체를 저장하는 변수입니다.
+
+    def set_connection(self, conn: dict) -> 'AsyncMongoDB':
+        """
+        비동기 MongoDB 연결을 설정합니다.
+
+        Args:
+            conn (dict): MongoDB 연결 설정 정보가 포함된 객체
+
+        Returns:
+            AsyncMongoDB: 설정된 연결 객체 자신을 반환합니다.
+        """
+        self.default_database = conn['name']
+        self.client = pymongo.AsyncMongoClient(self._uri(conn))
+        return self
+
+    def get_connection(self) -> pymongo.AsyncMongoClient:
+        """
+        비동기 MongoDB 연결 객체를 반환합니다.
+
+        Raises:
+            ValueError: MongoDB 연결이 설정되지 않은 경우 예외를 발생시킵니다.
+        """
+        if not self.client:
+            self._raise_not_prepare_connection()
+        return self.client
+
+
 # 외부에 노출할 클래스 목록을 정의합니다.
-__all__ = ['MongoDB']
\ No newline at end of file
+__all__ = ['MongoDB', 'AsyncMongoDB']
\ No newline at end of file
@@ -5,17 +5,19 @@
 - 드라이버별 연결 설정 및 인스턴스 관리
 - 설정 기반 동적 드라이버 선택
 - 연결 상태 모니터링 및 헬스 체크
+- 비동기(asyncio) MongoDB 클라이언트 제공 (이벤트 루프별 관리)
 """
 
 from typing import Union, Optional, Dict, Any, List
+import asyncio
 import logging
 
 from opensearchpy import OpenSearch
-from pymongo import MongoClient
+from pymongo import MongoClient, AsyncMongoClient
 
 from app.core.packages.support.abstracts.abstract_manager import AbstractManager
 from .drivers.opensearch import Opensearch
-from .drivers.mongodb import MongoDB
+from .drivers.mongodb import MongoDB, AsyncMongoDB
 from .drivers.mysql import MySQLDriver
 from ...helpers.config import Config
 
@@ -48,7 +50,10 @@ class Manager(AbstractManager):
         self.default_driver: str = self._config['default_driver']
 
         # 드라이버 인스턴스 캐시 (재사용을 위한 성능 최적화)
-        self._driver_cache: Dict[str, Union[OpenSearch, MongoClient, MySQLDriver]] = {}
+        self._driver_cache: Dict[str, Union[OpenSearch, MongoClient, AsyncMongoClient, MySQLDriver]] = {}
+
+        # 비동기 클라이언트가 묶인 이벤트 루프 (AsyncMongoClient 는 생성된 루프에서만 사용 가능)
+        self._async_loops: Dict[str, Optional[asyncio.AbstractEventLoop]] = {}
 
         # 매니저 전용 로거
         self._logger: logging.Logger = logging.getLogger('database.manager')
@@ -103,6 +108,52 @@ class Manager(AbstractManager):
             self._logger.error(f"MongoDB 드라이버 생성 실패: {driver_name} - {e}")
             raise ConnectionError(f"MongoDB 연결 실패 ({driver_name}): {e}")
 
+    def get_async_mongodb_driver(
+            self,
+            driver_name: str,
+            conn: Optional[dict] = None,
+            use_cache: bool = True
+    ) -> AsyncMongoClient:
+        """
+        비동기 MongoDB 드라이버(pymongo AsyncMongoClient) 인스턴스를 반환합니다.
+
+        AsyncMongoClient 는 처음 사용한 이벤트 루프에 묶이므로, 캐시된 클라이언트가 다른 루프에서 생성된 경우
+        (asyncio.run 을 여러 번 호출하는 명령어 등) 현재 루프용으로 새로 생성합니다.
+
+        Args:
+            driver_name (str): 드라이버 식별자
+            conn (Optional[dict]): MongoDB 연결 설정. None인 경우 설정에서 자동 로드
+            use_cache (bool): 캐시된 인스턴스 사용 여부
+
+        Returns:
+            AsyncMongoClient: 비동기 MongoDB 클라이언트 인스턴스
+
+        Raises:
+            ConnectionError: 클라이언트 생성에 실패한 경우
+        """
+        cache_key = f"async_mongodb_{driver_name}"
+        loop = self._running_loop()
+
+        # 캐시된 인스턴스가 현재 이벤트 루프에서 생성된 경우에만 재사용
+        if use_cache and cache_key in self._driver_cache and self._async_loops.get(cache_key) is loop:
+            self._logger.debug(f"비동기 MongoDB 드라이버 캐시 사용: {driver_name}")
+            return self._driver_cache[cache_key]
+
+        try:
+            connection_config = conn or self.get_config(driver_name, 'mongodb')
+            client = AsyncMongoDB().set_connection(connection_config).get_connection()
+
+            if use_cache:
+                self._driver_cache[cache_key] = client
+                self._async_loops[cache_key] = loop
+
+            self._logger.info(f"비동기 MongoDB 드라이버 생성 완료: {driver_name}")
+            return client
+
+        except Exception as e:
+            self._logger.error(f"비동기 MongoDB 드라이버 생성 실패: {driver_name} - {e}")
+            raise ConnectionError(f"비동기 MongoDB 연결 실패 ({driver_name}): {e}")
+
     def get_opensearch_driver(
             self,
             driver_name: str,
@@ -279,7 +330,9 @@ class Manager(AbstractManager):
         Returns:
             List[str]: 설정된 드라이버 이름 목록
         """
-        return [key for key in self._config.keys() if key != 'default_driver']
+        # bulk_writer, count 등 연결이 아닌 설정 항목은 제외합니다.
+        return [key for key, value in self._config.items()
+                if isinstance(value, dict) and value.get('connection')]
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -355,10 +408,12 @@ class Manager(AbstractManager):
                               if key.endswith(f"_{driver_name}")]
             for key in keys_to_remove:
                 del self._driver_cache[key]
+                self._async_loops.pop(key, None)
             self._logger.info(f"드라이버 캐시 정리 완료: {driver_name}")
         else:
             # 모든 캐시 정리
             self._driver_cache.clear()
+            self._async_loops.clear()
             self._logger.info("모든 드라이버 캐시 정리 완료")
 
     def close_all_connections(self) -> None:
@@ -366,9 +421,12 @@ class Manager(AbstractManager):
         모든 활성 데이터베이스 연결을 정리합니다.
 
         애플리케이션 종료 시나 테스트 후 정리 작업에서 사용됩니다.
+        비동기 MongoDB 클라이언트는 이벤트 루프 안에서 close_async_connections() 로 닫아야 하며, 여기서는 캐시에서만 제거됩니다.
         """
         for cache_key, driver in self._driver_cache.items():
             try:
+                if isinstance(driver, AsyncMongoClient):
+                    continue
                 if isinstance(driver, MongoClient):
                     driver.close()
                 elif isinstance(driver, MySQLDriver):
@@ -381,6 +439,31 @@ class Manager(AbstractManager):
 
         self.clear_cache()
 
+    async def close_async_connections(self) -> None:
+        """
+        현재 이벤트 루프에서 생성된 비동기 MongoDB 클라이언트를 닫고 캐시에서 제거합니다.
+
+        asyncio.run 으로 실행되는 작업은 루프가 끝나기 전에 호출하여 연결을 정리합니다.
+        """
+        loop = self._running_loop()
+        for cache_key in [key for key, bound in self._async_loops.items() if bound is loop]:
+            client = self._driver_cache.pop(cache_key, None)
+            self._async_loops.pop(cache_key, None)
+            try:
+                if client is not None:
+                    await client.close()
+                self._logger.debug(f"비동기 연결 정리 완료: {cache_key}")
+            except Exception as e:
+                self._logger.warning(f"비동기 연결 정리 실패: {cache_key} - {e}")
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        """실행 중인 이벤트 루프를 반환합니다. (루프 밖에서 호출하면 None)"""
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
     def _raise_driver_not_found(self, driver_name: str) -> None:
         """
         드라이버를 찾을 수 없는 경우 예외를 발생시킵니다.
@@ -5,8 +5,11 @@
 """
 
 from .abstracts.abstract_container import AbstractContainer, providers
+from .modules.checkpoint import Checkpoint
 from .modules.command import Command
+from .modules.import_manifest import ImportManifest
 from .modules.queue import Queue
+from .modules.rate_limiter import RateLimiter
 from .modules.scheduler import Scheduler
 from app.core.packages.database.container import Container as DatabaseContainer
 from app.core.helpers.config import Config
@@ -29,6 +32,21 @@ class Container(AbstractContainer):
         Scheduler, database_manager=database_container.manager
     )
 
+    # 외부 API 호출 제한 (MongoDB 공유 토큰 버킷)
+    rate_limiter: providers.Singleton[RateLimiter] = providers.Singleton(
+        RateLimiter, database_manager=database_container.manager
+    )
+
+    # 작업 이어하기 지점 저장소 (MongoDB)
+    checkpoint: providers.Singleton[Checkpoint] = providers.Singleton(
+        Checkpoint, database_manager=database_container.manager
+    )
+
+    # 파일 임포트 이력(매니페스트) 저장소 (MongoDB)
+    import_manifest: providers.Singleton[ImportManifest] = providers.Singleton(
+        ImportManifest, database_manager=database_container.manager
+    )
+
     # ...
     # Redis 설정을 가져와서 Queue 모듈에 주입
     queue: providers.Singleton[Queue] = providers.Singleton(
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from pymongo.collection import Collection
+
+from app.core.helpers.log import Log
+from app.core.packages.database.manager import Manager  # 매니저 타입 힌트용
+
+
+class Checkpoint:
+    """
+    MongoDB 기반 수집/빌드 작업 이어하기 지점(워터마크) 저장소입니다.
+
+    (job, service, shard) 조합마다 문서 하나를 두고, 배치가 커밋될 때마다 원자적으로 덮어씁니다.
+    워터마크는 법정동/페이지/_id 등 dict 를 그대로 저장하므로 ObjectId, datetime 도 타입이 유지됩니다.
+    """
+
+    def __init__(self, database_manager: Manager):
+        self.logger = Log.get_logger('command')
+        self.database_manager = database_manager
+        self.db_name = "landmark"
+        self.collection_name = "sync_checkpoints"
+        self._collection: Optional[Collection] = None
+
+    @property
+    def collection(self) -> Collection:
+        if self._collection is None:
+            self._collection = (
+                self.database_manager.get_mongodb_driver('mongodb')
+                .get_database(self.db_name)
+                .get_collection(self.collection_name)
+            )
+        return self._collection
+
+    @staticmethod
+    def _key(job: str, service: str, shard: Optional[str] = None) -> str:
+        return f"{job}:{service}:{shard or 'default'}"
+
+    def get(self, job: str, service: str, shard: Optional[str] = None,
+            max_age_days: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        저장된 워터마크를 반환합니다.
+        max_age_days 보다 오래된 체크포인트는 무시(None)합니다.
+        """
+        doc = self.collection.find_one({'_id': self._key(job, service, shard)})
+        if not doc:
+            return None
+
+        if max_age_days is not None and doc.get('updated_at'):
+            if datetime.now() - doc['updated_at'] > timedelta(days=max_age_days):
+                return None
+
+        return doc.get('watermark')
+
+    def save(self, job: str, service: str, watermark: Dict[str, Any], shard: Optional[str] = None):
+        """워터마크를 원자적으로 저장합니다. (배치 커밋 직후 호출)"""
+        now = datetime.now()
+        self.collection.update_one(
+            {'_id': self._key(job, service, shard)},
+            {
+                '$set': {
+                    'job': job,
+                    'service': service,
+                    'shard': shard or 'default',
+                    'watermark': watermark,
+                    'updated_at': now,
+                },
+                '$setOnInsert': {'created_at': now},
+            },
+            upsert=True
+        )
+
+    def clear(self, job: str, service: str, shard: Optional[str] = None):
+        """작업이 끝까지 완료되면 체크포인트를 삭제합니다."""
+        self.collection.delete_one({'_id': self._key(job, service, shard)})
+
+
+__all__ = ['Checkpoint']
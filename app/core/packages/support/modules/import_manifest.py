@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pymongo.collection import Collection
+
+from app.core.helpers.log import Log
+from app.core.packages.database.manager import Manager  # 매니저 타입 힌트용
+
+
+class ImportManifest:
+    """
+    MongoDB 기반 파일 임포트 이력(매니페스트) 저장소입니다.
+
+    (dataset, 파일명, 크기, 수정 시각, 체크섬) 조합마다 문서 하나를 두고 상태(running / done / failed)와 건수를 기록합니다.
+    임포트 전에는 같은 조합의 문서를 _id 로 한 번 조회하여 이미 완료된 파일인지 확인하므로,
+    로그 파일 전체를 검색하던 방식과 달리 이력이 쌓이거나 로그가 로테이션되어도 조회 비용이 변하지 않습니다.
+
+    Usage:
+        fingerprint = {'file_name': ..., 'size': ..., 'mtime': ..., 'checksum': ...}
+        if not import_manifest.is_done('location_raw_road_code', fingerprint):
+            import_manifest.start('location_raw_road_code', fingerprint)
+            ...
+            import_manifest.finish('location_raw_road_code', fingerprint, rows, stats)
+    """
+
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    def __init__(self, database_manager: Manager):
+        self.logger = Log.get_logger('command')
+        self.database_manager = database_manager
+        self.db_name = "landmark"
+        self.collection_name = "import_manifests"
+        self._collection: Optional[Collection] = None
+
+    @property
+    def collection(self) -> Collection:
+        if self._collection is None:
+            self._collection = (
+                self.database_manager.get_mongodb_driver('mongodb')
+                .get_database(self.db_name)
+                .get_collection(self.collection_name)
+            )
+        return self._collection
+
+    @staticmethod
+    def _key(dataset: str, fingerprint: Dict[str, Any]) -> str:
+        return ":".join(str(value) for value in (
+            dataset, fingerprint['file_name'], fingerprint['size'], fingerprint['mtime'], fingerprint['checksum']
+        ))
+
+    def get(self, dataset: str, fingerprint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """같은 파일(동일 크기/수정 시각/체크섬)의 임포트 이력을 반환합니다."""
+        return self.collection.find_one({'_id': self._key(dataset, fingerprint)})
+
+    def is_done(self, dataset: str, fingerprint: Dict[str, Any]) -> bool:
+        """같은 파일을 이미 끝까지 임포트했는지 확인합니다."""
+        doc = self.get(dataset, fingerprint)
+        return bool(doc) and doc.get('status') == self.STATUS_DONE
+
+    def _update(self, dataset: str, fingerprint: Dict[str, Any], values: Dict[str, Any], inc: Optional[Dict[str, int]] = None):
+        now = datetime.now()
+        update = {
+            '$set': {'dataset': dataset, **fingerprint, **values, 'updated_at': now},
+            '$setOnInsert': {'created_at': now},
+        }
+        if inc:
+            update['$inc'] = inc
+
+        self.collection.update_one({'_id': self._key(dataset, fingerprint)}, update, upsert=True)
+
+    def start(self, dataset: str, fingerprint: Dict[str, Any]):
+        """임포트 시작을 기록합니다."""
+        self._update(dataset, fingerprint, {
+            'status': self.STATUS_RUNNING,
+            'started_at': datetime.now(),
+            'finished_at': None,
+            'error': None,
+        }, inc={'attempts': 1})
+
+    def finish(self, dataset: str, fingerprint: Dict[str, Any], rows: int, stats: Optional[Dict[str, Any]] = None):
+        """임포트 완료와 건수(파싱 행 수, 저장 결과)를 기록합니다."""
+        self._update(dataset, fingerprint, {
+            'status': self.STATUS_DONE,
+            'rows': rows,
+            'stats': stats or {},
+            'finished_at': datetime.now(),
+        })
+
+    def fail(self, dataset: str, fingerprint: Dict[str, Any], error: str):
+        """임포트 실패를 기록합니다. (다음 실행에서 다시 임포트)"""
+        self._update(dataset, fingerprint, {
+            'status': self.STATUS_FAILED,
+            'error': error,
+            'finished_at': datetime.now(),
+        })
+
+
+__all__ = ['ImportManifest']
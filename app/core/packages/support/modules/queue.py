@@ -1,6 +1,9 @@
-from typing import Type
+import time
+from typing import Any, Iterable, Iterator, Optional, Tuple, Type
 from urllib.parse import quote_plus  # 🚀 필수 추가
 from celery import Celery
+from celery.result import AsyncResult
+from app.core.helpers.config import Config
 from app.core.helpers.log import Log
 
 
@@ -33,13 +36,42 @@ class Queue:
             result_extended=True
         )
 
-    def dispatch(self, job_class: Type, **payload):
+    def dispatch(self, job_class: Type, **payload) -> Optional[AsyncResult]:
+        """
+        Job 을 큐로 발행하고 결과 추적용 AsyncResult 를 반환합니다. (발행 실패 시 None)
+        """
         job_path = f"{job_class.__module__}.{job_class.__name__}"
         try:
-            self.app.send_task(
+            result = self.app.send_task(
                 'app.queue.router',
                 kwargs={'job_path': job_path, 'data': payload}
             )
-            self.logger.info(f"📤 Dispatch Success: {job_path}")
+            self.logger.info(f"📤 Dispatch Success: {job_path} ({result.id})")
+            return result
         except Exception as e:
-            self.logger.error(f"❌ Dispatch Failed: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"❌ Dispatch Failed: {str(e)}")
+            return None
+
+    def gather(self, results: Iterable[AsyncResult],
+               interval: Optional[float] = None) -> Iterator[Tuple[AsyncResult, Any, Optional[BaseException]]]:
+        """
+        발행한 Job 들의 결과를 완료되는 순서대로 (result, output, error) 형태로 반환합니다.
+        결과는 MongoDB 결과 백엔드(queue_results)에서 조회하므로 어느 워커에서 실행되었는지와 무관하게 집계할 수 있습니다.
+        """
+        pending = [result for result in results if result is not None]
+        interval = float(interval or Config.get('queue.poll_interval', 10))
+
+        while pending:
+            remaining = []
+            for result in pending:
+                if not result.ready():
+                    remaining.append(result)
+                elif result.successful():
+                    # queue_router 반환값: {"job_class": ..., "output": ...}
+                    yield result, (result.result or {}).get('output'), None
+                else:
+                    yield result, None, result.result
+
+            pending = remaining
+            if pending:
+                time.sleep(interval)
\ No newline at end of file
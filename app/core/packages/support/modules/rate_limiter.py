@@ -0,0 +1,220 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
+
+from app.core.helpers.config import Config
+from app.core.helpers.log import Log
+from app.core.packages.database.manager import Manager  # 매니저 타입 힌트용
+
+
+class QuotaExceededError(Exception):
+    """공급자의 모든 서비스 키가 일일 쿼터를 소진했을 때 발생합니다."""
+    pass
+
+
+class RateLimiter:
+    """
+    MongoDB 기반 프로세스 간 공유 토큰 버킷 + 일일 쿼터 관리자입니다.
+
+    - 버킷 상태를 MongoDB 문서 하나에 두고 파이프라인 업데이트로 원자적으로 리필/차감하므로
+      multiprocessing.Process 자식, Celery 워커 등 여러 프로세스/호스트에서 같은 한도를 공유합니다.
+    - 서비스 키별 일일 호출 수를 집계하고, 여러 키를 라운드로빈으로 사용하며 소진된 키는 건너뜁니다.
+    - 429/503 응답이 보고되면 일정 시간 동안 충전 속도를 줄였다가(adaptive slow-down) 자동 복구합니다.
+
+    설정은 app/configs/rate_limit.py 에서 관리합니다.
+    """
+
+    def __init__(self, database_manager: Manager):
+        self.logger = Log.get_logger('rate_limiter')
+        self.database_manager = database_manager
+        self.db_name = "landmark"
+        self._collections: Dict[str, Collection] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(Config.get('rate_limit.enabled', False))
+
+    def _collection(self, key: str) -> Collection:
+        if key not in self._collections:
+            name = Config.get(f'rate_limit.{key}_collection')
+            self._collections[key] = (
+                self.database_manager.get_mongodb_driver('mongodb')
+                .get_database(self.db_name)
+                .get_collection(name)
+            )
+        return self._collections[key]
+
+    def _provider_config(self, provider: str) -> Optional[dict]:
+        return Config.get(f'rate_limit.providers.{provider}')
+
+    def keys(self, provider: str, default_key: Optional[str] = None) -> List[str]:
+        cfg = self._provider_config(provider) or {}
+        keys = [k for k in cfg.get('keys', []) if k]
+        if not keys and default_key:
+            keys = [default_key]
+        return keys
+
+    def acquire(self, provider: str, default_key: Optional[str] = None) -> str:
+        """
+        토큰을 1개 획득할 때까지 대기한 뒤, 이번 호출에 사용할 서비스 키를 반환합니다.
+
+        Raises:
+            QuotaExceededError: 모든 키의 일일 쿼터가 소진된 경우
+        """
+        while True:
+            key, wait = self._try_acquire(provider, default_key)
+            if key is not None:
+                return key
+            time.sleep(wait)
+
+    async def acquire_async(self, provider: str, default_key: Optional[str] = None) -> str:
+        """acquire 의 asyncio 버전 (MongoDB 호출은 스레드에서 수행)"""
+        while True:
+            key, wait = await asyncio.to_thread(self._try_acquire, provider, default_key)
+            if key is not None:
+                return key
+            await asyncio.sleep(wait)
+
+    def report(self, provider: str, key: str, status_codes: Iterable[int]):
+        """
+        응답 상태 코드(재시도 이력 포함)를 보고합니다.
+        429/503 이 있으면 버킷 충전 속도를 줄입니다.
+        """
+        if not self.enabled or not self._provider_config(provider):
+            return
+
+        throttled = [code for code in status_codes if code in self._slow_down_status_codes()]
+        if throttled:
+            self._slow_down(provider)
+
+    def exhaust(self, provider: str, key: str):
+        """공급자가 쿼터 초과를 응답한 키를 오늘 하루 사용 중지 처리합니다."""
+        if not self.enabled or not self._provider_config(provider):
+            return
+
+        self.logger.warning(f"🚫 [{provider}] 서비스 키 쿼터 소진 처리: {self._mask(key)}")
+        self._collection('quota').update_one(
+            {'_id': self._quota_id(provider, key)},
+            {'$set': {'exhausted': True, 'updated_at': datetime.now()}},
+            upsert=True
+        )
+
+    def _try_acquire(self, provider: str, default_key: Optional[str]) -> Tuple[Optional[str], float]:
+        cfg = self._provider_config(provider)
+        if not self.enabled or not cfg:
+            return default_key, 0
+
+        keys = self.keys(provider, default_key)
+        if not keys:
+            return default_key, 0
+
+        rate = float(cfg.get('rate', 10))
+        burst = float(cfg.get('burst', rate))
+        now = time.time()
+
+        # 1. 토큰 버킷 리필 + 차감 (원자적 파이프라인 업데이트)
+        slow = {'$cond': [{'$gt': [{'$ifNull': ['$penalty_until', 0]}, now]},
+                          {'$ifNull': ['$slow_factor', 1]}, 1]}
+        bucket = self._collection('bucket').find_one_and_update(
+            {'_id': provider},
+            [
+                {'$set': {
+                    'effective_rate': {'$multiply': [rate, slow]},
+                }},
+                {'$set': {
+                    'tokens': {'$min': [burst, {'$add': [
+                        {'$ifNull': ['$tokens', burst]},
+                        {'$multiply': [{'$subtract': [now, {'$ifNull': ['$ts', now]}]}, '$effective_rate']}
+                    ]}]},
+                    'ts': now,
+                }},
+                {'$set': {'granted': {'$gte': ['$tokens', 1]}}},
+                {'$set': {
+                    'tokens': {'$cond': ['$granted', {'$subtract': ['$tokens', 1]}, '$tokens']},
+                    'rr': {'$cond': ['$granted', {'$add': [{'$ifNull': ['$rr', 0]}, 1]}, {'$ifNull': ['$rr', 0]}]},
+                }},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+        if not bucket.get('granted'):
+            effective_rate = max(float(bucket.get('effective_rate') or rate), 0.01)
+            return None, max((1 - float(bucket.get('tokens', 0))) / effective_rate, 0.01)
+
+        # 2. 라운드로빈으로 쿼터가 남은 키 선택
+        daily_quota = int(cfg.get('daily_quota', 0))
+        start = int(bucket.get('rr', 0))
+        for offset in range(len(keys)):
+            key = keys[(start + offset) % len(keys)]
+            if self._consume_quota(provider, key, daily_quota):
+                return key, 0
+
+        raise QuotaExceededError(f"[{provider}] 모든 서비스 키의 일일 쿼터가 소진되었습니다.")
+
+    def _consume_quota(self, provider: str, key: str, daily_quota: int) -> bool:
+        """키의 오늘 사용량을 1 증가시킵니다. 쿼터 초과/사용 중지 상태면 False"""
+        query = {'_id': self._quota_id(provider, key), 'exhausted': {'$ne': True}}
+        if daily_quota > 0:
+            query['count'] = {'$not': {'$gte': daily_quota}}
+
+        try:
+            doc = self._collection('quota').find_one_and_update(
+                query,
+                {
+                    '$inc': {'count': 1},
+                    '$setOnInsert': {'provider': provider, 'date': datetime.now().strftime('%Y-%m-%d')},
+                    '$set': {'updated_at': datetime.now()},
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return doc is not None
+        except DuplicateKeyError:
+            # upsert 시 필터 불일치로 인한 _id 중복 → 이미 쿼터 소진된 키
+            return False
+
+    def _slow_down(self, provider: str):
+        cfg = Config.get('rate_limit.slow_down', {})
+        factor = float(cfg.get('factor', 0.5))
+        min_factor = float(cfg.get('min_factor', 0.1))
+        cooldown = float(cfg.get('cooldown', 60))
+        now = time.time()
+
+        # 페널티 기간 중이면 추가로 감속, 아니면 factor 부터 다시 시작
+        doc = self._collection('bucket').find_one_and_update(
+            {'_id': provider},
+            [{'$set': {
+                'slow_factor': {'$max': [min_factor, {'$cond': [
+                    {'$gt': [{'$ifNull': ['$penalty_until', 0]}, now]},
+                    {'$multiply': [{'$ifNull': ['$slow_factor', 1]}, factor]},
+                    factor
+                ]}]},
+                'penalty_until': now + cooldown,
+            }}],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self.logger.warning(f"🐢 [{provider}] 429/503 감지 → 속도 {doc.get('slow_factor')}배로 {int(cooldown)}초간 감속")
+
+    @staticmethod
+    def _slow_down_status_codes() -> List[int]:
+        return list(Config.get('rate_limit.slow_down.status_codes', [429, 503]))
+
+    @staticmethod
+    def _quota_id(provider: str, key: str) -> str:
+        key_hash = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return f"{provider}:{key_hash}:{datetime.now().strftime('%Y%m%d')}"
+
+    @staticmethod
+    def _mask(key: str) -> str:
+        return f"{key[:4]}****{key[-4:]}" if len(key) > 8 else '****'
+
+
+__all__ = ['RateLimiter', 'QuotaExceededError']
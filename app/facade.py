@@ -6,20 +6,23 @@ DI 컨테이너를 통해 서비스 인스턴스를 가져와 전역적으로 
 
 from app.bootstrap import get_container
 from typing import Tuple
+from app.core.packages.support.modules.checkpoint import Checkpoint
 from app.core.packages.support.modules.command import Command
+from app.core.packages.support.modules.import_manifest import ImportManifest
 from app.core.packages.support.modules.scheduler import Scheduler
 from app.core.packages.support.modules.queue import Queue
+from app.core.packages.support.modules.rate_limiter import RateLimiter
 from app.core.packages.database.manager import Manager
 
 
-def _get_service_facade() -> Tuple[Command, Scheduler, Queue, Manager]:
+def _get_service_facade() -> Tuple[Command, Scheduler, Queue, Manager, RateLimiter, Checkpoint, ImportManifest]:
     """
     DI 컨테이너에서 서비스 인스턴스들을 가져와 Facade 객체를 생성합니다.
 
     컨테이너가 초기화되지 않은 경우 자동으로 부트스트랩을 수행합니다.
 
     Returns:
-        tuple: (command, scheduler, db) 서비스 인스턴스들의 튜플
+        tuple: (command, scheduler, queue, db, rate_limiter, checkpoint, import_manifest) 서비스 인스턴스들의 튜플
     """
     try:
         container = get_container()
@@ -32,17 +35,23 @@ def _get_service_facade() -> Tuple[Command, Scheduler, Queue, Manager]:
         container.support.command(),  # CLI 명령어 처리 서비스
         container.support.scheduler(),  # 스케줄링 작업 관리 서비스
         container.support.queue(),  # 큐 작업 관리 서비스
-        container.database.manager()  # 데이터베이스 관리 서비스
+        container.database.manager(),  # 데이터베이스 관리 서비스
+        container.support.rate_limiter(),  # 외부 API 호출 제한 서비스
+        container.support.checkpoint(),  # 작업 이어하기 지점 저장소
+        container.support.import_manifest()  # 파일 임포트 이력 저장소
     )
 
 
 # 전역 서비스 인스턴스들
 # 애플리케이션 어디서든 import하여 사용할 수 있습니다
-command, scheduler, queue, db = _get_service_facade()
+command, scheduler, queue, db, rate_limiter, checkpoint, import_manifest = _get_service_facade()
 
 # 서비스 인스턴스 설명:
 # - command: CLI 명령어 실행, 메시지 출력, 로깅 등을 담당
 # - scheduler: 백그라운드 작업 스케줄링 및 관리를 담당
 # - db: 데이터베이스 연결, 쿼리 실행, 트랜잭션 관리를 담당
+# - rate_limiter: 외부 API 초당 호출량 / 일일 쿼터 / 서비스 키 로테이션을 담당
+# - checkpoint: 수집/빌드 작업의 이어하기 지점(워터마크) 저장을 담당
+# - import_manifest: 파일 임포트 완료 여부/건수(매니페스트) 기록을 담당
 
-__all__ = ['command', 'db', 'queue', 'scheduler']
\ No newline at end of file
+__all__ = ['checkpoint', 'command', 'db', 'import_manifest', 'queue', 'rate_limiter', 'scheduler']
\ No newline at end of file
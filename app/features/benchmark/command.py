@@ -0,0 +1,164 @@
+import click
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from bson import ObjectId
+
+from app.features.contracts.command import AbstractCommand
+from app.services.contracts.drivers.abstract import AbstractDriver
+from app.services.location.boundary.dto import BoundaryItemDto
+from app.services.location.raw.drivers.abstract_text_driver import AbstractTextDriver
+from app.services.location.raw.drivers.block_address.block_address_text_driver import BlockAddressTextDriver
+from app.services.location.raw.drivers.building_group.building_group_text_driver import BuildingGroupTextDriver
+from app.services.location.raw.drivers.road_address.road_address_text_driver import RoadAddressTextDriver
+from app.services.location.raw.drivers.road_code.road_code_text_driver import RoadCodeTextDriver
+
+
+class _PaginationBenchmarkDriver(AbstractDriver):
+    """DB 조회 없이 build_pagination(행 변환 + 페이징 객체 생성) 비용만 측정하기 위한 드라이버"""
+
+    def __init__(self, item_type: Type[Any]):
+        self.item_type = item_type
+
+
+class BenchmarkCommand(AbstractCommand):
+    """
+    성능 비교용 벤치마크 명령어 (DB/외부 API 없이 합성 데이터로 측정)
+
+    - benchmark:pagination : item_mode(validate / construct / raw)별 build_pagination 행당 처리 시간
+    - benchmark:juso_parser : 주소DB 텍스트 파서(line / arrow)별 초당 처리 행 수
+    """
+
+    # 주소DB 텍스트 드라이버 (데이터셋 이름 → 드라이버 클래스)
+    JUSO_DRIVERS: Dict[str, Type[AbstractTextDriver]] = {
+        'road_code': RoadCodeTextDriver,
+        'road_address': RoadAddressTextDriver,
+        'block_address': BlockAddressTextDriver,
+        'building_group': BuildingGroupTextDriver,
+    }
+
+    @staticmethod
+    def _boundary_rows(count: int) -> List[Dict[str, Any]]:
+        """MongoDB 에서 읽은 것과 같은 형태의 경계 문서 (_id 는 ObjectId)"""
+        now = datetime.now()
+        codes = [f"{11110101 + i % 1000:08d}" for i in range(count)]
+        return [{
+            '_id': ObjectId(),
+            'item_code': codes[i],
+            'item_name': f"법정동{i}",
+            'item_full_name': f"서울특별시 종로구 법정동{i}",
+            'location_type': 'township',
+            'state_code': '11',
+            'district_code': '11110',
+            'township_code': codes[i],
+            'jurisdiction_type': 'legal',
+            'bbox': [126.97, 37.57, 126.99, 37.59],
+            'geo_point': {'type': 'Point', 'coordinates': [126.98, 37.58]},
+            'created_at': now,
+            'updated_at': now,
+        } for i in range(count)]
+
+    @staticmethod
+    def _measure(item_type: Type[Any], rows: List[Dict[str, Any]], mode: str, repeat: int) -> float:
+        """repeat 회 중 가장 빠른 실행의 행당 처리 시간(µs)"""
+        driver = _PaginationBenchmarkDriver(item_type)
+        best = float('inf')
+
+        for _ in range(repeat):
+            # 변환 과정에서 행이 바뀌지 않도록 측정 밖에서 복사합니다.
+            batch = [dict(row) for row in rows]
+            driver.clear().set_arguments({'item_mode': mode}).set_pagination(1, len(batch))
+
+            started = time.perf_counter()
+            driver.build_pagination(batch, None)
+            best = min(best, time.perf_counter() - started)
+
+        return best / max(1, len(rows)) * 1_000_000
+
+    def pagination_handle(self, rows: int = 10000, repeat: int = 5):
+        self.message(f"📏 build_pagination 벤치마크 ({rows}건 x {repeat}회, 최솟값 기준)", fg='green')
+
+        samples = self._boundary_rows(rows)
+        for label, item_type in (('BoundaryItemDto', BoundaryItemDto), ('dict', dict)):
+            baseline = None
+            for mode in AbstractDriver.ITEM_MODES:
+                per_row = self._measure(item_type, samples, mode, repeat)
+                baseline = baseline or per_row
+                self.message(
+                    f"  {label:<16} {mode:<10} {per_row:8.2f} µs/row  "
+                    f"({per_row * rows / 1000:8.1f} ms/page, x{baseline / per_row:.1f})",
+                    fg='white'
+                )
+
+    @staticmethod
+    def _write_juso_file(driver: AbstractTextDriver, file_path: str, rows: int):
+        """드라이버 컬럼 레이아웃에 맞춘 합성 주소DB 파일 (cp949)"""
+        with open(file_path, 'w', encoding='cp949') as f:
+            for i in range(rows):
+                values = [
+                    f"서울특별시 종로구 세종대로{i % 300}" if column.endswith(('_nm', '_addr')) else str(i)
+                    for column in driver.COLUMNS
+                ]
+                f.write('|'.join(values) + '\n')
+
+    @staticmethod
+    def _first_chunk(driver: AbstractTextDriver, file_path: str, parser: str) -> List[dict]:
+        chunks = driver.iter_chunks(file_path, parser=parser)
+        try:
+            return next(chunks, [])
+        finally:
+            chunks.close()
+
+    @staticmethod
+    def _measure_parser(driver: AbstractTextDriver, file_path: str, parser: str, repeat: int) -> Tuple[float, int]:
+        """repeat 회 중 가장 빠른 실행의 소요 시간(초)과 파싱된 문서 수"""
+        best, count = float('inf'), 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            count = sum(len(chunk) for chunk in driver.iter_chunks(file_path, parser=parser))
+            best = min(best, time.perf_counter() - started)
+        return best, count
+
+    def juso_parser_handle(self, dataset: Optional[str] = None, rows: int = 200000, repeat: int = 3):
+        self.message(f"📏 주소DB 텍스트 파서 벤치마크 ({rows}건 x {repeat}회, 최솟값 기준)", fg='green')
+
+        targets = {name: driver for name, driver in self.JUSO_DRIVERS.items() if not dataset or name == dataset}
+        with tempfile.TemporaryDirectory() as directory:
+            for name, driver_class in targets.items():
+                driver = driver_class()
+                file_path = os.path.join(directory, f"{driver.file_prefix}benchmark.txt")
+                self._write_juso_file(driver, file_path, rows)
+
+                baseline = None
+                for parser in AbstractTextDriver.PARSERS:
+                    elapsed, count = self._measure_parser(driver, file_path, parser, repeat)
+                    baseline = baseline or elapsed
+                    self.message(
+                        f"  {name:<16} {parser:<6} {count / elapsed:>12,.0f} rows/s  "
+                        f"({elapsed * 1000:8.1f} ms, {count}건, x{baseline / elapsed:.1f})",
+                        fg='white'
+                    )
+
+                # 두 파서가 같은 문서를 만드는지 첫 청크로 확인합니다.
+                same = self._first_chunk(driver, file_path, 'line') == self._first_chunk(driver, file_path, 'arrow')
+                self.message(f"  {name:<16} 결과 일치: {'✅' if same else '❌'}", fg='green' if same else 'red')
+
+    def register_commands(self, cli_group):
+        @cli_group.command('benchmark:pagination', help='item_mode 별 build_pagination 행당 처리 시간 비교')
+        @click.option('--rows', default=10000, type=int, help='페이지당 행 수')
+        @click.option('--repeat', default=5, type=int, help='반복 횟수 (최솟값 사용)')
+        def benchmark_pagination(rows, repeat):
+            self.pagination_handle(rows, repeat)
+
+        @cli_group.command('benchmark:juso_parser', help='주소DB 텍스트 파서(line / arrow) 처리 속도 비교')
+        @click.option('--dataset', default=None, type=click.Choice(list(self.JUSO_DRIVERS)), help='특정 데이터셋만 측정')
+        @click.option('--rows', default=200000, type=int, help='합성 파일 행 수')
+        @click.option('--repeat', default=3, type=int, help='반복 횟수 (최솟값 사용)')
+        def benchmark_juso_parser(dataset, rows, repeat):
+            self.juso_parser_handle(dataset, rows, repeat)
+
+
+__all__ = ['BenchmarkCommand']
@@ -1,34 +1,36 @@
-import ast
-import os
-import re
 import click
 import time
-from multiprocessing import Process
+from multiprocessing import Pool
 from datetime import datetime, timedelta
 from typing import Optional, List, Any, Dict
 
 from app.services.building.raw import facade as raw_facade
+from app.services.building.raw.crawler import DgkCrawlEngine
 from app.services.building.raw.services.abstract_service import AbstractService
 from app.services.location.boundary import facade as boundary_facade
+from app.features.building.raw.job import BuildingRawShardJob
 from app.features.contracts.command import AbstractCommand
+from app.core.helpers.config import Config
+from app.facade import queue
 
 
 class BuildingRawCommand(AbstractCommand):
 
     def sync_building_registers_by_township(self, service: AbstractService, is_continue: bool = False,
-                                            is_renew: bool = False):
+                                            is_renew: bool = False, concurrency: Optional[int] = None):
         """
         DB에 저장된 모든 법정동(Township) 목록을 순회하며 갱신합니다.
+        concurrency 가 1보다 크면 비동기 크롤 엔진(DgkCrawlEngine)으로 동시 수집합니다.
         """
         self._send_slack(f"🚀 [{service.logger_name}] 수집 프로세스 구동")
 
         try:
-            current_township_page = 1
-            per_page = 100
+            concurrency = int(concurrency or Config.get('dgk.concurrency', 8))
             total_synced_townships = 0
 
             # 이어하기 지점 파악
             start_item_code = None
+            start_page = 1
             if is_continue:
                 # renew 옵션이 있으면 7일 기준 적용, 없으면 무조건 이어하기
                 renew_threshold = 7 if is_renew else 9999
@@ -37,49 +39,47 @@ class BuildingRawCommand(AbstractCommand):
                 if last_point:
                     # sigunguCd(5) + bjdongCd(앞3) 조합으로 8자리 item_code 생성
                     start_item_code = f"{last_point['sigunguCd']}{last_point['bjdongCd'][:3]}"
-                    self.message(f"🔄 이어하기 모드: {start_item_code} 지점부터 시작합니다.", fg='magenta')
+                    start_page = int(last_point.get('page', 1))
+                    self.message(f"🔄 이어하기 모드: {start_item_code} ({start_page}p) 지점부터 시작합니다.", fg='magenta')
 
             self.message('🚀 전국의 모든 법정동 순회 및 건축물대장 수집을 시작합니다.', fg='green')
 
-            while True:
-                # 1. 법정동 목록 조회 쿼리
-                query_params = {
-                    'location_type': 'township',
-                    'page': current_township_page,
-                    'per_page': per_page
-                }
-
-                # 이어하기 조건 적용 ($gte: Greater than or Equal)
-                if start_item_code:
-                    query_params['item_code'] = {'$gte': start_item_code}
-
-                township_pagination = boundary_facade.service.get_boundaries(
-                    params=query_params,
-                    driver_name='mongodb'
+            if concurrency > 1:
+                self.message(f'⚡ 비동기 크롤 엔진으로 수집합니다. (동시 요청: {concurrency})', fg='green')
+
+                engine = DgkCrawlEngine(
+                    service,
+                    concurrency=concurrency,
+                    on_township_done=lambda township, count: self.message(
+                        f"📦 [{township['name']}] {count}건 완료", fg='cyan'
+                    ),
+                    # 아직 끝나지 않은 가장 앞선 법정동을 체크포인트로 저장
+                    on_watermark=lambda point: self._save_sync_point(service, point),
                 )
+                stats = engine.run(self._iter_townships(start_item_code))
+                total_synced_townships = stats['townships']
 
-                items = getattr(township_pagination, 'items', [])
-
-                if not items:
-                    self.message(f"--- 더 이상 가져올 법정동 데이터가 없습니다. (Page: {current_township_page}) ---", fg='yellow')
-                    break
-
-                for township in items:
-                    full_code = township.item_code
-                    sigungu_cd = full_code[:5]
-                    bjdong_cd = f"{full_code[5:8]}00"
+                self.message(
+                    f"📊 신규 {stats['inserted']}건 / 변경 {stats['changed']}건 / 변경없음 {stats['unchanged']}건",
+                    fg='blue'
+                )
 
-                    self.message(f"📦 [{township.item_full_name}] 수집 시작...", fg='cyan')
-                    self._sync_all_pages_for_township(service, sigungu_cd, bjdong_cd)
+                if stats['errors']:
+                    self.message(f"⚠️ 실패 {stats['errors']}건 발생 (--continue 로 재개 가능)", fg='yellow')
+            else:
+                for township in self._iter_townships(start_item_code):
+                    self.message(f"📦 [{township['name']}] 수집 시작...", fg='cyan')
+                    self._sync_all_pages_for_township(
+                        service, township['sigunguCd'], township['bjdongCd'], start_page=start_page
+                    )
+                    start_page = 1
                     total_synced_townships += 1
 
-                items_count = len(items)
-                self.message(f"--- 법정동 목록 {current_township_page} 페이지 완료 ({items_count}개 처리) ---", fg='yellow')
-
-                if items_count < per_page:
-                    break
+                stats = {'errors': 0}
 
-                current_township_page += 1
+            # 실패 없이 끝까지 완료한 경우에만 체크포인트를 비웁니다.
+            if not stats['errors']:
+                self._clear_sync_point(service)
 
             self.message(f'✅ 전체 {total_synced_townships}개 법정동 수집 완료!', fg='blue')
             self._send_slack(f"✅ [{service.logger_name}] 완료 (총 {total_synced_townships}개 법정동)")
@@ -87,39 +87,124 @@ class BuildingRawCommand(AbstractCommand):
         except Exception as e:
             self._handle_error(e, f"일괄 수집 프로세스 중단 @see {__file__}")
 
-    def _sync_all_pages_for_township(self, service: AbstractService, sigungu_cd: str, bjdong_cd: str):
-        """특정 법정동의 데이터를 마지막 페이지까지 강제로 순회하며 가져옵니다."""
-        current_page = 1
-        per_page = 100
+    def dispatch_building_registers_by_township(self, service: AbstractService, shard_size: Optional[int] = None,
+                                                concurrency: Optional[int] = None, wait: bool = False) -> List[Any]:
+        """
+        법정동 목록을 샤드로 나누어 Celery 큐로 발행합니다. (여러 워커 컨테이너로 수평 확장)
+        wait 이면 결과 백엔드에서 샤드 결과를 모아 전체 통계를 출력합니다.
+        """
+        service_name = BuildingRawShardJob.service_name(service)
+        shard_size = int(shard_size or Config.get('queue.township_shard_size', 200))
 
-        while True:
-            sync_result = service.sync_from_dgk({
-                'sigunguCd': sigungu_cd,
-                'bjdongCd': bjdong_cd,
-                'page': current_page,
-                'per_page': per_page
-            })
+        self._send_slack(f"🚀 [{service.logger_name}] 분산 수집 발행")
 
-            # 에러 발생 시 중단 (AbstractService에서 status='error' 반환 가정)
-            if sync_result.get('status') == 'error':
-                break
+        try:
+            results = []
+            townships = []
+
+            def dispatch_shard():
+                results.append(queue.dispatch(
+                    BuildingRawShardJob,
+                    service=service_name,
+                    townships=townships,
+                    shard=len(results),
+                    concurrency=concurrency,
+                    replay=BuildingRawShardJob.is_replay()
+                ))
+
+            for township in self._iter_townships():
+                townships.append(township)
+                if len(townships) >= shard_size:
+                    dispatch_shard()
+                    townships = []
+
+            if townships:
+                dispatch_shard()
+
+            dispatched = len([r for r in results if r is not None])
+            self.message(
+                f"📤 [{service.logger_name}] {dispatched}/{len(results)}개 샤드 발행 완료 (샤드당 {shard_size}개 법정동)",
+                fg='green'
+            )
+
+            if wait:
+                self._report_distributed(service.logger_name, results)
+
+            return results
 
-            items_count = sync_result.get('count', 0)
+        except Exception as e:
+            self._handle_error(e, f"분산 수집 발행 중단 @see {__file__}")
+
+    def _report_distributed(self, label: str, results: List[Any]):
+        """발행한 샤드 결과를 모아 전체 통계를 출력합니다."""
+        totals = self._gather_jobs(results, f"[{label}]")
+        self.message(
+            f"📊 [{label}] 법정동 {totals.get('townships', 0)}개 / 신규 {totals.get('inserted', 0)}건 / "
+            f"변경 {totals.get('changed', 0)}건 / 변경없음 {totals.get('unchanged', 0)}건 / "
+            f"실패 {totals.get('errors', 0)}건 / 실패 샤드 {totals['failed_shards']}개",
+            fg='blue'
+        )
+        self._send_slack(f"✅ [{label}] 분산 수집 완료 (총 {totals.get('townships', 0)}개 법정동)")
+
+    def _iter_townships(self, start_item_code: Optional[str] = None):
+        """법정동 목록을 하나의 커서로 item_code 순 조회하여 수집 파라미터 형태로 하나씩 반환합니다."""
+        # 1. 법정동 목록 조회 조건 (이어하기 워터마크와 같은 item_code 오름차순)
+        query_params = {
+            'location_type': 'township',
+            'sort': [('item_code', 1)],
+            # 법정동 코드/이름만 사용하므로 폴리곤 등은 조회하지 않습니다.
+            'fields': ['item_code', 'item_full_name'],
+            # 직접 적재한 경계 데이터이므로 DTO 검증을 생략합니다.
+            'item_mode': 'construct'
+        }
+
+        # 이어하기 조건 적용 ($gte: Greater than or Equal)
+        if start_item_code:
+            query_params['item_code'] = {'$gte': start_item_code}
+
+        total_count = 0
+        for items in boundary_facade.service.iterate_boundaries(query_params, batch_size=1000):
+            for township in items:
+                full_code = township.item_code
+                yield {
+                    'sigunguCd': full_code[:5],
+                    'bjdongCd': f"{full_code[5:8]}00",
+                    'name': township.item_full_name,
+                }
 
-            if items_count > 0:
-                self.message(f"  -> {current_page}p: {items_count}건 완료", fg='white')
+            total_count += len(items)
+            self.message(f"--- 법정동 목록 {total_count}개 조회 ---", fg='yellow')
 
-            # 탈출 조건
-            if items_count == 0 or items_count < per_page or current_page >= 100:
-                break
+        self.message(f"--- 더 이상 가져올 법정동 데이터가 없습니다. (총 {total_count}개) ---", fg='yellow')
 
-            current_page += 1
+    def _sync_all_pages_for_township(self, service: AbstractService, sigungu_cd: str, bjdong_cd: str,
+                                     start_page: int = 1):
+        """특정 법정동의 데이터를 totalCount 기준으로 마지막 페이지까지 가져옵니다."""
 
-    def handle_sync_all(self, is_continue: bool, is_renew: bool):
-        """
-        스케줄러와 CLI 양쪽에서 호출할 수 있는 공통 실행 메서드
-        """
-        services = [
+        def on_page(page: int, items_count: int):
+            # 페이지 저장(커밋) 직후 다음 페이지를 이어하기 지점으로 기록
+            self._save_sync_point(service, {'sigunguCd': sigungu_cd, 'bjdongCd': bjdong_cd, 'page': page + 1})
+            if items_count > 0:
+                self.message(f"  -> {page}p: {items_count}건 완료", fg='white')
+
+        sync_result = service.sync_all_pages_from_dgk(
+            {'sigunguCd': sigungu_cd, 'bjdongCd': bjdong_cd},
+            per_page=100,
+            start_page=start_page,
+            on_page=on_page
+        )
+
+        if sync_result.get('count'):
+            self.message(
+                f"  📊 신규 {sync_result['inserted']}건 / 변경 {sync_result['changed']}건 / "
+                f"변경없음 {sync_result['unchanged']}건",
+                fg='white'
+            )
+
+    @staticmethod
+    def _register_services() -> List[tuple]:
+        """법정동 단위로 수집하는 건축물대장 9종 서비스"""
+        return [
             (raw_facade.group_info_service, "총괄표제부"),
             (raw_facade.title_info_service, "표제부"),
             (raw_facade.basic_info_service, "기본정보"),
@@ -131,34 +216,142 @@ class BuildingRawCommand(AbstractCommand):
             (raw_facade.zone_info_service, "지역지구"),
         ]
 
-        self.message(f'🔥 전체 데이터 병렬 수집 시작 (Continue={is_continue}, Renew={is_renew})', fg='green')
-        self._send_slack(f"🔥 전체 수집 대장정 시작 (Continue={is_continue})")
+    def dispatch_sync_all(self, shard_size: Optional[int] = None, wait: bool = False):
+        """9종 건축물대장 전체를 법정동 샤드로 나누어 큐로 발행합니다."""
+        self._send_slack("🔥 전체 수집 분산 발행 시작")
 
-        chunk_size = 3
-        for i in range(0, len(services), chunk_size):
-            current_chunk = services[i:i + chunk_size]
-            processes = []
+        dispatched = [
+            (service_obj, self.dispatch_building_registers_by_township(service_obj, shard_size))
+            for service_obj, _ in self._register_services()
+        ]
 
-            for service_obj, service_name in current_chunk:
-                self.message(f"🚀 [병렬 시작] {service_name} 프로세스 구동", fg='cyan')
-                p = Process(
-                    target=self.sync_building_registers_by_township,
-                    args=(service_obj, is_continue, is_renew)
-                )
-                p.start()
-                processes.append(p)
+        if wait:
+            for service_obj, results in dispatched:
+                self._report_distributed(service_obj.logger_name, results or [])
+
+    @staticmethod
+    def _worker_sync_township_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """워커 풀에서 실행될 (서비스, 법정동) 단위 수집 태스크"""
+        service_key = payload['service']
+        township = payload['township']
+        result = {'service': service_key, 'index': payload['index'], 'name': township['name']}
+
+        try:
+            sync_result = getattr(raw_facade, service_key).sync_all_pages_from_dgk(
+                {'sigunguCd': township['sigunguCd'], 'bjdongCd': township['bjdongCd']},
+                per_page=100
+            )
+            return {
+                **result,
+                'success': True,
+                **{key: sync_result.get(key, 0) for key in ('count', 'inserted', 'changed', 'unchanged')}
+            }
+        except Exception as e:
+            return {**result, 'success': False, 'error': str(e)}
 
-            for p in processes:
-                p.join()
+    def handle_sync_all(self, is_continue: bool, is_renew: bool, workers: Optional[int] = None):
+        """
+        스케줄러와 CLI 양쪽에서 호출할 수 있는 공통 실행 메서드
 
-            self.message(f"✅ 그룹 수집 완료. 다음으로 이동합니다.", fg='yellow')
+        9종 서비스를 (서비스, 법정동) 단위 작업으로 나누어 하나의 작업 큐에 넣고,
+        워커 풀이 끝나는 대로 다음 작업을 가져가도록 하여 느린 서비스(층정보 등) 때문에 코어가 놀지 않게 합니다.
+        서비스별로 '아직 끝나지 않은 가장 앞선 법정동'을 체크포인트로 저장하므로 개별 커맨드의 --continue 와 호환됩니다.
+        """
+        services = [
+            (BuildingRawShardJob.service_name(service_obj), service_obj, service_name)
+            for service_obj, service_name in self._register_services()
+        ]
+        workers = int(workers or Config.get('dgk.sync_workers', 6))
 
-        self.message('🏁 모든 데이터 수집 대장정 완료!', fg='blue')
-        self._send_slack("🏁 건축물대장 모든 데이터 수집 대장정 완료")
+        self.message(
+            f'🔥 전체 데이터 병렬 수집 시작 (Continue={is_continue}, Renew={is_renew}, Workers={workers})',
+            fg='green'
+        )
+        self._send_slack(f"🔥 전체 수집 대장정 시작 (Continue={is_continue})")
+
+        try:
+            # 1. 서비스별 이어하기 지점 (item_code 8자리)
+            start_codes: Dict[str, str] = {}
+            if is_continue:
+                renew_threshold = 7 if is_renew else 9999
+                for key, service_obj, _ in services:
+                    last_point = self._get_last_sync_point(service_obj, renew_days=renew_threshold)
+                    if last_point:
+                        start_codes[key] = f"{last_point['sigunguCd']}{last_point['bjdongCd'][:3]}"
+
+            # 모든 서비스에 이어하기 지점이 있으면 가장 앞선 지점부터만 법정동을 조회
+            min_start_code = min(start_codes.values()) if len(start_codes) == len(services) else None
+            townships = list(self._iter_townships(min_start_code))
+
+            # 2. (서비스, 법정동) 작업 목록 구성 - 법정동 순으로 9종 서비스를 교차 배치
+            done = {key: [False] * len(townships) for key, _, _ in services}
+            tasks = []
+            for index, township in enumerate(townships):
+                item_code = f"{township['sigunguCd']}{township['bjdongCd'][:3]}"
+                for key, _, _ in services:
+                    if key in start_codes and item_code < start_codes[key]:
+                        done[key][index] = True
+                        continue
+                    tasks.append({'service': key, 'index': index, 'township': township})
+
+            self.message(f"📋 작업 {len(tasks)}개 (법정동 {len(townships)}개 x 서비스 {len(services)}종)", fg='cyan')
+
+            # 3. 워커 풀 실행 (먼저 끝난 워커가 다음 작업을 가져감)
+            service_map = {key: (service_obj, service_name) for key, service_obj, service_name in services}
+            watermarks = {key: 0 for key in service_map}
+            errors = {key: 0 for key in service_map}
+            stats = {'count': 0, 'inserted': 0, 'changed': 0, 'unchanged': 0}
+            completed = 0
+
+            with Pool(processes=workers) as pool:
+                for result in pool.imap_unordered(self._worker_sync_township_task, tasks):
+                    key, index = result['service'], result['index']
+                    service_obj, service_name = service_map[key]
+                    completed += 1
+
+                    if result['success']:
+                        done[key][index] = True
+                        for stat_key in stats:
+                            stats[stat_key] += result.get(stat_key, 0)
+                    else:
+                        # 실패한 법정동은 워터마크를 붙잡아 두어 --continue 시 다시 수집되도록 합니다.
+                        errors[key] += 1
+                        self.message(f"❌ [{service_name}] {result['name']} 실패: {result['error']}", fg='red')
+
+                    # 서비스별 워터마크 전진 및 체크포인트 저장
+                    moved = False
+                    while watermarks[key] < len(townships) and done[key][watermarks[key]]:
+                        watermarks[key] += 1
+                        moved = True
+                    if moved and watermarks[key] < len(townships):
+                        township = townships[watermarks[key]]
+                        self._save_sync_point(service_obj, {
+                            'sigunguCd': township['sigunguCd'], 'bjdongCd': township['bjdongCd'], 'page': 1
+                        })
+
+                    if completed % 100 == 0 or completed == len(tasks):
+                        self.message(f"  -> {completed}/{len(tasks)} 작업 완료 ({service_name} {result['name']})", fg='white')
+
+            # 4. 실패 없이 완료한 서비스만 체크포인트를 비웁니다.
+            for key, (service_obj, service_name) in service_map.items():
+                if errors[key]:
+                    self.message(f"⚠️ [{service_name}] 실패 {errors[key]}건 (--continue 로 재개 가능)", fg='yellow')
+                else:
+                    self._clear_sync_point(service_obj)
+
+            self.message(
+                f"📊 신규 {stats['inserted']}건 / 변경 {stats['changed']}건 / 변경없음 {stats['unchanged']}건",
+                fg='blue'
+            )
+            self.message('🏁 모든 데이터 수집 대장정 완료!', fg='blue')
+            self._send_slack("🏁 건축물대장 모든 데이터 수집 대장정 완료")
+
+        except Exception as e:
+            self._handle_error(e, f"전체 수집 프로세스 중단 @see {__file__}")
 
     def handle_kapt_list(self, is_continue: bool = False, is_renew: bool = False):
         """
-        K-APT 단지 목록을 페이지 단위로 강제 순회하며 수집합니다.
+        K-APT 단지 목록을 totalCount 기준으로 전체 페이지를 계산하여 수집합니다.
         법정동 조회 없이 순수 페이지네이션으로 동작합니다.
         """
         service = raw_facade.kapt_list_service
@@ -169,7 +362,7 @@ class BuildingRawCommand(AbstractCommand):
             per_page = 1000
             total_count = 0
 
-            # 1. 이어하기 로직 (로그에서 마지막 처리된 페이지 추출)
+            # 1. 이어하기 로직 (체크포인트에서 마지막으로 커밋된 다음 페이지 추출)
             if is_continue:
                 renew_threshold = 7 if is_renew else 9999
                 last_point = self._get_last_sync_point(service, renew_days=renew_threshold)
@@ -180,104 +373,102 @@ class BuildingRawCommand(AbstractCommand):
 
             self.message(f'🏢 K-APT 모든 단지 목록 수집을 시작합니다. (Start Page: {current_page})', fg='green')
 
-            while True:
-                # 2. API 호출 (page, numOfRows)
-                # AbstractService의 sync_from_dgk가 내부적으로 API를 쏘고 결과를 저장한다고 가정
-                sync_result = service.sync_from_dgk({
-                    'page': current_page,
-                    'per_page': per_page
-                })
-
-                if sync_result.get('status') == 'error':
-                    self.message(f"❌ {current_page}페이지에서 에러 발생", fg='red')
-                    break
-
-                items_count = sync_result.get('count', 0)
-                total_count += items_count
-
+            # 2. 1페이지의 totalCount 로 전체 페이지를 계산하여 나머지 페이지를 동시에 수집
+            def on_page(page: int, items_count: int):
+                self._save_sync_point(service, {'page': page + 1, 'per_page': per_page})
                 if items_count > 0:
-                    self.message(f"  -> {current_page}p: {items_count}건 수집 완료 (누적: {total_count})", fg='white')
-
-                # 3. 탈출 조건 (더 이상 데이터가 없거나 마지막 페이지인 경우)
-                if items_count == 0 or items_count < per_page:
-                    self.message(f"🏁 수집 종료: 마지막 페이지에 도달했습니다. ({current_page}p)", fg='blue')
-                    break
-
-                # 4. 안전장치 (무한 루프 방지)
-                if current_page > 5000:  # 적정 최대 페이지 설정
-                    break
-
-                current_page += 1
+                    self.message(f"  -> {page}p: {items_count}건 수집 완료", fg='white')
+
+            sync_result = service.sync_all_pages_from_dgk(
+                {},
+                per_page=per_page,
+                start_page=current_page,
+                on_page=on_page
+            )
+            total_count = sync_result.get('count', 0)
+
+            self._clear_sync_point(service)
+            self.message(f"🏁 수집 종료: 총 {sync_result.get('pages', 0)}페이지 / {total_count}건", fg='blue')
+            self.message(
+                f"📊 신규 {sync_result['inserted']}건 / 변경 {sync_result['changed']}건 / "
+                f"변경없음 {sync_result['unchanged']}건",
+                fg='blue'
+            )
 
             self._send_slack(f"✅ [{service.logger_name}] 완료 (총 {total_count}개 단지)")
 
         except Exception as e:
             self._handle_error(e, f"K-APT 리스트 수집 프로세스 중단 @see {__file__}")
 
-    def handle_kapt_children(self, is_continue: bool, is_renew: bool, service: AbstractService):
+    def handle_kapt_children(self, is_continue: bool, is_renew: bool, service: AbstractService,
+                             concurrency: Optional[int] = None):
         """
         K-APT 리스트를 순회하며 상세 수집 여부 플래그(detail/basic)를 체크하여 수집합니다.
         성공 시 마스터 리스트(kapt_list)에 해당 플래그를 true로 업데이트합니다.
+
+        배치마다 _id 키셋 조회 1회 → K-APT API 동시 호출 → 자식 문서 bulk upsert 1회 → 플래그 update_many 1회로 처리합니다.
         """
         self._send_slack(f"🚀 [{service.logger_name}] 데이터 동기화 시작")
 
         try:
-            current_page = 1
-            per_page = 100
+            per_page = 500
             total_count = 0
+            failed_count = 0
+            last_id = None
 
             # 기준 날짜 설정 (7일 전)
             role_date = datetime.now() - timedelta(days=7)
 
             # 서비스에 따른 플래그 필드명 결정
             target_flag_field = 'basic' if service == raw_facade.kapt_basic_service else 'detail'
+            list_driver = raw_facade.kapt_list_service.manager.driver('mongodb')
 
             self.message(f'🏢 [{service.logger_name}] 플래그 기반 수집을 시작합니다.', fg='green')
 
             while True:
-                # 1. 쿼리 구성 (해당 플래그가 true가 아니거나, 업데이트된 지 7일 지난 것)
+                # 1. 클레임 쿼리 (해당 플래그가 true가 아니거나, 업데이트된 지 7일 지난 것)
+                # _id 키셋으로 앞으로만 진행하므로 실패한 단지 때문에 같은 페이지를 반복 조회하지 않습니다.
                 query_params = {
-                    'page': current_page,
+                    'page': 1,
                     'per_page': per_page,
                     '$or': [
                         {target_flag_field: {'$ne': True}},  # true가 아닌 모든 경우 (None, False, 존재하지 않음)
                         {'updated_at': {'$lt': role_date}}  # 갱신 주기가 도래한 것
                     ],
-                    'sort': [('_id', 1)]
+                    'sort': [('_id', 1)],
+                    'count': 'none',
+                    'item_mode': 'raw'
                 }
+                if last_id is not None:
+                    query_params['_id'] = {'$gt': last_id}
 
-                # 마스터 목록 페이징 호출
                 pagination = raw_facade.kapt_list_service.get_list(query_params, driver_name='mongodb')
                 items = getattr(pagination, 'items', [])
 
                 if not items:
                     break
 
-                for item in items:
-                    kapt_code = item.get('kaptCode')
-                    if not kapt_code:
-                        continue
+                last_id = items[-1]['_id']
+                kapt_codes = [item.get('kaptCode') for item in items if item.get('kaptCode')]
 
-                    # 2. API 호출 및 저장 (기존 sync_from_dgk 로직)
-                    sync_result = service.sync_from_dgk({'kaptCode': kapt_code})
+                # 2. API 동시 호출 + 자식 문서 일괄 저장
+                sync_result = service.sync_batch_from_dgk([{'kaptCode': code} for code in kapt_codes], concurrency)
 
-                    # 3. 수집 성공 시 마스터 리스트(kapt_list)의 플래그를 true로 갱신
-                    if sync_result.get('status') == 'success':
-                        item[target_flag_field] = True
-                        item['updated_at'] = datetime.now()
+                # 3. 수집 성공한 단지의 마스터 리스트(kapt_list) 플래그를 한 번에 true로 갱신
+                succeeded_codes = [params['kaptCode'] for params in sync_result['succeeded']]
+                list_driver.update_by_keys(succeeded_codes, {target_flag_field: True})
 
-                        # 마스터 컬렉션 업데이트
-                        raw_facade.kapt_list_service.manager.driver('mongodb').store([item])
-
-                        total_count += 1
-                        if total_count % 10 == 0:
-                            self.message(f"  -> {total_count}건 처리 완료 ({kapt_code})", fg='white')
+                total_count += len(succeeded_codes)
+                failed_count += len(sync_result['failed'])
+                self.message(
+                    f"  -> {total_count}건 처리 완료 (실패 {failed_count}건, 마지막: {kapt_codes[-1] if kapt_codes else '-'})",
+                    fg='white'
+                )
 
-                # 처리된 데이터는 쿼리 조건에서 빠지므로 계속 1페이지를 호출
                 if len(items) < per_page:
                     break
 
-            self._send_slack(f"✅ [{service.logger_name}] 완료 (총 {total_count}건 처리)")
+            self._send_slack(f"✅ [{service.logger_name}] 완료 (총 {total_count}건 처리, 실패 {failed_count}건)")
 
         except Exception as e:
             self._handle_error(e, f"K-APT 자식 데이터 수집 중단 @see {__file__}")
@@ -285,12 +476,28 @@ class BuildingRawCommand(AbstractCommand):
     def register_commands(self, cli_group):
         """CLI 그룹에 명령어 등록"""
 
+        def distributed_options(func):
+            """법정동 샤드를 Celery 큐로 발행하는 분산 실행 옵션"""
+            func = click.option('--wait', is_flag=True, help='발행 후 모든 샤드 결과를 모아 집계합니다.')(func)
+            func = click.option('--shard-size', type=int, default=None,
+                                help='샤드당 법정동 수 (기본: queue.township_shard_size)')(func)
+            func = click.option('--distributed', is_flag=True,
+                                help='법정동 샤드로 나누어 큐 워커에서 실행합니다. (--continue 미적용)')(func)
+            return func
+
         def create_sync_command(name, service_obj, help_text):
             @cli_group.command(name, help=help_text)
-            @click.option('--continue', 'is_continue', is_flag=True, help='마지막 로그 지점부터 이어서 수집합니다.')
-            @click.option('--renew', 'is_renew', is_flag=True, help='일주일 이상된 로그면 처음부터 수집합니다.')
-            def _command(is_continue, is_renew):
-                self.sync_building_registers_by_township(service_obj, is_continue, is_renew)
+            @click.option('--continue', 'is_continue', is_flag=True, help='마지막 체크포인트부터 이어서 수집합니다.')
+            @click.option('--renew', 'is_renew', is_flag=True, help='일주일 이상된 체크포인트면 처음부터 수집합니다.')
+            @click.option('--concurrency', type=int, default=None,
+                          help='API 동시 요청 수 (기본: dgk.concurrency, 1 이면 순차 수집)')
+            @distributed_options
+            @self.replay_option
+            def _command(is_continue, is_renew, concurrency, distributed, shard_size, wait):
+                if distributed:
+                    self.dispatch_building_registers_by_township(service_obj, shard_size, concurrency, wait)
+                else:
+                    self.sync_building_registers_by_township(service_obj, is_continue, is_renew, concurrency)
 
         # 9개 개별 커맨드 등록
         create_sync_command('building_raw:group_info', raw_facade.group_info_service, '총괄표제부 수집')
@@ -306,27 +513,39 @@ class BuildingRawCommand(AbstractCommand):
         @cli_group.command('building_raw:all')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_all_cli(is_continue, is_renew):
-            # 추출한 공통 메서드 호출
-            self.handle_sync_all(is_continue, is_renew)
+        @click.option('--workers', type=int, default=None,
+                      help='(서비스, 법정동) 작업을 처리할 워커 프로세스 수 (기본: dgk.sync_workers)')
+        @distributed_options
+        @self.replay_option
+        def sync_all_cli(is_continue, is_renew, workers, distributed, shard_size, wait):
+            if distributed:
+                self.dispatch_sync_all(shard_size, wait)
+            else:
+                # 추출한 공통 메서드 호출
+                self.handle_sync_all(is_continue, is_renew, workers)
 
         @cli_group.command('building_raw:kapt_list')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
+        @self.replay_option
         def sync_kapt_list(is_continue, is_renew):
             self.handle_kapt_list(is_continue, is_renew)
 
         @cli_group.command('building_raw:kapt_basic')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_kapt_basic(is_continue, is_renew):
-            self.handle_kapt_children(is_continue, is_renew, service=raw_facade.kapt_basic_service)
+        @click.option('--concurrency', type=int, default=None, help='K-APT API 동시 요청 수 (기본: dgk.concurrency)')
+        @self.replay_option
+        def sync_kapt_basic(is_continue, is_renew, concurrency):
+            self.handle_kapt_children(is_continue, is_renew, service=raw_facade.kapt_basic_service, concurrency=concurrency)
 
         @cli_group.command('building_raw:kapt_detail')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_kapt_basic(is_continue, is_renew):
-            self.handle_kapt_children(is_continue, is_renew, service=raw_facade.kapt_detail_service)
+        @click.option('--concurrency', type=int, default=None, help='K-APT API 동시 요청 수 (기본: dgk.concurrency)')
+        @self.replay_option
+        def sync_kapt_basic(is_continue, is_renew, concurrency):
+            self.handle_kapt_children(is_continue, is_renew, service=raw_facade.kapt_detail_service, concurrency=concurrency)
 
 
 __all__ = ['BuildingRawCommand']
\ No newline at end of file
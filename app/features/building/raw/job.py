@@ -0,0 +1,46 @@
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
+
+from app.services.building.raw import facade as raw_facade
+from app.services.building.raw.crawler import DgkCrawlEngine
+from app.features.contracts.job import AbstractJob
+
+
+class BuildingRawShardJob(AbstractJob):
+    """
+    법정동 샤드 단위 건축물대장 수집 Job
+
+    BuildingRawCommand 의 --distributed 실행 시 법정동 목록을 샤드로 나누어 발행하며,
+    각 워커는 DgkCrawlEngine 으로 샤드를 수집한 뒤 집계용 통계를 반환합니다.
+    """
+
+    def handle(self, service: str, townships: List[Dict[str, Any]], shard: int = 0,
+               concurrency: Optional[int] = None, replay: bool = False) -> Dict[str, Any]:
+        """
+        Args:
+            service: raw_facade 의 서비스 속성명 (예: floor_info_service)
+            townships: {'sigunguCd', 'bjdongCd', 'name'} 목록
+            shard: 샤드 번호 (로그/집계용)
+            concurrency: 워커 내 API 동시 요청 수
+            replay: 원본 응답 캐시만으로 재처리 (발행측 --replay)
+        """
+        service_obj = getattr(raw_facade, service)
+        self.message(f"📦 [{service_obj.logger_name}] 샤드 #{shard} 수집 시작 ({len(townships)}개 법정동)")
+
+        engine = DgkCrawlEngine(service_obj, concurrency=concurrency)
+        with self.replay_mode(replay):
+            stats = engine.run(townships)
+
+        self.message(f"✅ [{service_obj.logger_name}] 샤드 #{shard} 완료: {stats}")
+        return {'shard': shard, 'service': service, **stats}
+
+    @staticmethod
+    def service_name(service) -> str:
+        """서비스 인스턴스에 해당하는 raw_facade 속성명을 반환합니다. (payload 직렬화용)"""
+        for field in fields(raw_facade):
+            if getattr(raw_facade, field.name) is service:
+                return field.name
+        raise ValueError(f"raw_facade 에 등록되지 않은 서비스입니다: {service}")
+
+
+__all__ = ['BuildingRawShardJob']
@@ -1,18 +1,40 @@
 import click
+from functools import partial
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from multiprocessing import Pool
 from app.services.location.raw import facade as location_raw_facade
 from app.services.building.structure import facade as structure_facade
 
 from app.features.contracts.command import AbstractCommand
 from app.core.helpers.log import Log
+from app.services.contracts.drivers.unit_of_work import UnitOfWork
 
 class StructureBuildCommand(AbstractCommand):
+    # 워커 태스크 하나가 하나의 UnitOfWork 로 빌드/기록할 건수
+    BUILD_CHUNK_SIZE: int = 250
 
     @staticmethod
-    def _worker_address_build_task(item: Dict[str, Any]) -> Dict[str, Any]:
-        """각 코어에서 독립적으로 실행될 빌드 태스크"""
+    def _chunks(items: List[Dict[str, Any]], size: int) -> List[List[Dict[str, Any]]]:
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    @staticmethod
+    def _flush_chunk(uow: UnitOfWork, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """청크 쓰기를 기록하고, 실패하면 부모의 후속 기록(도로명코드/주소 갱신)이 일어나지 않도록 결과를 실패로 바꿉니다."""
+        try:
+            uow.flush()
+        except Exception as e:
+            return [{'success': False, 'id': r['id'], 'error': f"UnitOfWork 기록 실패: {str(e)}"} for r in results]
+        return results
+
+    @staticmethod
+    def _worker_address_build_task(item: Dict[str, Any], defer_store: bool = False,
+                                   uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
+        """
+        각 코어에서 독립적으로 실행될 빌드 태스크
+        defer_store 면 도로명코드 갱신 문서를 저장하지 않고 결과(road_code)로 반환하여 부모 프로세스의 BulkWriter 가 모아서 기록합니다.
+        uow 가 주어지면 빌드 중 생긴 좌표/연속지적/주소 문서를 UnitOfWork 에 등록만 합니다. (기록은 호출측 flush)
+        """
         # 에러 추적을 위한 초기화
         current_id = item.get('_id') if item else 'Unknown'
 
@@ -25,7 +47,7 @@ class StructureBuildCommand(AbstractCommand):
             build_logger = Log.get_logger(logger_name)
 
             # 실제 빌드 서비스 호출
-            result = structure_facade.address_service.build_by_address_raw(item)
+            result = structure_facade.address_service.build_by_address_raw(item, uow=uow)
 
             # 🚀 [수정 지점] result가 객체인지, 아니면 딕셔너리인지에 따라 안전하게 접근
             # 만약 result가 None이면 'NoneType' 에러 방지를 위해 방어 로직 강화
@@ -41,12 +63,18 @@ class StructureBuildCommand(AbstractCommand):
                 item['address_id'] = None
                 item['dead'] = True
 
+            road_code = {
+                'road_code_id': item['road_code_id'],
+                'address_id': item['address_id'],
+                'dead': item['dead']
+            }
+
+            if defer_store:
+                build_logger.info(f"Sync Start: {{'_id': '{str(current_id)}', 'bdMgtSn': '{item['address_id']}'}}")
+                return {'success': True, 'id': current_id, 'road_code': road_code}
+
             if location_raw_facade and location_raw_facade.address_service:
-                location_raw_facade.road_code_service.manager.driver('mongodb').store([{
-                    'road_code_id': item['road_code_id'],
-                    'address_id': item['address_id'],
-                    'dead': item['dead']
-                }])
+                location_raw_facade.road_code_service.manager.driver('mongodb').store([road_code])
             else:
                 return {'success': False, 'id': current_id, 'error': 'Location service facade is None'}
 
@@ -59,10 +87,20 @@ class StructureBuildCommand(AbstractCommand):
             error_detail = f"{str(e)}\n{traceback.format_exc()}"
             return {'success': False, 'id': current_id, 'error': error_detail}
 
+    @staticmethod
+    def _worker_address_build_chunk(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        BUILD_CHUNK_SIZE 건을 하나의 UnitOfWork 로 빌드하는 태스크
+        건마다 따로 저장하던 좌표/연속지적/주소 문서를 청크 끝에 컬렉션별 unordered bulk_write 로 한 번에 기록합니다.
+        """
+        uow = UnitOfWork()
+        results = [StructureBuildCommand._worker_address_build_task(item, defer_store=True, uow=uow) for item in items]
+        return StructureBuildCommand._flush_chunk(uow, results)
+
     def address_handle(self, is_continue: bool = False, is_renew: bool = False):
         """building_structure:address 명령어의 실제 구현부"""
         service = location_raw_facade.road_code_service
-        page = 1
+        after = None
         per_page = 10000
         total_count = 0
         last_id = None
@@ -72,11 +110,11 @@ class StructureBuildCommand(AbstractCommand):
         if is_continue:
             renew_threshold = 7 if is_renew else 9999
             last_point = self._get_last_sync_point(structure_facade.address_service, 'build', renew_threshold)
-            if last_point and '_id' in last_point:
-                from bson import ObjectId
-                try: last_id = ObjectId(last_point['_id'])
-                except: last_id = last_point['_id']
-                self.message(f"🔄 이어하기: {last_id}부터 시작", fg='magenta')
+            if last_point and last_point.get('after'):
+                # 집계 결과는 road_code_id 순 after 커서로 조회하므로 커밋된 배치 다음부터 재개합니다.
+                after = last_point['after']
+                last_id = last_point.get('_id')
+                self.message(f"🔄 이어하기: {last_id} 이후부터 시작", fg='magenta')
 
         self.message("🏗️ [4-Core] 멀티프로세싱 공간정보 빌드를 시작합니다.", fg='green')
 
@@ -84,37 +122,50 @@ class StructureBuildCommand(AbstractCommand):
         now = datetime.now()
         role_date = now - timedelta(days=7)
         try:
-            with Pool(processes=4) as pool:
+            # 도로명코드 갱신은 BulkWriter 가 모아서 기록하고, 그 사이 다음 페이지 집계/빌드를 진행합니다.
+            with Pool(processes=4) as pool, service.manager.driver('mongodb').bulk_writer() as writer:
                 while True:
-                    address_pagination = service.get_road_code_aggregate(page, per_page)
+                    address_pagination = service.get_road_code_aggregate(per_page=per_page, after=after, count='none')
 
                     items = getattr(address_pagination, 'items', [])
+                    next_after = address_pagination.meta.next_after
 
-                    if not items:
+                    if not items and not next_after:
                         self.message("✅ 빌드 완료", fg='blue')
                         break
 
-                    # 병렬 처리
-                    results = pool.map(self._worker_address_build_task, items)
+                    # 병렬 처리 (청크 단위 UnitOfWork)
+                    chunk_results = pool.map(self._worker_address_build_chunk, self._chunks(items, self.BUILD_CHUNK_SIZE))
+                    results = [r for chunk in chunk_results for r in chunk]
 
                     chunk_success_count = sum(1 for r in results if r['success'])
                     for r in results:
                         if not r['success'] and r.get('error') != 'No bdMgtSn':
                             self.message(f"❌ 에러 (ID: {r['id']}): {r['error']}", fg='red')
 
-                    last_item = items[-1]
-                    last_id = last_item['_id']
+                    if items:
+                        last_id = items[-1]['_id']
                     total_count += len(items)
-                    page = page + 1
+                    after = next_after
+
+                    # 배치 커밋 직후 이어하기 지점 저장
+                    writer.submit(
+                        [r['road_code'] for r in results if r.get('road_code')],
+                        on_done=partial(self._save_sync_point, structure_facade.address_service,
+                                        {'after': after, '_id': last_id}, 'build')
+                    )
 
                     self.message(
                         f"  -> {total_count}건 처리 중... (성공: {chunk_success_count}/{len(items)}, ID: {last_id})",
                         fg='white'
                     )
 
-                    if len(items) < per_page:
+                    # 다음 커서가 없으면 마지막 페이지입니다.
+                    if not after:
                         break
 
+            self.message(f"💾 저장 통계: {writer.report()}", fg='white')
+            self._clear_sync_point(structure_facade.address_service, 'build')
             self.message(f"✨ 전체 작업 종료 (총 {total_count}건)", fg='blue', bg='white')
             self._send_slack(f"✨ 빌드 완료 (총 {total_count}건 처리)")
 
@@ -135,7 +186,9 @@ class StructureBuildCommand(AbstractCommand):
                 'page': page,
                 'per_page': per_page,
                 'geo_point': None,
-                'sort': [('_id', -1)]
+                'sort': [('_id', -1)],
+                'count': 'none',
+                'item_mode': 'raw'
             })
 
             items = getattr(address_pagination, 'items', [])
@@ -175,8 +228,13 @@ class StructureBuildCommand(AbstractCommand):
             self._send_slack(f"✨ 빌드 완료 (총 {total_count}건 처리)")
 
     @staticmethod
-    def _worker_complex_build_task(item: Dict[str, Any]) -> Dict[str, Any]:
-        """각 코어에서 독립적으로 실행될 빌드 태스크"""
+    def _worker_complex_build_task(item: Dict[str, Any], defer_store: bool = False,
+                                   uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
+        """
+        각 코어에서 독립적으로 실행될 빌드 태스크
+        defer_store 면 갱신된 주소 문서를 저장하지 않고 결과(address)로 반환하여 부모 프로세스의 BulkWriter 가 모아서 기록합니다.
+        uow 가 주어지면 단지 문서를 UnitOfWork 에 등록만 합니다. (기록은 호출측 flush)
+        """
         # 에러 추적을 위한 초기화
         current_id = item.get('_id') if item else 'Unknown'
 
@@ -193,7 +251,11 @@ class StructureBuildCommand(AbstractCommand):
                 return {'success': False, 'id': current_id, 'error': 'No building_manage_number'}
 
             # 실제 빌드 서비스 호출
-            structure_facade.complex_service.build_by_address(item)
+            structure_facade.complex_service.build_by_address(item, uow=uow)
+
+            if defer_store:
+                build_logger.info(f"Sync Start: {{'_id': '{str(current_id)}', 'building_manage_number': '{building_manage_number}'}}")
+                return {'success': True, 'id': current_id, 'address': item}
 
             if location_raw_facade and location_raw_facade.address_service:
                 location_raw_facade.address_service.manager.driver('mongodb').store([item])
@@ -209,6 +271,13 @@ class StructureBuildCommand(AbstractCommand):
             error_detail = f"{str(e)}\n{traceback.format_exc()}"
             return {'success': False, 'id': current_id, 'error': error_detail}
 
+    @staticmethod
+    def _worker_complex_build_chunk(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """BUILD_CHUNK_SIZE 건을 하나의 UnitOfWork 로 빌드하고 단지 문서를 청크 끝에 한 번에 기록하는 태스크"""
+        uow = UnitOfWork()
+        results = [StructureBuildCommand._worker_complex_build_task(item, defer_store=True, uow=uow) for item in items]
+        return StructureBuildCommand._flush_chunk(uow, results)
+
     def complex_handle(self, is_continue: bool = False, is_renew: bool = False):
         """building_structure:complex 명령어의 실제 구현부"""
         service = structure_facade.address_service
@@ -222,9 +291,8 @@ class StructureBuildCommand(AbstractCommand):
             renew_threshold = 7 if is_renew else 9999
             last_point = self._get_last_sync_point(structure_facade.complex_service, 'build', renew_threshold)
             if last_point and '_id' in last_point:
-                from bson import ObjectId
-                try: last_id = ObjectId(last_point['_id'])
-                except: last_id = last_point['_id']
+                # 체크포인트에는 ObjectId 가 타입 그대로 저장됩니다.
+                last_id = last_point['_id']
                 self.message(f"🔄 이어하기: {last_id}부터 시작", fg='magenta')
 
         self.message("🏗️ [4-Core] 멀티프로세싱 단지정보 빌드를 시작합니다.", fg='green')
@@ -233,26 +301,16 @@ class StructureBuildCommand(AbstractCommand):
         now = datetime.now()
         role_date = now - timedelta(days=7)
         try:
-            with Pool(processes=4) as pool:
-                while True:
-                    query_params = {
-                        'page': 1,
-                        'per_page': per_page,
-                        'sort': [('_id', 1)]
-                    }
-                    if last_id:
-                        query_params['_id'] = {'$gt': last_id}
-
-                    address_pagination = service.get_list(query_params)
+            # 주소 문서 갱신은 BulkWriter 가 모아서 기록하고, 그 사이 다음 배치 조회/빌드를 진행합니다.
+            # 대상 주소는 페이지마다 다시 조회하지 않고 하나의 커서로 _id 순 배치 조회합니다. (다음 배치 미리 읽기)
+            address_driver = location_raw_facade.address_service.manager.driver('mongodb')
+            filters = {'_id': {'$gt': last_id}} if last_id else {}
 
-                    items = getattr(address_pagination, 'items', [])
-
-                    if not items:
-                        self.message("✅ 빌드 완료", fg='blue')
-                        break
-
-                    # 병렬 처리
-                    results = pool.map(self._worker_complex_build_task, items)
+            with Pool(processes=4) as pool, address_driver.bulk_writer() as writer:
+                for items in service.manager.driver('mongodb').iterate(filters, batch_size=per_page):
+                    # 병렬 처리 (청크 단위 UnitOfWork)
+                    chunk_results = pool.map(self._worker_complex_build_chunk, self._chunks(items, self.BUILD_CHUNK_SIZE))
+                    results = [r for chunk in chunk_results for r in chunk]
 
                     chunk_success_count = sum(1 for r in results if r['success'])
                     for r in results:
@@ -263,14 +321,22 @@ class StructureBuildCommand(AbstractCommand):
                     last_id = last_item['_id']
                     total_count += len(items)
 
+                    # 배치 커밋 직후 이어하기 지점 저장
+                    writer.submit(
+                        [r['address'] for r in results if r.get('address')],
+                        on_done=partial(self._save_sync_point, structure_facade.complex_service,
+                                        {'_id': last_id}, 'build')
+                    )
+
                     self.message(
                         f"  -> {total_count}건 처리 중... (성공: {chunk_success_count}/{len(items)}, ID: {last_id})",
                         fg='white'
                     )
 
-                    if len(items) < per_page:
-                        break
+                self.message("✅ 빌드 완료", fg='blue')
 
+            self.message(f"💾 저장 통계: {writer.report()}", fg='white')
+            self._clear_sync_point(structure_facade.complex_service, 'build')
             self.message(f"✨ 전체 작업 종료 (총 {total_count}건)", fg='blue', bg='white')
             self._send_slack(f"✨ 빌드 완료 (총 {total_count}건 처리)")
 
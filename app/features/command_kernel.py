@@ -23,13 +23,17 @@ def get_command_list() -> List[Any]:
         from app.features.building.raw.command import BuildingRawCommand
         from app.features.location.raw.command import LocationRawCommand
         from app.features.building.structure.command import StructureBuildCommand
+        from app.features.database.command import DatabaseCommand
+        from app.features.benchmark.command import BenchmarkCommand
 
         # 현재 등록된 명령어 클래스 인스턴스 리스트
         command_classes = [
             BoundaryCommand(),              # 지역 경계 데이터 관련
             BuildingRawCommand(),           # 건축물 원본 데이터 관련
             LocationRawCommand(),       # 주소 마스터 동기화 관련
-            StructureBuildCommand()         # 공간정보 빌드 관련
+            StructureBuildCommand(),        # 공간정보 빌드 관련
+            DatabaseCommand(),              # MongoDB 인덱스/컬렉션 옵션 관리
+            BenchmarkCommand()              # 합성 데이터 기반 성능 비교
         ]
 
         logger.info(f"명령어 클래스 로드 완료: {len(command_classes)}개")
@@ -1,14 +1,10 @@
-import ast
-import os
-import re
+import click
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional
 
-from app.facade import command
+from app.core.helpers.response_cache import ResponseCache
+from app.facade import command, checkpoint, queue
 from app.services.message.webhook import facade as webhook_facade
-from app.core.helpers.config import Config
-from app.core.helpers.env import Env
 
 class AbstractCommand(ABC):
 
@@ -30,82 +26,62 @@ class AbstractCommand(ABC):
         except Exception as e:
             command.error_log(f"Slack Send Failed: {str(e)}")
 
+    @property
+    def checkpoint_job(self) -> str:
+        """체크포인트 키의 job 구분값 (기본: 커맨드 클래스명)"""
+        return self.__class__.__name__
+
     def _get_last_sync_point(self, service, source_type: Optional[str] = None, renew_days: int = 7) -> Optional[dict]:
         """
-        로그 파일(.log 및 .log.1)을 분석하여 마지막 성공 지점을 반환합니다.
-        공통화를 위해 source_type 유무에 따른 logger_name 처리를 포함합니다.
+        체크포인트 저장소에서 마지막으로 커밋된 지점을 반환합니다.
+        (job, service.logger_name, source_type) 단위로 관리되며, renew_days 보다 오래된 지점은 무시합니다.
         """
         try:
-            # 서비스에 따른 로거 이름 결정
-            logger_name = service.logger_name
-            if source_type:
-                logger_name = f"{logger_name}_{source_type}"
-
-            # 로깅 설정 가져오기
-            logger_config = Config.get(f'logging.{logger_name}')
-            if not logger_config and source_type:
-                # 상세 설정이 없으면 기본 서비스 로거 설정 사용
-                logger_config = Config.get(f'logging.{service.logger_name}')
-
-            if not logger_config:
-                return None
-
-            log_path = Env.get('LOG_PATH', '/var/volumes/log')
-            base_filename = os.path.join(log_path, logger_config['filename'])
-
-            # 로테이션 대응 파일 리스트
-            files_to_check = [base_filename, f"{base_filename}.1"]
-
-            for log_filename in files_to_check:
-                if not os.path.exists(log_filename) or os.path.getsize(log_filename) == 0:
-                    continue
-
-                with open(log_filename, 'r', encoding='utf-8') as f:
-                    try:
-                        lines = f.readlines()[-100:]
-                    except EOFError:
-                        continue
-
-                    if not lines:
-                        continue
-
-                    for line in reversed(lines):
-                        if "Sync Start: " in line:
-                            # 1. 타임스탬프 분석
-                            date_match = re.search(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)
-                            if date_match:
-                                log_time = datetime.strptime(date_match.group(1), "%Y-%m-%d %H:%M:%S")
-                                if datetime.now() - log_time > timedelta(days=renew_days):
-                                    self.message(f"⚠️ [{logger_name}] 로그 기록이 {renew_days}일을 초과하여 처음부터 시작합니다.",
-                                                 fg='yellow')
-                                    return None
-
-                            # 2. 파라미터(dict) 추출
-                            param_match = re.search(r"Sync Start: (\{.*\})", line)
-                            if param_match:
-                                self.message(f"🔍 로그 지점 확인됨: {os.path.basename(log_filename)}", fg='white')
-
-                                param_str = param_match.group(1)
-
-                                # 1. ObjectId('...') -> '...' 치환
-                                param_str = re.sub(r"ObjectId\(['\"]?([a-f0-9]{24})['\"]?\)", r"'\1'", param_str)
-
-                                # 2. datetime.datetime(...) -> 문자열로 치환 (정규표현식)
-                                # datetime.datetime(2025, 10, 14, ...) 형태를 찾아 따옴표로 감싸 문자열로 만듭니다.
-                                param_str = re.sub(r"datetime\.datetime\([\d\s,]+\)", r"'datetime_object'", param_str)
-
-                                try:
-                                    # 이제 순수 리터럴들만 남았으므로 파싱 가능
-                                    return ast.literal_eval(param_str)
-                                except (ValueError, SyntaxError) as e:
-                                    self.message(f"⚠️ 로그 파싱 실패: {e}", fg='yellow')
-                                    return None
+            last_point = checkpoint.get(self.checkpoint_job, service.logger_name, source_type, max_age_days=renew_days)
+            if last_point:
+                self.message(f"🔍 체크포인트 확인됨: {last_point}", fg='white')
+            else:
+                self.message(f"⚠️ [{service.logger_name}] 유효한 체크포인트가 없어 처음부터 시작합니다.", fg='yellow')
+            return last_point
 
         except Exception as e:
-            self.message(f"⚠️ 로그 분석 중 오류 발생: {e}", fg='yellow')
+            self.message(f"⚠️ 체크포인트 조회 중 오류 발생: {e}", fg='yellow')
 
         return None
 
+    def _save_sync_point(self, service, point: dict, source_type: Optional[str] = None):
+        """배치 커밋 직후 이어하기 지점을 저장합니다."""
+        checkpoint.save(self.checkpoint_job, service.logger_name, point, source_type)
+
+    def _clear_sync_point(self, service, source_type: Optional[str] = None):
+        """작업 완료 시 이어하기 지점을 삭제합니다."""
+        checkpoint.clear(self.checkpoint_job, service.logger_name, source_type)
+
+    def _gather_jobs(self, results: List, label: str) -> Dict[str, int]:
+        """
+        큐로 발행한 샤드 Job 결과를 완료 순서대로 모아 숫자 항목을 합산합니다.
+        (결과 백엔드를 조회하므로 여러 워커 컨테이너에 흩어진 결과를 한 곳에서 집계합니다.)
+        """
+        totals: Dict[str, int] = {}
+        total = len([result for result in results if result is not None])
+        done = failed = 0
+
+        for _, output, error in queue.gather(results):
+            done += 1
+            if error is not None:
+                failed += 1
+                self.message(f"❌ {label} 샤드 실패 ({done}/{total}): {error}", fg='red')
+                continue
+
+            for key, value in (output or {}).items():
+                if key != 'shard' and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals[key] = totals.get(key, 0) + value
+
+            self.message(f"  -> {label} 샤드 완료 ({done}/{total}): {output}", fg='white')
+
+        totals['failed_shards'] = failed
+        return totals
+
     def _handle_error(self, e, context=""):
         """에러 발생 시 공통 처리"""
         error_msg = f'실행에 실패하였습니다. {context}'
@@ -115,6 +91,16 @@ class AbstractCommand(ABC):
         self.error_log(str(e))
         raise e
 
+    @staticmethod
+    def replay_option(func):
+        """외부 API 를 호출하지 않고 원본 응답 캐시만으로 재처리하는 --replay 옵션"""
+        def apply(ctx, param, value):
+            if value:
+                ResponseCache.set_mode(ResponseCache.MODE_REPLAY)
+
+        return click.option('--replay', is_flag=True, expose_value=False, callback=apply,
+                            help='원본 응답 캐시만으로 재처리합니다. (네트워크 호출 없음, 캐시 미스 시 실패)')(func)
+
     @abstractmethod
     def register_commands(self, cli_group):
         pass
\ No newline at end of file
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any
+
+from app.core.helpers.log import Log
+from app.core.helpers.response_cache import ResponseCache
+
+
+class AbstractJob(ABC):
+    """
+    큐 워커(queue_worker.py)의 app.queue.router 가 실행하는 Job 기본 클래스
+
+    - Queue.dispatch(JobClass, **payload) 로 발행되며 워커에서 JobClass().handle(**payload) 로 실행됩니다.
+    - payload 와 반환값은 JSON 직렬화가 가능해야 합니다. (celery task_serializer='json')
+    """
+
+    def __init__(self):
+        self.logger = Log.get_logger('queue')
+
+    def message(self, msg: str):
+        """워커 로그 출력 (CLI 출력 대신 queue 로거 사용)"""
+        self.logger.info(f"[{self.__class__.__name__}] {msg}")
+
+    @contextmanager
+    def replay_mode(self, replay: bool = False):
+        """
+        발행측 --replay 를 워커 프로세스에 적용합니다. (Job 종료 후 설정값 모드로 복원)
+        replay 여부는 Queue.dispatch payload 의 replay 로 전달됩니다.
+        """
+        if not replay:
+            yield
+            return
+
+        ResponseCache.set_mode(ResponseCache.MODE_REPLAY)
+        try:
+            yield
+        finally:
+            ResponseCache.set_mode(None)
+
+    @staticmethod
+    def is_replay() -> bool:
+        """발행측 프로세스가 --replay 로 실행 중인지 여부 (payload 전달용)"""
+        return ResponseCache.mode() == ResponseCache.MODE_REPLAY
+
+    @abstractmethod
+    def handle(self, **payload) -> Any:
+        pass
+
+
+__all__ = ['AbstractJob']
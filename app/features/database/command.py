@@ -0,0 +1,166 @@
+import click
+import fnmatch
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
+
+from app.services.building.raw import facade as building_raw_facade
+from app.services.building.structure import facade as structure_facade
+from app.services.location.raw import facade as location_raw_facade
+from app.services.location.boundary import facade as boundary_facade
+from app.features.contracts.command import AbstractCommand
+from app.services.contracts.drivers.cursor_stream import CursorStream
+from app.services.contracts.drivers.parquet_exporter import ParquetExporter
+
+
+class DatabaseCommand(AbstractCommand):
+    """
+    MongoDB 드라이버가 선언한 인덱스/컬렉션 옵션을 실제 DB 와 비교하고 맞추는 명령어
+
+    - mongodb_index:diff   : 선언과 실제 DB 차이 출력
+    - mongodb_index:verify : 차이가 있으면 실패 코드로 종료 (배포 전 점검용)
+    - mongodb_index:ensure : 없는 컬렉션/인덱스 생성 (--rebuild, --drop-extra)
+    - mongodb_export:parquet : 원천 컬렉션을 시군구/법정동 파티션 Parquet 스냅샷으로 내보내기
+    """
+
+    # Parquet 스냅샷 대상 컬렉션 (건축물대장 원천, 주소DB 원천, 지역 경계)
+    EXPORT_COLLECTIONS = (
+        'building_raw_*',
+        'location_raw_road_code', 'location_raw_road_address',
+        'location_raw_block_address', 'location_raw_building_group',
+        'boundary',
+    )
+
+    @staticmethod
+    def _drivers(collection: Optional[str] = None) -> List[Any]:
+        """각 서비스 매니저의 MongoDB 드라이버를 컬렉션 단위로 모읍니다."""
+        drivers: Dict[str, Any] = {}
+        services = [boundary_facade.service]
+        for facade in (building_raw_facade, location_raw_facade, structure_facade):
+            services.extend(getattr(facade, field.name) for field in fields(facade))
+
+        for service in services:
+            manager = getattr(service, 'manager', None) or getattr(service, 'boundary_manager', None)
+            if manager is None:
+                continue
+
+            try:
+                driver = manager.driver('mongodb')
+            except Exception:
+                continue
+
+            if not hasattr(driver, 'index_manager'):
+                continue
+
+            index_manager = driver.index_manager()
+            name = index_manager.collection.name
+            if collection and name != collection:
+                continue
+            drivers.setdefault(name, driver)
+
+        return [drivers[name] for name in sorted(drivers)]
+
+    def _print_report(self, report: Dict[str, Any]) -> bool:
+        """컬렉션별 diff 결과를 출력하고 선언과 일치하는지 반환합니다."""
+        compressor = report['compressor']
+        in_sync = report['exists'] and not (report['missing'] or report['changed']) and compressor['match']
+
+        state = '✅' if in_sync else '⚠️'
+        self.message(f"{state} {report['collection']}" + ('' if report['exists'] else ' (컬렉션 없음)'),
+                     fg='green' if in_sync else 'yellow')
+
+        for label, key, color in (('누락', 'missing', 'red'), ('정의 변경', 'changed', 'red'), ('미선언', 'extra', 'white')):
+            if report[key]:
+                self.message(f"    {label}: {', '.join(report[key])}", fg=color)
+
+        if not compressor['match']:
+            self.message(
+                f"    블록 압축: 선언 {compressor['declared']} / 실제 {compressor['live'] or '서버 기본값'} "
+                f"(기존 컬렉션은 재적재해야 적용됩니다)", fg='yellow')
+
+        for key in ('created', 'rebuilt', 'dropped'):
+            if report.get(key):
+                self.message(f"    {key}: {', '.join(report[key])}", fg='cyan')
+        for name, error in (report.get('errors') or {}).items():
+            self.message(f"    ❌ {name}: {error}", fg='red')
+
+        return in_sync
+
+    def diff_handle(self, collection: Optional[str] = None) -> bool:
+        """선언과 실제 DB 차이를 출력하고, 모두 일치하면 True 를 반환합니다."""
+        in_sync = True
+        for driver in self._drivers(collection):
+            in_sync = self._print_report(driver.index_manager().diff()) and in_sync
+        return in_sync
+
+    def ensure_handle(self, collection: Optional[str] = None, rebuild: bool = False, drop_extra: bool = False):
+        try:
+            errors = 0
+            for driver in self._drivers(collection):
+                report = driver.index_manager().ensure(rebuild=rebuild, drop_extra=drop_extra)
+                self._print_report(report)
+                errors += len(report['errors'])
+
+            if errors:
+                self._send_slack(f"⚠️ 인덱스 생성 실패 {errors}건", status="ERROR")
+            self.message(f"✨ 인덱스 적용 완료 (실패 {errors}건)", fg='blue')
+
+        except Exception as e:
+            self._handle_error(e, f"인덱스 적용 중단 @see {__file__}")
+
+    def export_parquet_handle(self, collection: Optional[str] = None, output: Optional[str] = None,
+                              batch_size: int = 5000):
+        try:
+            exporter = ParquetExporter(output)
+            targets = [
+                driver.index_manager().collection for driver in self._drivers(collection)
+                if any(fnmatch.fnmatch(driver.index_manager().collection.name, pattern)
+                       for pattern in self.EXPORT_COLLECTIONS)
+            ]
+            self.message(f"📦 Parquet 스냅샷 내보내기 시작: {len(targets)}개 컬렉션 → {exporter.output_dir}", fg='green')
+
+            for target in targets:
+                # 하나의 서버 커서를 _id 순으로 읽고 다음 배치를 미리 읽어 둡니다.
+                # 파일마다 스키마가 달라지지 않도록 표본 문서의 필드/타입으로 스키마를 먼저 정합니다. (전체 스캔 없음)
+                schema = ParquetExporter.schema_of(target, exporter.schema_sample_size)
+                stream = CursorStream(target, {}, batch_size=batch_size, prefetch=True)
+                stats = exporter.export(target.name, stream, schema)
+                self.message(
+                    f"  ✅ {target.name}: {stats['rows']}건 / 파티션 {stats['partitions']}개 / 파일 {stats['files']}개",
+                    fg='white'
+                )
+
+            self._send_slack(f"📦 Parquet 스냅샷 내보내기 완료 ({len(targets)}개 컬렉션)")
+
+        except Exception as e:
+            self._handle_error(e, f"Parquet 스냅샷 내보내기 중단 @see {__file__}")
+
+    def register_commands(self, cli_group):
+        collection_option = click.option('--collection', default=None, help='특정 컬렉션만 대상으로 지정')
+
+        @cli_group.command('mongodb_index:diff', help='드라이버 인덱스 선언과 실제 DB 비교')
+        @collection_option
+        def mongodb_index_diff(collection):
+            self.diff_handle(collection)
+
+        @cli_group.command('mongodb_index:verify', help='드라이버 인덱스 선언과 실제 DB 가 다르면 실패')
+        @collection_option
+        def mongodb_index_verify(collection):
+            if not self.diff_handle(collection):
+                raise click.ClickException('선언과 다른 인덱스/컬렉션 옵션이 있습니다. (mongodb_index:ensure)')
+
+        @cli_group.command('mongodb_index:ensure', help='선언된 컬렉션/인덱스 생성')
+        @collection_option
+        @click.option('--rebuild', is_flag=True, help='정의가 바뀐 인덱스를 삭제 후 다시 생성')
+        @click.option('--drop-extra', 'drop_extra', is_flag=True, help='선언되지 않은 인덱스 삭제')
+        def mongodb_index_ensure(collection, rebuild, drop_extra):
+            self.ensure_handle(collection, rebuild, drop_extra)
+
+        @cli_group.command('mongodb_export:parquet', help='원천 컬렉션을 시군구/법정동 파티션 Parquet 스냅샷으로 내보내기')
+        @collection_option
+        @click.option('--output', default=None, help='출력 디렉토리 (기본: database.export.parquet_path)')
+        @click.option('--batch-size', 'batch_size', default=5000, type=int, help='커서 배치 크기')
+        def mongodb_export_parquet(collection, output, batch_size):
+            self.export_parquet_handle(collection, output, batch_size)
+
+
+__all__ = ['DatabaseCommand']
@@ -12,25 +12,12 @@ class BoundaryCommand(AbstractCommand):
         try:
             self.message(f'🚀 [{label}] 직접 동기화를 시작합니다...', fg='green')
 
-            per_page = 100
-            # 서비스의 sync_from_vworld 사용 (단일 레이어 추출)
-            meta = boundary_facade.service.sync_from_vworld(
+            # 1페이지의 total 로 전체 페이지를 계산하여 나머지 페이지를 동시에 조회
+            total_stored = boundary_facade.service.sync_all_from_vworld(
                 location_type=location_type,
-                page=1,
-                per_page=per_page
+                per_page=100
             )
-
-            last_page = meta.last_page
-            self.message(f'-> 총 {meta.total}건 ({last_page}페이지) 대상 확인', fg='cyan')
-
-            if last_page > 1:
-                for page in range(2, last_page + 1):
-                    boundary_facade.service.sync_from_vworld(
-                        location_type=location_type,
-                        page=page,
-                        per_page=per_page
-                    )
-                    self.message(f'   ... {page}/{last_page} 페이지 진행 중', fg='blue')
+            self.message(f'-> 총 {total_stored}건 저장', fg='cyan')
 
             self.message(f'✅ [{label}] 모든 데이터 쓰기 완료', fg='green')
 
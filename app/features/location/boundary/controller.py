@@ -11,19 +11,19 @@ class BoundaryController(Controller):
     Boundary 클래스는 경계 정보에 대한 조회 기능을 제공합니다.
     """
 
-    def index(self, params: BoundariesRequest) -> BoundariesResponse:
+    async def index(self, params: BoundariesRequest) -> BoundariesResponse:
         """
         여러 경계 데이터를 조회합니다.
         """
-        # 페이징 및 필터링 조건에 따라 경계 데이터를 조회하여 반환
-        return boundary.service.get_boundaries(params.dict(), driver_name='mongodb')
+        # 페이징 및 필터링 조건에 따라 경계 데이터를 조회하여 반환 (이벤트 루프를 막지 않는 비동기 조회)
+        return await boundary.service.get_boundaries_async(params.dict(), driver_name='mongodb')
 
-    def show(self, params: BoundaryRequest) -> Optional[BoundaryResponse]:
+    async def show(self, params: BoundaryRequest) -> Optional[BoundaryResponse]:
         """
         단일 경계 데이터를 조회합니다.
         """
-        # 필터링 조건에 따라 단일 경계 데이터를 조회하여 반환
-        return boundary.service.get_boundary(params.dict(), driver_name='mongodb')
+        # 필터링 조건에 따라 단일 경계 데이터를 조회하여 반환 (이벤트 루프를 막지 않는 비동기 조회)
+        return await boundary.service.get_boundary_async(params.dict(), driver_name='mongodb')
 
 
 __all__ = ['BoundaryController']
@@ -20,6 +20,8 @@ class BoundaryRequest(BaseModel):
     latitude: Optional[float] = Field(None, title='위도', example=37.49425480498678)
     longitude: Optional[float] = Field(None, title='경도', example=126.88468703854274)
     use_polygon: Optional[int] = Field(0, title='폴리곤 반환 여부', example=False)
+    fields: Optional[str] = Field(
+        None, title='조회할 필드 (쉼표 구분, -필드 는 제외 / 필수 필드는 항상 포함)', example='item_code,item_name,geo_point')
 
     @root_validator
     def check_latitude_longitude(cls, values):
@@ -52,9 +54,13 @@ class BoundariesRequest(BoundaryRequest):
     페이징 처리가 필요한 경계 정보 조회 파라미터 모델입니다.
 
     BoundaryRequest 에 페이징 필드를 추가로 제공합니다.
+    after 에 직전 응답의 next_after 를 넘기면 page 대신 커서 기준으로 다음 페이지를 조회합니다.
     """
     page: Optional[int] = Field(1, title='페이지 번호', example=1, ge=1)
     per_page: Optional[int] = Field(10, title='페이지 수량', example=10, ge=1, le=10000)
+    after: Optional[str] = Field(None, title='다음 페이지 커서 (직전 응답의 next_after)')
+    count: Optional[Literal['exact', 'estimated', 'cached', 'none']] = Field(
+        'cached', title='전체 건수 계산 방식 (none 이면 total 없이 has_next 만 반환)', example='cached')
 
 
 __all__ = ['BoundaryRequest', 'BoundariesRequest']
\ No newline at end of file
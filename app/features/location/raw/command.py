@@ -1,14 +1,12 @@
-import ast
-import os
-import re
 import click
 import time
 import traceback
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from multiprocessing import Pool
 
 from app.core.helpers.config import Config
+from app.facade import queue
 from app.services.location.raw import facade as location_raw_facade
 from app.services.building.raw import facade as building_facade
 from app.features.contracts.command import AbstractCommand
@@ -32,12 +30,7 @@ class LocationRawCommand(AbstractCommand):
 
             # 서비스 레이어 접근
             service = location_raw_facade.address_service
-            if source_type == 'group':
-                building_service = building_facade.group_info_service
-            elif source_type == 'basic':
-                building_service = building_facade.basic_info_service
-            else:
-                building_service = building_facade.title_info_service
+            building_service = LocationRawCommand._building_service(source_type)
 
             keyword = item.get('newPlatPlc', '').strip()
             if not keyword:
@@ -73,17 +66,40 @@ class LocationRawCommand(AbstractCommand):
             error_detail = f"{str(e)}\n{traceback.format_exc()}"
             return {'success': False, 'id': current_id, 'error': error_detail, 'pk': mgm_pk}
 
-    def sync_address_by_building_info(self, source_type: str, is_continue: bool = False, is_renew: bool = False):
-        """건축물대장 기반 주소 마스터 동기화 로직 (Multi-Core)"""
+    @staticmethod
+    def _building_service(source_type: str):
+        """동기화 원천(group/basic/title)에 해당하는 건축물대장 서비스"""
         if source_type == 'group':
-            building_service = building_facade.group_info_service
-            msg_prefix = "🏢 [총괄표제부]"
+            return building_facade.group_info_service
         elif source_type == 'basic':
-            building_service = building_facade.basic_info_service
-            msg_prefix = "🏢 [기본개요]"
-        else:
-            building_service = building_facade.title_info_service
-            msg_prefix = "🏠 [표제부]"
+            return building_facade.basic_info_service
+        return building_facade.title_info_service
+
+    @staticmethod
+    def _message_prefix(source_type: str) -> str:
+        if source_type == 'group':
+            return "🏢 [총괄표제부]"
+        elif source_type == 'basic':
+            return "🏢 [기본개요]"
+        return "🏠 [표제부]"
+
+    @staticmethod
+    def _address_target_query(role_date: datetime) -> Dict[str, Any]:
+        """주소 매핑이 필요한(미매핑 또는 갱신 주기 도래) 건축물대장 조회 조건"""
+        return {
+            '$or': [
+                {'updated_at': {'$lt': role_date}},
+                {'bdMgtSn': {'$exists': False}},
+                {'bdMgtSn': None},
+            ],
+            'newPlatPlc': {'$nin': ['', None, ' ']},
+            'dead': {'$ne': True},
+        }
+
+    def sync_address_by_building_info(self, source_type: str, is_continue: bool = False, is_renew: bool = False):
+        """건축물대장 기반 주소 마스터 동기화 로직 (Multi-Core)"""
+        building_service = self._building_service(source_type)
+        msg_prefix = self._message_prefix(source_type)
 
         self._send_slack(f"🚀 {msg_prefix} 멀티프로세싱 동기화 가동")
 
@@ -97,11 +113,8 @@ class LocationRawCommand(AbstractCommand):
                 renew_threshold = 7 if is_renew else 9999
                 last_point = self._get_last_sync_point(service, source_type, renew_threshold)
                 if last_point and '_id' in last_point:
-                    from bson import ObjectId
-                    try:
-                        last_id = ObjectId(last_point['_id'])
-                    except:
-                        last_id = last_point['_id']
+                    # 체크포인트에는 ObjectId 가 타입 그대로 저장됩니다.
+                    last_id = last_point['_id']
                     self.message(f"🔄 {msg_prefix} 이어하기: {last_id} 이후부터 시작", fg='magenta')
 
             self.message(f"🏗️ [4-Core] {msg_prefix} 병렬 수집을 시작합니다.", fg='green')
@@ -109,34 +122,16 @@ class LocationRawCommand(AbstractCommand):
             now = datetime.now()
             role_date = now - timedelta(days=7)
 
-            with Pool(processes=4) as pool:
-                while True:
-                    query_params = {
-                        'page': 1,
-                        'per_page': per_page,
-                        '$or': [
-                            {'updated_at': {'$lt': role_date}},
-                            {'bdMgtSn': {'$exists': False}},
-                            {'bdMgtSn': None},
-                        ],
-                        'newPlatPlc': {'$nin': ['', None, ' ']},
-                        'dead': {'$ne': True},
-                        'sort': [('_id', 1)]
-                    }
-
-                    if last_id:
-                        query_params['_id'] = {'$gt': last_id}
-                    elif source_type == 'basic':
-                        query_params['mgmUpBldrgstPk'] = '0'
-                        query_params['regstrKindCd'] = {'$ne': '4'}
-
-                    pagination = building_service.get_list(query_params, driver_name='mongodb')
-                    items = pagination.items or []
-
-                    if not items:
-                        self.message(f"✅ {msg_prefix} 모든 데이터를 처리했습니다.", fg='blue')
-                        break
+            # 대상 건축물대장은 페이지마다 다시 조회하지 않고 하나의 커서로 _id 순 배치 조회합니다. (다음 배치 미리 읽기)
+            filters = self._address_target_query(role_date)
+            if last_id:
+                filters['_id'] = {'$gt': last_id}
+            if source_type == 'basic':
+                filters['mgmUpBldrgstPk'] = '0'
+                filters['regstrKindCd'] = {'$ne': '4'}
 
+            with Pool(processes=4) as pool:
+                for items in building_service.manager.driver('mongodb').iterate(filters, batch_size=per_page):
                     # 워커에 전달할 페이로드 구성
                     worker_payloads = [
                         {'item': item, 'source_type': source_type, 'role_date': role_date}
@@ -156,19 +151,85 @@ class LocationRawCommand(AbstractCommand):
                     last_id = last_item['_id']
                     total_count += len(items)
 
+                    # 배치 커밋 직후 이어하기 지점 저장
+                    self._save_sync_point(service, {'_id': last_id}, source_type)
+
                     self.message(
                         f"  -> {msg_prefix} {total_count}건 처리 중... (성공: {chunk_success_count}/{len(items)}, ID: {last_id})",
                         fg='white'
                     )
 
-                    if len(items) < per_page:
-                        break
-
+            self.message(f"✅ {msg_prefix} 모든 데이터를 처리했습니다.", fg='blue')
+            self._clear_sync_point(service, source_type)
             self._send_slack(f"✅ {msg_prefix} 완료 (총 {total_count}건)")
 
         except Exception as e:
             self._handle_error(e, f"{msg_prefix} 주소 동기화 중단")
 
+    def dispatch_address_by_building_info(self, source_type: str, shard_size: Optional[int] = None,
+                                          wait: bool = False) -> List:
+        """
+        건축물대장 _id 구간을 샤드로 나누어 Celery 큐로 발행합니다. (여러 워커 컨테이너로 수평 확장)
+        wait 이면 결과 백엔드에서 샤드 결과를 모아 전체 통계를 출력합니다.
+        """
+        # job 모듈이 이 모듈을 참조하므로 순환 import 를 피하기 위해 지연 로드
+        from app.features.location.raw.job import LocationAddressShardJob
+
+        building_service = self._building_service(source_type)
+        msg_prefix = self._message_prefix(source_type)
+        shard_size = int(shard_size or Config.get('queue.id_shard_size', 50000))
+
+        self._send_slack(f"🚀 {msg_prefix} 분산 동기화 발행")
+
+        try:
+            boundaries = self._plan_id_boundaries(building_service, shard_size)
+            results = []
+
+            for shard, start_id in enumerate(boundaries):
+                end_id = boundaries[shard + 1] if shard + 1 < len(boundaries) else None
+                results.append(queue.dispatch(
+                    LocationAddressShardJob,
+                    source_type=source_type,
+                    start_id=str(start_id),
+                    end_id=str(end_id) if end_id is not None else None,
+                    shard=shard,
+                    replay=LocationAddressShardJob.is_replay()
+                ))
+
+            dispatched = len([r for r in results if r is not None])
+            self.message(f"📤 {msg_prefix} {dispatched}/{len(results)}개 샤드 발행 완료 (샤드당 {shard_size}건)", fg='green')
+
+            if wait:
+                totals = self._gather_jobs(results, msg_prefix)
+                self.message(f"📊 {msg_prefix} 분산 동기화 집계: {totals}", fg='blue')
+                self._send_slack(f"✅ {msg_prefix} 분산 동기화 완료 ({totals})")
+
+            return results
+
+        except Exception as e:
+            self._handle_error(e, f"{msg_prefix} 분산 동기화 발행 중단")
+
+    @staticmethod
+    def _plan_id_boundaries(building_service, shard_size: int) -> List[Any]:
+        """
+        _id 인덱스를 shard_size 간격으로 건너뛰며 각 샤드의 시작 _id 목록을 구합니다.
+        경계값만 조회하므로 전체 _id 를 내려받지 않습니다.
+        """
+        collection = building_service.manager.driver('mongodb').collection
+        first = collection.find_one({}, {'_id': 1}, sort=[('_id', 1)])
+        if not first:
+            return []
+
+        boundaries = [first['_id']]
+        while True:
+            docs = list(
+                collection.find({'_id': {'$gte': boundaries[-1]}}, {'_id': 1})
+                .sort('_id', 1).skip(shard_size).limit(1)
+            )
+            if not docs:
+                return boundaries
+            boundaries.append(docs[0]['_id'])
+
     def handle_sync_all(self, is_continue: bool = False, is_renew: bool = False):
         """총괄 및 표제부 순차 동기화"""
         self._send_slack("📅 주소 동기화 전체 프로세스 가동")
@@ -183,161 +244,194 @@ class LocationRawCommand(AbstractCommand):
         self.message(f"✨ 전체 동기화 완료 (총 소요시간: {total_time}초)", fg='white', bg='blue')
         self._send_slack(f"✨ 주소 동기화 전체 완료 (소요시간: {total_time}초)")
 
-    def handle_block_address(self, is_continue: bool = False, is_renew: bool = False):
-        directory_path = f"{Config.get('app.project_root')}/resources/juso_go_kr/address_db/current"
-        service = location_raw_facade.block_address_service
-
-        self._send_slack("🏘️ 관련지번 마스터 임포트 가동")
+    @staticmethod
+    def _worker_import_file_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """각 코어에서 독립적으로 실행될 주소DB 파일 임포트 태스크 (파일 하나 = 태스크 하나)"""
+        file_path = payload.get('file_path')
+        started = time.time()
 
         try:
-            # 서비스 내부에서 read()를 통해 가져온 파일 목록
-            files = service.get_import_target_files(directory_path)
-
-            total_count = 0
-
-            for file_path in files:
-                file_name = os.path.basename(file_path)
-
-                # 서비스 내부에서 read()를 통해 파싱하고 저장
-                saved_count = service.import_single_file(file_path)
-
-                total_count += saved_count
-                self.message(f"  -> 📄 {file_name}: {saved_count}건 저장 완료", fg='white')
+            service = getattr(location_raw_facade, f"{payload.get('dataset')}_service")
 
-            self._send_slack(f"✨ 전체 임포트 종료 (총 {total_count}건)")
+            # 임포트 매니페스트가 파일 단위 완료 표시이므로, 실패한 파일은 다음 실행에서 다시 임포트됩니다.
+            saved_count = service.import_single_file(file_path)
+            return {'success': True, 'file_path': file_path, 'count': saved_count,
+                    'elapsed': round(time.time() - started, 1)}
 
         except Exception as e:
-            self._handle_error(e, "관련지번 임포트 중단")
+            return {'success': False, 'file_path': file_path, 'count': 0,
+                    'elapsed': round(time.time() - started, 1), 'error': str(e)}
 
-    def handle_road_address(self, is_continue: bool = False, is_renew: bool = False):
-        directory_path = f"{Config.get('app.project_root')}/resources/juso_go_kr/address_db/current"
-        service = location_raw_facade.road_address_service
+    def import_address_db_files(self, dataset: str, label: str, parallel: bool = False,
+                                workers: Optional[int] = None):
+        """
+        주소DB 텍스트 파일(시도별) 임포트
 
-        self._send_slack("🏘️ 도로주소 마스터 임포트 가동")
+        parallel 이면 파일을 프로세스 풀로 나누어 동시에 임포트합니다. (풀 크기: workers 또는 jgk.import.workers)
+        큰 파일부터 배정하여 마지막에 큰 파일 하나만 남는 경우를 줄입니다.
+        """
+        # current/ 디렉토리 또는 압축을 풀지 않은 최신 ZIP (jgk.import.source)
+        directory_path = location_raw_facade.address_db_service.import_source()
+        service = getattr(location_raw_facade, f"{dataset}_service")
+
+        self._send_slack(f"🏘️ {label} 마스터 임포트 가동")
 
         try:
             # 서비스 내부에서 read()를 통해 가져온 파일 목록
             files = service.get_import_target_files(directory_path)
-            total_count = 0
-
-            for file_path in files:
-                file_name = os.path.basename(file_path)
-
-                # 서비스 내부에서 read()를 통해 파싱하고 저장
-                saved_count = service.import_single_file(file_path)
-
-                total_count += saved_count
-                self.message(f"  -> 📄 {file_name}: {saved_count}건 저장 완료", fg='white')
-
-            self._send_slack(f"✨ 전체 임포트 종료 (총 {total_count}건)")
-
-        except Exception as e:
-            self._handle_error(e, "도로주소 임포트 중단")
-
-    def handle_building_group(self, is_continue: bool = False, is_renew: bool = False):
-        directory_path = f"{Config.get('app.project_root')}/resources/juso_go_kr/address_db/current"
-        service = location_raw_facade.building_group_service
+            payloads = [
+                {'dataset': dataset, 'file_path': file_path}
+                for file_path in sorted(files, key=service.manager.text_driver.source_size, reverse=True)
+            ]
 
-        self._send_slack("🏘️ 부가정보 마스터 임포트 가동")
+            processes = 1
+            if parallel and payloads:
+                processes = min(len(payloads), max(1, int(workers or Config.get('jgk.import.workers', 4))))
+                self.message(f"🏗️ [{processes}-Core] {label} 파일 {len(payloads)}개 병렬 임포트를 시작합니다.", fg='green')
 
-        try:
-            # 서비스 내부에서 read()를 통해 가져온 파일 목록
-            files = service.get_import_target_files(directory_path)
             total_count = 0
+            failed: List[Dict[str, Any]] = []
+
+            def report(result: Dict[str, Any], done: int):
+                nonlocal total_count
+                file_name = service.manager.text_driver.source_name(result['file_path'])
+                progress = f"[{done}/{len(payloads)}]"
+
+                if result['success']:
+                    total_count += result['count']
+                    self.message(f"  -> 📄 {progress} {file_name}: {result['count']}건 저장 완료 ({result['elapsed']}초)",
+                                 fg='white')
+                else:
+                    failed.append(result)
+                    self.message(f"  -> ❌ {progress} {file_name}: {result['error']}", fg='red')
+
+            if processes > 1:
+                with Pool(processes=processes) as pool:
+                    # 끝나는 순서대로 결과를 받아 파일 단위 진행 상황을 출력합니다.
+                    for done, result in enumerate(pool.imap_unordered(self._worker_import_file_task, payloads), 1):
+                        report(result, done)
+            else:
+                for done, payload in enumerate(payloads, 1):
+                    report(self._worker_import_file_task(payload), done)
 
-            for file_path in files:
-                file_name = os.path.basename(file_path)
+            if failed:
+                self._send_slack(f"⚠️ {label} 임포트 실패 {len(failed)}개 파일 (총 {total_count}건 저장)", status="ERROR")
+            else:
+                self._send_slack(f"✨ 전체 임포트 종료 (총 {total_count}건)")
 
-                # 서비스 내부에서 read()를 통해 파싱하고 저장
-                saved_count = service.import_single_file(file_path)
+        except Exception as e:
+            self._handle_error(e, f"{label} 임포트 중단")
 
-                total_count += saved_count
-                self.message(f"  -> 📄 {file_name}: {saved_count}건 저장 완료", fg='white')
+    def handle_block_address(self, is_continue: bool = False, is_renew: bool = False, parallel: bool = False,
+                             workers: Optional[int] = None):
+        self.import_address_db_files('block_address', '관련지번', parallel, workers)
 
-            self._send_slack(f"✨ 전체 임포트 종료 (총 {total_count}건)")
+    def handle_road_address(self, is_continue: bool = False, is_renew: bool = False, parallel: bool = False,
+                            workers: Optional[int] = None):
+        self.import_address_db_files('road_address', '도로주소', parallel, workers)
 
-        except Exception as e:
-            self._handle_error(e, "부가정보 임포트 중단")
+    def handle_building_group(self, is_continue: bool = False, is_renew: bool = False, parallel: bool = False,
+                              workers: Optional[int] = None):
+        self.import_address_db_files('building_group', '부가정보', parallel, workers)
 
     def handle_address_db(self):
         location_raw_facade.address_db_service.run()
 
-    def handle_road_code(self, is_continue: bool = False, is_renew: bool = False):
-        directory_path = f"{Config.get('app.project_root')}/resources/juso_go_kr/address_db/current"
-        service = location_raw_facade.road_code_service
-
-        self._send_slack("🏘️ 도로코드 마스터 임포트 가동")
-
-        try:
-            # 서비스 내부에서 read()를 통해 가져온 파일 목록
-            files = service.get_import_target_files(directory_path)
-            total_count = 0
-
-            for file_path in files:
-                file_name = os.path.basename(file_path)
-
-                # 서비스 내부에서 read()를 통해 파싱하고 저장
-                saved_count = service.import_single_file(file_path)
-
-                total_count += saved_count
-                self.message(f"  -> 📄 {file_name}: {saved_count}건 저장 완료", fg='white')
-
-            self._send_slack(f"✨ 전체 임포트 종료 (총 {total_count}건)")
-
-        except Exception as e:
-            self._handle_error(e, "도로코드 임포트 중단")
-
+    def handle_road_code(self, is_continue: bool = False, is_renew: bool = False, parallel: bool = False,
+                         workers: Optional[int] = None):
+        self.import_address_db_files('road_code', '도로코드', parallel, workers)
 
     def register_commands(self, cli_group):
         """Sync 관련 CLI 명령어 등록"""
 
+        def distributed_options(func):
+            """_id 구간 샤드를 Celery 큐로 발행하는 분산 실행 옵션"""
+            func = click.option('--wait', is_flag=True, help='발행 후 모든 샤드 결과를 모아 집계합니다.')(func)
+            func = click.option('--shard-size', type=int, default=None,
+                                help='샤드당 문서 수 (기본: queue.id_shard_size)')(func)
+            func = click.option('--distributed', is_flag=True,
+                                help='_id 구간 샤드로 나누어 큐 워커에서 실행합니다. (--continue 미적용)')(func)
+            return func
+
+        def import_options(func):
+            """주소DB 파일을 프로세스 풀로 나누어 임포트하는 병렬 실행 옵션"""
+            func = click.option('--workers', type=int, default=None,
+                                help='병렬 임포트 프로세스 수 (기본: jgk.import.workers)')(func)
+            func = click.option('--parallel', is_flag=True, help='시도별 파일을 여러 프로세스에서 동시에 임포트합니다.')(func)
+            return func
+
         @cli_group.command('location_raw:address_by_group')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_group(is_continue, is_renew):
-            self.sync_address_by_building_info('group', is_continue, is_renew)
+        @distributed_options
+        @self.replay_option
+        def sync_group(is_continue, is_renew, distributed, shard_size, wait):
+            if distributed:
+                self.dispatch_address_by_building_info('group', shard_size, wait)
+            else:
+                self.sync_address_by_building_info('group', is_continue, is_renew)
 
         @cli_group.command('location_raw:address_by_title')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_title(is_continue, is_renew):
-            self.sync_address_by_building_info('title', is_continue, is_renew)
+        @distributed_options
+        @self.replay_option
+        def sync_title(is_continue, is_renew, distributed, shard_size, wait):
+            if distributed:
+                self.dispatch_address_by_building_info('title', shard_size, wait)
+            else:
+                self.sync_address_by_building_info('title', is_continue, is_renew)
 
         @cli_group.command('location_raw:address_by_basic')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_basic(is_continue, is_renew):
-            self.sync_address_by_building_info('basic', is_continue, is_renew)
+        @distributed_options
+        @self.replay_option
+        def sync_basic(is_continue, is_renew, distributed, shard_size, wait):
+            if distributed:
+                self.dispatch_address_by_building_info('basic', shard_size, wait)
+            else:
+                self.sync_address_by_building_info('basic', is_continue, is_renew)
 
         @cli_group.command('location_raw:address_all')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_all_cmd(is_continue, is_renew):
-            self.handle_sync_all(is_continue, is_renew)
+        @distributed_options
+        @self.replay_option
+        def sync_all_cmd(is_continue, is_renew, distributed, shard_size, wait):
+            if distributed:
+                # handle_sync_all 과 같은 원천만 발행합니다.
+                self.dispatch_address_by_building_info('basic', shard_size, wait)
+            else:
+                self.handle_sync_all(is_continue, is_renew)
 
         @cli_group.command('location_raw:block_address')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_block_address(is_continue, is_renew):
-            self.handle_block_address(is_continue, is_renew)
+        @import_options
+        def sync_block_address(is_continue, is_renew, parallel, workers):
+            self.handle_block_address(is_continue, is_renew, parallel, workers)
 
         @cli_group.command('location_raw:road_address')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_road_address(is_continue, is_renew):
-            self.handle_road_address(is_continue, is_renew)
+        @import_options
+        def sync_road_address(is_continue, is_renew, parallel, workers):
+            self.handle_road_address(is_continue, is_renew, parallel, workers)
 
         @cli_group.command('location_raw:building_group')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_building_group(is_continue, is_renew):
-            self.handle_building_group(is_continue, is_renew)
+        @import_options
+        def sync_building_group(is_continue, is_renew, parallel, workers):
+            self.handle_building_group(is_continue, is_renew, parallel, workers)
 
         @cli_group.command('location_raw:road_code')
         @click.option('--continue', 'is_continue', is_flag=True)
         @click.option('--renew', 'is_renew', is_flag=True)
-        def sync_road_code(is_continue, is_renew):
-            self.handle_road_code(is_continue, is_renew)
+        @import_options
+        def sync_road_code(is_continue, is_renew, parallel, workers):
+            self.handle_road_code(is_continue, is_renew, parallel, workers)
 
         @cli_group.command('location_raw:address_db')
         def sync_address_db():
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from multiprocessing.pool import ThreadPool
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from app.core.helpers.config import Config
+from app.features.contracts.job import AbstractJob
+from app.features.location.raw.command import LocationRawCommand
+
+
+class LocationAddressShardJob(AbstractJob):
+    """
+    _id 범위 샤드 단위 건축물대장 기반 주소 동기화 Job
+
+    LocationRawCommand 의 --distributed 실행 시 건축물대장 _id 구간을 샤드로 나누어 발행하며,
+    각 워커는 구간 내 문서를 하나의 커서로 _id 순 배치 순회하면서 JGK 주소 매핑을 수행합니다.
+    """
+
+    def handle(self, source_type: str, start_id: str, end_id: Optional[str] = None, shard: int = 0,
+               per_page: int = 1000, threads: Optional[int] = None, replay: bool = False) -> Dict[str, Any]:
+        """
+        Args:
+            source_type: 동기화 원천 (group / title / basic)
+            start_id: 샤드 시작 _id (포함)
+            end_id: 샤드 종료 _id (미포함, None 이면 끝까지)
+            shard: 샤드 번호 (로그/집계용)
+            per_page: 한 번에 조회할 문서 수
+            threads: 워커 내 동시 처리 스레드 수
+            replay: 원본 응답 캐시만으로 재처리 (발행측 --replay)
+        """
+        building_service = LocationRawCommand._building_service(source_type)
+        msg_prefix = LocationRawCommand._message_prefix(source_type)
+        threads = int(threads or Config.get('queue.address_threads', 4))
+        role_date = datetime.now() - timedelta(days=7)
+
+        id_range = {'$gte': self._to_id(start_id)}
+        if end_id:
+            id_range['$lt'] = self._to_id(end_id)
+
+        stats = {'shard': shard, 'source_type': source_type, 'items': 0, 'success': 0, 'errors': 0}
+        self.message(f"{msg_prefix} 샤드 #{shard} 시작 ({start_id} ~ {end_id or 'END'})")
+
+        # 샤드 범위를 하나의 커서로 _id 순 배치 조회합니다. (다음 배치 미리 읽기)
+        filters = {**LocationRawCommand._address_target_query(role_date), '_id': id_range}
+        if source_type == 'basic':
+            filters['mgmUpBldrgstPk'] = '0'
+            filters['regstrKindCd'] = {'$ne': '4'}
+
+        with self.replay_mode(replay), ThreadPool(processes=threads) as pool:
+            for items in building_service.manager.driver('mongodb').iterate(filters, batch_size=per_page):
+                results = pool.map(LocationRawCommand._worker_sync_address_task, [
+                    {'item': item, 'source_type': source_type, 'role_date': role_date}
+                    for item in items
+                ])
+
+                stats['items'] += len(items)
+                stats['success'] += sum(1 for r in results if r['success'])
+                for r in results:
+                    if not r['success'] and r.get('error') not in ['Empty newPlatPlc']:
+                        stats['errors'] += 1
+                        self.logger.error(f"❌ PK {r.get('pk')} 에러: {r['error']}")
+
+        self.message(f"✅ {msg_prefix} 샤드 #{shard} 완료: {stats}")
+        return stats
+
+    @staticmethod
+    def _to_id(value: str) -> Any:
+        """payload(JSON)로 전달된 문자열 _id 를 ObjectId 로 복원합니다."""
+        return ObjectId(value) if ObjectId.is_valid(value) else value
+
+
+__all__ = ['LocationAddressShardJob']
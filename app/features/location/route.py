@@ -5,6 +5,8 @@ from app.features.location.boundary.response import BoundaryResponse, Boundaries
 from app.features.location.boundary.request import BoundaryRequest, BoundariesRequest
 from app.features.contracts.response import ResponseDto
 from app.features.location.boundary.controller import BoundaryController
+from app.services.contracts.drivers.keyset import InvalidCursorError
+from app.services.contracts.drivers.projection import InvalidProjectionError
 
 # APIRouter 인스턴스 생성
 router = APIRouter(
@@ -14,7 +16,7 @@ router = APIRouter(
 boundary_controller = BoundaryController()
 
 @router.get('/boundaries', response_model=ResponseDto[BoundariesResponse])
-def get_boundaries(params: BoundariesRequest = Depends()) -> ResponseDto:
+async def get_boundaries(params: BoundariesRequest = Depends()) -> ResponseDto:
     """
     여러 지역의 경계 데이터를 조회하는 엔드포인트.
 
@@ -26,14 +28,17 @@ def get_boundaries(params: BoundariesRequest = Depends()) -> ResponseDto:
     """
     try:
         # Boundary facade를 통해 컨트롤러 접근
-        data = boundary_controller.index(params)
+        data = await boundary_controller.index(params)
         print(data)
         return ResponseDto(data=data)
+    except (InvalidCursorError, InvalidProjectionError) as e:
+        # 잘못된 after 커서 / fields 지정은 클라이언트 요청 오류로 응답합니다.
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get('/boundary', response_model=ResponseDto[BoundaryResponse])
-def get_boundary(params: BoundaryRequest = Depends()) -> ResponseDto:
+async def get_boundary(params: BoundaryRequest = Depends()) -> ResponseDto:
     """
     단일 지역의 경계 데이터를 조회하는 엔드포인트.
 
@@ -45,8 +50,11 @@ def get_boundary(params: BoundaryRequest = Depends()) -> ResponseDto:
     """
     try:
         # Boundary facade를 통해 컨트롤러 접근
-        data = boundary_controller.show(params)
+        data = await boundary_controller.show(params)
         return ResponseDto(data=data)
+    except (InvalidCursorError, InvalidProjectionError) as e:
+        # 잘못된 after 커서 / fields 지정은 클라이언트 요청 오류로 응답합니다.
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
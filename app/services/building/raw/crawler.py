@@ -0,0 +1,215 @@
+import asyncio
+import math
+import httpx
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.helpers.config import Config
+from app.core.helpers.http import Http
+from app.facade import db
+from app.services.building.raw.services.abstract_service import AbstractService
+
+
+class DgkCrawlEngine:
+    """
+    asyncio 기반 건축물대장 동시 수집 엔진
+
+    - 하나의 Semaphore 로 API 동시 요청 수를 제한합니다. (per-API concurrency)
+    - 수집된 페이지는 asyncio.Queue 를 통해 writer 태스크로 전달되고,
+      MongoDB upsert 는 비동기 드라이버(AsyncMongoClient)로 기록되어 네트워크 요청과 같은 이벤트 루프에서 겹쳐서 진행됩니다.
+    - 법정동 처리 순서와 무관하게 '아직 끝나지 않은 가장 앞선 법정동'을 워터마크로 on_watermark 에 전달하여
+      --continue / --renew 이어하기 체크포인트로 사용합니다.
+    """
+
+    def __init__(self, service: AbstractService, concurrency: Optional[int] = None,
+                 per_page: int = 100, max_pages: Optional[int] = None,
+                 on_township_done: Optional[Callable[[Dict[str, Any], int], None]] = None,
+                 on_watermark: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.service = service
+        self.concurrency = max(1, int(concurrency or Config.get('dgk.concurrency', 8)))
+        self.per_page = per_page
+        self.max_pages = max_pages
+        self.on_township_done = on_township_done
+        self.on_watermark = on_watermark
+
+        self.stats = {
+            'townships': 0, 'pages': 0, 'items': 0, 'errors': 0,
+            # content_hash 기반 delta sync 결과
+            'inserted': 0, 'changed': 0, 'unchanged': 0,
+        }
+
+    def run(self, townships: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        법정동 목록을 동시 수집합니다. (동기 호출 진입점)
+
+        Args:
+            townships: {'sigunguCd', 'bjdongCd', 'name'} 형태의 dict 이터러블 (item_code 오름차순)
+        """
+        async def main():
+            try:
+                return await self._run(townships)
+            finally:
+                # 이 이벤트 루프에서 생성한 비동기 MongoDB 연결을 정리합니다.
+                await db.close_async_connections()
+
+        return asyncio.run(main())
+
+    async def _run(self, townships: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        dgk_driver = self.service.manager.driver(self.service.DRIVER_DGK)
+        mongodb_driver = self.service.manager.driver(self.service.DRIVER_MONGODB).async_driver()
+
+        request_slots = asyncio.Semaphore(self.concurrency)
+        township_slots = asyncio.Semaphore(self.concurrency)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        # 워터마크 관리용 상태
+        # - pending_writes: 법정동별 저장 대기 중인 페이지 수
+        # - fetched / failed: 법정동별 조회 완료 / 실패 여부
+        dispatched: List[Dict[str, Any]] = []
+        done_flags: List[bool] = []
+        pending_writes: List[int] = []
+        fetched: List[bool] = []
+        failed: List[bool] = []
+        watermark = {'index': 0}
+
+        def advance_watermark():
+            moved = False
+            while watermark['index'] < len(done_flags) and done_flags[watermark['index']]:
+                watermark['index'] += 1
+                moved = True
+
+            if moved and watermark['index'] < len(dispatched):
+                # 다음 실행 시 이어하기 기준점 (앞선 법정동의 페이지가 모두 저장된 뒤에만 전진)
+                self._emit_watermark(dispatched[watermark['index']]['params'])
+
+        def maybe_complete(index: int):
+            """조회가 끝나고 모든 페이지가 저장(커밋)된 법정동만 완료 처리합니다."""
+            if done_flags[index] or failed[index] or not fetched[index] or pending_writes[index] > 0:
+                return
+
+            done_flags[index] = True
+            self.stats['townships'] += 1
+            advance_watermark()
+
+        async def writer():
+            while True:
+                entry = await write_queue.get()
+                try:
+                    if entry is None:
+                        return
+
+                    index, items = entry
+                    try:
+                        store_stats = await mongodb_driver.store(items)
+                        for key, value in (store_stats or {}).items():
+                            self.stats[key] = self.stats.get(key, 0) + value
+                    except Exception as e:
+                        # 저장에 실패한 법정동은 워터마크를 붙잡아 두어 --continue 시 다시 수집되도록 합니다.
+                        failed[index] = True
+                        self.stats['errors'] += 1
+                        self.service.logger.error(f"[SYNC_STORE_ERROR] | Message: {str(e)} | Count: {len(items)}")
+
+                    pending_writes[index] -= 1
+                    maybe_complete(index)
+                finally:
+                    write_queue.task_done()
+
+        async def fetch(client: httpx.AsyncClient, index: int, params: dict, page: int):
+            async with request_slots:
+                items, total = await dgk_driver.fetch_page_async(client, params, page, self.per_page)
+
+            self.stats['pages'] += 1
+            if items:
+                self.stats['items'] += len(items)
+                pending_writes[index] += 1
+                await write_queue.put((index, items))
+
+            return items, total
+
+        async def crawl_township(client: httpx.AsyncClient, index: int):
+            township = dispatched[index]
+            params = township['params']
+            count = 0
+
+            try:
+                items, total = await fetch(client, index, params, 1)
+                count += len(items)
+
+                if total:
+                    # totalCount 로 마지막 페이지를 계산하여 나머지 페이지를 한 번에 스케줄링
+                    last_page = math.ceil(total / self.per_page)
+                    if self.max_pages:
+                        last_page = min(last_page, self.max_pages)
+
+                    if last_page > 1:
+                        results = await asyncio.gather(*[
+                            fetch(client, index, params, page) for page in range(2, last_page + 1)
+                        ])
+                        count += sum(len(page_items) for page_items, _ in results)
+                else:
+                    # totalCount 미제공 응답: 짧은 페이지가 나올 때까지 순차 조회
+                    page = 1
+                    while len(items) >= self.per_page:
+                        page += 1
+                        items, _ = await fetch(client, index, params, page)
+                        count += len(items)
+
+                fetched[index] = True
+                maybe_complete(index)
+
+                if self.on_township_done:
+                    self.on_township_done(township, count)
+
+            except Exception as e:
+                # 실패한 법정동은 워터마크를 붙잡아 두어 --continue 시 다시 수집되도록 합니다.
+                failed[index] = True
+                self.stats['errors'] += 1
+                self.service.logger.error(
+                    f"[SYNC_STOP_ERROR] | Message: {str(e)} | "
+                    f"Params: sigunguCd={params.get('sigunguCd')}, bjdongCd={params.get('bjdongCd')}"
+                )
+            finally:
+                township_slots.release()
+
+        writer_task = asyncio.create_task(writer())
+
+        async with Http.async_client(max_connections=self.concurrency) as client:
+            tasks = []
+            for township in townships:
+                await township_slots.acquire()
+
+                dispatched.append({
+                    'name': township.get('name'),
+                    'params': {
+                        'sigunguCd': township['sigunguCd'],
+                        'bjdongCd': township['bjdongCd'],
+                        'page': 1,
+                        'per_page': self.per_page,
+                    },
+                })
+                done_flags.append(False)
+                pending_writes.append(0)
+                fetched.append(False)
+                failed.append(False)
+                if len(dispatched) == 1:
+                    self._emit_watermark(dispatched[0]['params'])
+
+                tasks.append(asyncio.create_task(crawl_township(client, len(dispatched) - 1)))
+
+            await asyncio.gather(*tasks)
+
+        await write_queue.put(None)
+        await writer_task
+
+        return self.stats
+
+    def _emit_watermark(self, params: Dict[str, Any]):
+        self.service.logger.info(f"Sync Start: {params}")
+        if self.on_watermark:
+            self.on_watermark({
+                'sigunguCd': params['sigunguCd'],
+                'bjdongCd': params['bjdongCd'],
+                'page': 1,
+            })
+
+
+__all__ = ['DgkCrawlEngine']
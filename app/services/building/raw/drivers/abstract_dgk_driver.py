@@ -1,18 +1,24 @@
 # app/services/building/raw/drivers/abstract_dgk_driver.py
 
+import asyncio
+import httpx
 import requests
-import time
 from abc import ABC, abstractmethod
 from app.core.helpers.config import Config
+from app.core.helpers.http import Http
+from app.core.helpers.response_cache import ResponseCache
+from app.core.packages.support.modules.rate_limiter import QuotaExceededError
+from app.facade import rate_limiter
 from app.services.contracts.drivers.abstract import AbstractDriver
-from typing import List, Any
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import List, Any, Tuple
 
 
 class AbstractDgkDriver(AbstractDriver, ABC):
     _last_raw_response: Any = None
 
+    # 공공데이터포털 일일 트래픽 초과 시 (HTTP 200 + XML 본문) 반환되는 메시지
+    QUOTA_EXCEEDED_MESSAGE = 'LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR'
+
     @property
     @abstractmethod
     def api_path(self) -> str:
@@ -25,45 +31,61 @@ class AbstractDgkDriver(AbstractDriver, ABC):
             'host': Config.get('dgk.host', 'https://apis.data.go.kr'),
         }
 
-    def _call_api(self, params: dict) -> dict:
-        """DGK API 공통 호출 메서드 (Retry 및 Timeout 적용)"""
-        url = f"{self.config['host']}{self.api_path}"
+    # 호출측 페이징/워터마크용 인자로, API 요청 파라미터와 캐시 키에는 넣지 않습니다.
+    NON_API_PARAMS = ('page', 'per_page')
 
-        # 공통 파라미터 설정
-        default_params = {
-            'serviceKey': self.config['service_key'],
+    @classmethod
+    def _api_params(cls, params: dict, page: int, per_page: int) -> dict:
+        """
+        API 요청 파라미터 (서비스 키 제외)
+        동기(_call_api)/비동기(fetch_page_async) 경로가 모두 이 결과로 요청하고 캐시 키를 만들므로 캐시를 공유합니다.
+        """
+        return {
             '_type': 'json',
-            'numOfRows': self.per_page,
-            'pageNo': self.page
+            'numOfRows': per_page,
+            'pageNo': page,
+            **{k: v for k, v in (params or {}).items() if k not in cls.NON_API_PARAMS},
         }
-        request_params = {**default_params, **params}
 
-        # 재시도 전략 설정
-        # total: 최대 재시도 횟수
-        # backoff_factor: 재시도 간격 제어. 2 설정 시 (2, 4, 8초...) 순차 대기
-        # status_forcelist: 재시도할 HTTP 상태 코드 (502 포함)
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,  # 1초 기준이며, 2회차부터 대기 시간이 늘어납니다.
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
+    def _call_api(self, params: dict) -> dict:
+        """DGK API 공통 호출 메서드 (응답 캐시, Rate Limit, Retry 및 Timeout 적용)"""
+        url = f"{self.config['host']}{self.api_path}"
+        api_params = self._api_params(params, self.page, self.per_page)
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        def request() -> bytes:
+            # 쿼터가 소진된 키는 다음 키로 교체하여 재요청합니다.
+            for _ in range(max(len(rate_limiter.keys('dgk', self.config['service_key'])), 1)):
+                service_key = rate_limiter.acquire('dgk', self.config['service_key'])
+                request_params = {**api_params, 'serviceKey': service_key}
 
-        with requests.Session() as session:
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
+                # 공유 커넥션 풀 + 공통 재시도/타임아웃 정책 (app/configs/http.py)
+                response = Http.get(url, params=request_params)
+                rate_limiter.report('dgk', service_key, Http.status_history(response))
+
+                if self.QUOTA_EXCEEDED_MESSAGE in response.text:
+                    rate_limiter.exhaust('dgk', service_key)
+                    continue
 
-            try:
-                # timeout 10초 적용
-                response = session.get(url, params=request_params, timeout=10)
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                # 재시도 끝에 실패하거나 기타 네트워크 에러 발생 시 로그 출력 후 예외 전파
-                print(f"📡 API 호출 실패: {url} | Params: {params} | Error: {e}")
-                raise e
+                return response.content
+
+            raise QuotaExceededError(f"📡 DGK 서비스 키 쿼터 초과: {url}")
+
+        try:
+            # 캐시 적중 시 토큰/쿼터 소모 없이 원본 응답을 재사용합니다.
+            return ResponseCache.fetch('dgk', url, api_params, request, should_cache=self._cacheable)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # 재시도 끝에 실패하거나 기타 네트워크 에러 발생 시 로그 출력 후 예외 전파
+            print(f"📡 API 호출 실패: {url} | Params: {params} | Error: {e}")
+            raise e
+
+    @staticmethod
+    def _cacheable(res: Any) -> bool:
+        """정상 응답(resultCode 00)만 캐시합니다. (HTTP 200 으로 내려오는 API 오류 응답 제외)"""
+        try:
+            return str(res['response']['header']['resultCode']) == '00'
+        except (KeyError, TypeError):
+            return False
 
     def _fetch_raw(self, single: bool = False) -> List[dict]:
         params = self.args or {}
@@ -75,6 +97,10 @@ class AbstractDgkDriver(AbstractDriver, ABC):
         res = self._call_api(params)
         self._last_raw_response = res
 
+        return self._extract_items(res)
+
+    def _extract_items(self, res: dict) -> List[dict]:
+        """API 응답에서 아이템 리스트를 추출합니다. (응답 구조가 다른 API는 오버라이드)"""
         try:
             items_container = res.get('response', {}).get('body', {}).get('items')
             if not items_container or not items_container.get('item'):
@@ -85,15 +111,81 @@ class AbstractDgkDriver(AbstractDriver, ABC):
         except Exception:
             return []
 
-    def _get_total_count(self) -> int:
+    def _extract_total(self, res: dict) -> int:
+        """API 응답에서 totalCount 를 추출합니다."""
         try:
-            if not self._last_raw_response:
+            if not res:
                 return 0
-            body = self._last_raw_response.get('response', {}).get('body', {})
-            total_count = body.get('totalCount', 0)
-            return int(total_count)
-        except (KeyError, TypeError, ValueError):
+            body = res.get('response', {}).get('body', {})
+            return int(body.get('totalCount', 0))
+        except (KeyError, TypeError, ValueError, AttributeError):
             return 0
 
+    async def fetch_page_async(self, client: httpx.AsyncClient, params: dict,
+                               page: int, per_page: int) -> Tuple[List[dict], int]:
+        """
+        비동기 크롤 엔진용 단일 페이지 조회 메서드.
+        드라이버 인스턴스가 싱글톤으로 공유되므로 self.args / self.page 등 상태를 건드리지 않습니다.
+
+        Returns:
+            (items, total_count)
+        """
+        url = f"{self.config['host']}{self.api_path}"
+
+        # 동기 경로와 같은 파라미터 정규화 (page/per_page 인자 제외) → 캐시 키 공유
+        api_params = self._api_params(params, page, per_page)
+        cache_key = ResponseCache.key('dgk', url, api_params)
+        cached = await asyncio.to_thread(ResponseCache.get, 'dgk', cache_key)
+        if cached is not None:
+            res = Http.loads(cached)
+            return self._extract_items(res), self._extract_total(res)
+
+        # _call_api 와 동일한 공통 재시도 정책 (app/configs/http.py)
+        max_retries = int(Config.get('http.retry.total', 3))
+        backoff_factor = float(Config.get('http.retry.backoff_factor', 1))
+        retry_status_codes = Http.retry_status_codes()
+
+        attempt = 0
+        exhausted_keys = 0
+        while True:
+            service_key = await rate_limiter.acquire_async('dgk', self.config['service_key'])
+            request_params = {**api_params, 'serviceKey': service_key}
+
+            try:
+                response = await client.get(url, params=request_params)
+                await asyncio.to_thread(rate_limiter.report, 'dgk', service_key, [response.status_code])
+
+                if response.status_code in retry_status_codes and attempt < max_retries:
+                    await asyncio.sleep(backoff_factor * (2 ** attempt))
+                    attempt += 1
+                    continue
+
+                # 쿼터가 소진된 키는 다음 키로 교체하여 재요청합니다.
+                if self.QUOTA_EXCEEDED_MESSAGE in response.text:
+                    await asyncio.to_thread(rate_limiter.exhaust, 'dgk', service_key)
+                    exhausted_keys += 1
+                    if exhausted_keys >= max(len(rate_limiter.keys('dgk', self.config['service_key'])), 1):
+                        raise QuotaExceededError(f"📡 DGK 서비스 키 쿼터 초과: {url}")
+                    continue
+
+                response.raise_for_status()
+                res = Http.loads(response.content)
+                if self._cacheable(res):
+                    await asyncio.to_thread(ResponseCache.put, 'dgk', cache_key, response.content)
+                return self._extract_items(res), self._extract_total(res)
+            except httpx.TransportError as e:
+                if attempt < max_retries:
+                    await asyncio.sleep(backoff_factor * (2 ** attempt))
+                    attempt += 1
+                    continue
+                print(f"📡 API 호출 실패: {url} | Params: {params} | Page: {page} | Error: {e}")
+                raise e
+            except httpx.HTTPStatusError as e:
+                print(f"📡 API 호출 실패: {url} | Params: {params} | Page: {page} | Error: {e}")
+                raise e
+
+    def _get_total_count(self) -> int:
+        return self._extract_total(self._last_raw_response)
+
     def store(self, items: List[dict]):
         raise NotImplementedError("공공데이터 API 드라이버는 저장 기능을 지원하지 않습니다.")
\ No newline at end of file
@@ -3,4 +3,5 @@ from abc import abstractmethod, ABC
 from app.services.contracts.drivers.abstract_mongodb_driver import AbstractMongodbDriver as AbstractDriver
 
 class AbstractMongodbDriver(AbstractDriver, ABC):
-    pass
\ No newline at end of file
+    # 주간 재수집 시 변경되지 않은 대장 데이터는 다시 쓰지 않습니다.
+    use_content_hash = True
\ No newline at end of file
@@ -1,5 +1,7 @@
 # app/services/building/raw/drivers/title_info/title_info_mongodb.py
-from typing import Collection
+from typing import Collection, List
+
+from pymongo import IndexModel, ASCENDING
 
 from app.services.building.raw.drivers.abstract_mongodb_driver import AbstractMongodbDriver
 from app.services.building.raw.drivers.driver_interface import DriverInterface
@@ -22,4 +24,14 @@ class BasicInfoMongodbDriver(AbstractMongodbDriver, DriverInterface):
         return {
             'mgmBldrgstPk': str,
             'mgmUpBldrgstPk': str
-        }
\ No newline at end of file
+        }
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        return super().indexes + [
+            # 단지 빌드: 주소(bdMgtSn) 기준 기본개요 조회
+            IndexModel([('bdMgtSn', ASCENDING)]),
+            # 주소 동기화: 최상위 기본개요(mgmUpBldrgstPk='0') 중 갱신 주기 도래 대상
+            IndexModel([('updated_at', ASCENDING)], name='updated_at_1_top_level',
+                       partialFilterExpression={'mgmUpBldrgstPk': '0'}),
+        ]
@@ -1,5 +1,7 @@
 
-from typing import Collection
+from typing import Collection, List
+
+from pymongo import IndexModel, ASCENDING
 
 from app.services.building.raw.drivers.abstract_mongodb_driver import AbstractMongodbDriver
 from app.services.building.raw.drivers.driver_interface import DriverInterface
@@ -21,4 +23,12 @@ class GroupInfoMongodbDriver(AbstractMongodbDriver, DriverInterface):
     def convert_types(self) -> dict:
         return {
             'mgmBldrgstPk': str
-        }
\ No newline at end of file
+        }
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        return super().indexes + [
+            # 주소 동기화: 미매핑(bdMgtSn) / 갱신 주기 도래(updated_at) 대상 조회
+            IndexModel([('bdMgtSn', ASCENDING)]),
+            IndexModel([('updated_at', ASCENDING)]),
+        ]
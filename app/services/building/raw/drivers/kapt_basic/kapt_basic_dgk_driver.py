@@ -9,16 +9,8 @@ class KaptBasicDgkDriver(AbstractDgkDriver, DriverInterface):
     def api_path(self) -> str:
         return '/1613000/AptBasisInfoServiceV4/getAphusBassInfoV4'
 
-    def _fetch_raw(self, single: bool = False) -> List[dict]:
-        params = self.args or {}
-
-        if single:
-            self.set_pagination(page=1, per_page=1)
-
-        # _call_api 내부에서 재시도 로직이 동작함
-        res = self._call_api(params)
-        self._last_raw_response = res
-
+    def _extract_items(self, res: dict) -> List[dict]:
+        # K-APT 응답은 body.item 아래에 아이템이 바로 위치합니다.
         try:
             items_container = res.get('response', {}).get('body', {})
             if not items_container or not items_container.get('item'):
@@ -28,4 +20,4 @@ class KaptBasicDgkDriver(AbstractDgkDriver, DriverInterface):
 
             return items if isinstance(items, list) else [items]
         except Exception:
-            return []
\ No newline at end of file
+            return []
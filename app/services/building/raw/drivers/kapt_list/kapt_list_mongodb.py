@@ -1,5 +1,7 @@
 
-from typing import Collection
+from typing import Collection, List
+
+from pymongo import IndexModel, ASCENDING
 
 from app.services.building.raw.drivers.abstract_mongodb_driver import AbstractMongodbDriver
 from app.services.building.raw.drivers.driver_interface import DriverInterface
@@ -21,4 +23,13 @@ class KaptListMongodbDriver(AbstractMongodbDriver, DriverInterface):
     def convert_types(self) -> dict:
         return {
             'kaptCode': str
-        }
\ No newline at end of file
+        }
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        return super().indexes + [
+            # 단지 하위 수집: 수집 플래그(basic/detail) 미완료 / 갱신 주기 도래 대상 조회
+            IndexModel([('basic', ASCENDING)]),
+            IndexModel([('detail', ASCENDING)]),
+            IndexModel([('updated_at', ASCENDING)]),
+        ]
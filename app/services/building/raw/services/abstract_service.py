@@ -1,6 +1,10 @@
+import copy
 from abc import abstractmethod, ABC
-from typing import Optional, List, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Any, Dict, Callable
+from app.core.helpers.config import Config
 from app.services.building.raw.managers.abstract_manager import AbstractManager
+from app.services.contracts.drivers.pagination_planner import PaginationPlanner
 from app.core.helpers.log import Log
 import logging
 
@@ -66,15 +70,17 @@ class AbstractService(ABC):
 
             # PaginationDto 객체에서 total과 items 추출
             items = getattr(dgk_pagination, 'items', [])
-            total = getattr(dgk_pagination, 'total', 0)
+            total = dgk_pagination.meta.total
 
-            if items:
-                self.manager.driver(self.DRIVER_MONGODB).store(items)
+            store_stats = self.manager.driver(self.DRIVER_MONGODB).store(items) if items else {}
 
             return {
                 'total': total,
                 'count': len(items),
-                'page': getattr(dgk_pagination, 'page', 1),
+                'page': dgk_pagination.meta.page,
+                'inserted': store_stats.get('inserted', 0),
+                'changed': store_stats.get('changed', 0),
+                'unchanged': store_stats.get('unchanged', 0),
                 'status': 'success'
             }
 
@@ -88,4 +94,115 @@ class AbstractService(ABC):
             )
             self.logger.error(error_msg)
 
-            raise e
\ No newline at end of file
+            raise e
+
+    def sync_batch_from_dgk(self, params_list: List[Dict[str, Any]], concurrency: Optional[int] = None,
+                            per_page: int = 100) -> Dict[str, Any]:
+        """
+        여러 조회 조건(kaptCode 등)을 동시에 호출하고, 수집된 문서를 한 번의 bulk upsert 로 저장합니다.
+
+        Args:
+            params_list: 조건별 DGK 조회 파라미터 목록 (각 조건의 1페이지만 조회)
+            concurrency: 동시 API 호출 수 (기본: dgk.concurrency)
+            per_page: 조건별 조회 건수
+
+        Returns:
+            {'succeeded': [params, ...], 'failed': [(params, error), ...], 'count', 'inserted', 'changed', 'unchanged'}
+        """
+        concurrency = max(1, int(concurrency or Config.get('dgk.concurrency', 8)))
+        dgk_driver = self.manager.driver(self.DRIVER_DGK)
+
+        def fetch(params: Dict[str, Any]) -> List[dict]:
+            # 드라이버는 싱글톤으로 공유되므로 호출마다 얕은 복사본으로 args/page 상태를 분리합니다.
+            return (
+                copy.copy(dgk_driver)
+                .clear()
+                .set_arguments(dict(params))
+                .set_pagination(page=1, per_page=per_page)
+                .read()
+                .items
+            )
+
+        self.logger.info(f"Sync Batch Start: {len(params_list)}건 (concurrency={concurrency})")
+
+        succeeded, failed, items = [], [], []
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [(params, executor.submit(fetch, params)) for params in params_list]
+            for params, future in futures:
+                try:
+                    items.extend(future.result())
+                    succeeded.append(params)
+                except Exception as e:
+                    failed.append((params, e))
+                    self.logger.error(f"[SYNC_STOP_ERROR] | Message: {str(e)} | Params: {params}")
+
+        # 조건별 응답은 서로 다른 PK 이므로 unordered 로 한 번에 기록합니다.
+        store_stats = self.manager.driver(self.DRIVER_MONGODB).store(items, ordered=False) if items else {}
+
+        return {
+            'succeeded': succeeded,
+            'failed': failed,
+            'count': len(items),
+            'inserted': store_stats.get('inserted', 0),
+            'changed': store_stats.get('changed', 0),
+            'unchanged': store_stats.get('unchanged', 0),
+        }
+
+    def sync_all_pages_from_dgk(self, params: Dict[str, Any], per_page: int = 100, start_page: int = 1,
+                                concurrency: Optional[int] = None,
+                                on_page: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        1페이지의 totalCount 로 전체 페이지를 계산하여 나머지 페이지를 동시에 수집/저장합니다.
+        저장은 BulkWriter 가 백그라운드에서 합쳐 기록하므로 다음 페이지 조회와 겹쳐서 진행됩니다.
+
+        Args:
+            params: DGK 조회 조건 (sigunguCd, bjdongCd 등)
+            per_page: 페이지당 건수
+            start_page: 시작 페이지 (이어하기)
+            concurrency: 동시 페이지 조회 수 (기본: http.page_concurrency)
+            on_page: 페이지 저장(커밋) 완료 시 페이지 순서대로 호출되는 콜백 (page, count)
+        """
+        planner = PaginationPlanner(self.manager.driver(self.DRIVER_DGK), per_page=per_page, concurrency=concurrency)
+        mongodb_driver = self.manager.driver(self.DRIVER_MONGODB)
+
+        total, count, pages = 0, 0, 0
+        current_page = start_page
+
+        def committed(page: int, items_count: int):
+            return lambda: on_page(page, items_count)
+
+        try:
+            with mongodb_driver.bulk_writer() as writer:
+                for current_page, dgk_pagination in planner.pages(params, start_page=start_page):
+                    # 이어하기 기준점 (페이지 순서대로 기록)
+                    self.logger.info(f"Sync Start: {{**params, 'page': current_page, 'per_page': per_page}}")
+
+                    items = dgk_pagination.items
+                    writer.submit(items, on_done=committed(current_page, len(items)) if on_page else None)
+
+                    total = dgk_pagination.meta.total or total
+                    count += len(items)
+                    pages += 1
+
+            write_report = writer.report()
+            store_stats = {key: write_report[key] for key in ('inserted', 'changed', 'unchanged')}
+            self.logger.info(f"Sync Stats: {params} | {write_report}")
+
+            return {
+                'total': total,
+                'count': count,
+                'pages': pages,
+                **store_stats,
+                'status': 'success'
+            }
+
+        except Exception as e:
+            error_msg = (
+                f"[SYNC_STOP_ERROR] | Message: {str(e)} | "
+                f"Params: sigunguCd={params.get('sigunguCd')}, "
+                f"bjdongCd={params.get('bjdongCd')}, "
+                f"page={current_page}"
+            )
+            self.logger.error(error_msg)
+
+            raise e
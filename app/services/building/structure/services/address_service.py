@@ -9,6 +9,7 @@ from app.services.building.structure.handlers.address_dto_handler import Address
 from app.services.building.structure.dtos.address_dto import AddressDto
 from typing import Optional, Dict, Any, List
 from app.core.helpers.log import Log
+from app.services.contracts.drivers.unit_of_work import UnitOfWork
 from datetime import datetime, timedelta
 import time
 
@@ -40,7 +41,11 @@ class AddressService(AbstractService):
     def manager(self) -> AddressManager:
         return self._manager
 
-    def build_by_address_raw(self, address_raw: Dict[str, Any]) -> Optional[AddressDto]:
+    def build_by_address_raw(self, address_raw: Dict[str, Any], uow: Optional[UnitOfWork] = None) -> Optional[AddressDto]:
+        """
+        도로명 주소 원천 데이터로 공간정보가 결합된 주소를 빌드합니다.
+        uow 가 주어지면 좌표/연속지적/주소 문서를 바로 저장하지 않고 UnitOfWork 에 등록하여 배치 단위로 한 번에 기록합니다.
+        """
         now = datetime.now()
         role_date = now - timedelta(days=7)
 
@@ -104,7 +109,7 @@ class AddressService(AbstractService):
                 'bbox': district_boundary.bbox,
                 'page': 1,
                 'per_page': 10
-            })
+            }, uow=uow)
 
             # 🛡️ point_pagination이 None일 경우를 대비한 방어 로직
             if not point_pagination:
@@ -127,12 +132,12 @@ class AddressService(AbstractService):
                     'latitude': float(pt.get('x', 0)),
                     'longitude': float(pt.get('y', 0)),
                     'updated_at': {'$gt': role_date},
-                })
+                }, uow=uow)
 
                 if continuous and 'id' in continuous:
                     continuous_items.append(continuous)
                     pt_item['continuous_id'] = continuous['id']
-                    self._raw_point_geometry_service.manager.mongodb_driver.store([pt_item])
+                    self._store(self._raw_point_geometry_service.manager.mongodb_driver, [pt_item], uow)
 
             dto = self.address_dto_handler.handle(
                 address_raw=address_raw,
@@ -143,7 +148,7 @@ class AddressService(AbstractService):
             )
 
             if dto:
-                self.manager.driver(self.DRIVER_MONGODB).store([dto.dict()])
+                self._store(self.manager.driver(self.DRIVER_MONGODB), [dto.dict()], uow)
 
             return dto
 
@@ -151,6 +156,13 @@ class AddressService(AbstractService):
             Log.get_logger(self.logger_name).error(f"Build Error [{road_address_id}]: {str(e)}", exc_info=True)
             return None
 
+    @staticmethod
+    def _store(driver, items: List[dict], uow: Optional[UnitOfWork] = None):
+        if uow is not None:
+            uow.register(driver, items)
+        else:
+            driver.store(items)
+
     def _get_cache_boundary(self, item_code: str, location_type: str) -> Optional[BoundaryItemDto]:
         if not item_code: return None
         if item_code not in self._boundary_cache:
@@ -12,6 +12,7 @@ from app.services.building.structure.dtos.address_dto import AddressDto
 from app.services.building.structure.dtos.complex_dto import ComplexDto
 from typing import Optional, Dict, Any, List, Union
 from app.core.helpers.log import Log
+from app.services.contracts.drivers.unit_of_work import UnitOfWork
 
 
 class ComplexService(AbstractService):
@@ -47,18 +48,23 @@ class ComplexService(AbstractService):
 
         return self._run_build_pipeline(AddressDto(**address_item))
 
-    def build_by_address(self, address_dto: Union[dict, AddressDto]) -> Optional[ComplexDto]:
+    def build_by_address(self, address_dto: Union[dict, AddressDto], uow: Optional[UnitOfWork] = None) -> Optional[ComplexDto]:
+        """uow 가 주어지면 단지 문서를 바로 저장하지 않고 UnitOfWork 에 등록하여 배치 단위로 한 번에 기록합니다."""
         if isinstance(address_dto, dict):
             address_dto = AddressDto(**address_dto)
-        return self._run_build_pipeline(address_dto)
+        return self._run_build_pipeline(address_dto, uow)
 
-    def _run_build_pipeline(self, address_dto: AddressDto):
+    def _run_build_pipeline(self, address_dto: AddressDto, uow: Optional[UnitOfWork] = None):
         try:
             building_params = {
                 'bdMgtSn': address_dto.building_manage_number,
                 'mgmUpBldrgstPk': '0',
                 'regstrKindCd': {'$in': ['1', '2', '3']},
-                'dead': {'$ne': True}
+                'dead': {'$ne': True},
+                'count': 'none',
+                'item_mode': 'raw',
+                # 대장 종류/PK 만 사용하므로 원본 대장 속성은 조회하지 않습니다.
+                'fields': ['mgmBldrgstPk', 'regstrKindCd']
             }
 
             buildings = self._basic_info_service.get_list(building_params)
@@ -79,7 +85,11 @@ class ComplexService(AbstractService):
                     dto = self.complex_dto_handler.handle(address_dto, complex_type, building)
 
                     if dto:
-                        self.manager.driver(self.DRIVER_MONGODB).store([dto.dict()])
+                        mongodb_driver = self.manager.driver(self.DRIVER_MONGODB)
+                        if uow is not None:
+                            uow.register(mongodb_driver, [dto.dict()])
+                        else:
+                            mongodb_driver.store([dto.dict()])
 
         except Exception as e:
             Log.get_logger(self.logger_name).error(f"Build Pipeline Error [{address_dto.building_manage_number}]: {str(e)}")
@@ -18,6 +18,19 @@ class AbstractDriver(ABC):
     page: int = 1
     per_page: int = 1000
     use_pagination: bool = False
+    # 직전 조회 결과의 다음 페이지 after 커서 (keyset 페이지네이션 지원 드라이버가 설정)
+    next_after: Optional[str] = None
+    # 직전 조회 결과의 다음 페이지 존재 여부 (limit+1 조회를 지원하는 드라이버가 설정, 없으면 total 로 계산)
+    has_next: Optional[bool] = None
+
+    # 조회 결과 행 변환 방식 (조회 인자 'item_mode' 로 호출별 지정)
+    # - validate  : item_type(**row) 생성 + Pagination 검증 (기본, API 응답 등 외부 입력)
+    # - construct : 검증 없이 item_type.construct() 로 생성 (직접 기록한 데이터를 대량으로 읽는 내부 파이프라인)
+    # - raw       : 원본 dict 그대로 반환
+    ITEM_MODE_VALIDATE = 'validate'
+    ITEM_MODE_CONSTRUCT = 'construct'
+    ITEM_MODE_RAW = 'raw'
+    ITEM_MODES = (ITEM_MODE_VALIDATE, ITEM_MODE_CONSTRUCT, ITEM_MODE_RAW)
 
     def set_arguments(self, args: Optional[Dict[str, Any]] = None):
         self.args = args or {}
@@ -36,37 +49,71 @@ class AbstractDriver(ABC):
         self.page = 1
         self.per_page = 1000
         self.use_pagination = False
+        self.next_after = None
+        self.has_next = None
         self.args = {}
         return self
 
-    def build_pagination(self, items: Sequence[Any], total: int) -> Any:
+    def item_mode(self) -> str:
+        """조회 인자 'item_mode' 로 지정한 행 변환 방식 (없으면 validate)"""
+        mode = str(self.arguments('item_mode') or self.ITEM_MODE_VALIDATE).lower()
+        if mode not in self.ITEM_MODES:
+            raise ValueError(f"지원하지 않는 item_mode 입니다: {mode}")
+        return mode
+
+    def make_items(self, rows: Sequence[Any], mode: Optional[str] = None) -> List[Any]:
+        """
+        조회한 행을 item_type 으로 변환합니다.
+        construct 모드는 필드 검증을 건너뛰므로 직접 기록한(이미 검증된) 데이터에만 사용합니다.
+        """
+        mode = mode or self.item_mode()
+        if mode == self.ITEM_MODE_RAW or self.item_type is dict:
+            return list(rows)
+
+        # MongoModel 은 _id 변환만 수행하는 construct_trusted 를 제공합니다.
+        if mode == self.ITEM_MODE_CONSTRUCT:
+            make = getattr(self.item_type, 'construct_trusted', None) or self.item_type.construct
+        else:
+            make = self.item_type
+
+        return [make(**row) if isinstance(row, dict) else row for row in rows]
+
+    def build_pagination(self, items: Sequence[Any], total: Optional[int]) -> Any:
         """
         주어진 데이터를 페이징 객체로 변환합니다.
         제네릭 타입 T를 self.item_type으로 바인딩하여 Pydantic 에러를 방지합니다.
+        item_mode 가 construct / raw 이면 행과 페이징 객체 모두 검증 없이 생성합니다.
         """
-        parsed_items: List[Any] = []
+        # 1. DTO 변환 로직
+        mode = self.item_mode()
+        parsed_items = self.make_items(items, mode)
 
-        for row in items:
-            # 1. DTO 변환 로직 (기존 로직 유지)
-            if self.item_type is not dict and isinstance(row, dict):
-                parsed_items.append(self.item_type(**row))
-            else:
-                parsed_items.append(row)
+        # 2. 페이징 메타 정보 계산 (total 이 None 이면 건수를 세지 않은 조회)
+        if total is None:
+            last_page = None
+        else:
+            last_page = (total + self.per_page - 1) // self.per_page if total > 0 else 1
 
-        # 2. 페이징 메타 정보 계산
-        last_page = (total + self.per_page - 1) // self.per_page if total > 0 else 1
+        has_next = self.has_next
+        if has_next is None and total is not None:
+            has_next = self.page * self.per_page < total
 
         # 3. 중요: Pagination 클래스에 실제 타입을 주입 (Binding)
         # self.item_type이 dict라면 Pagination[dict]가 되고,
         # BoundaryItemDto라면 Pagination[BoundaryItemDto]가 됩니다.
-        bound_pagination_class = Pagination[self.item_type]
-
-        return bound_pagination_class(
-            meta=PaginationMeta(
-                page=self.page,
-                per_page=self.per_page,
-                total=total,
-                last_page=last_page,
-            ),
-            items=parsed_items,
-        )
\ No newline at end of file
+        bound_pagination_class = Pagination[dict if mode == self.ITEM_MODE_RAW else self.item_type]
+
+        meta = {
+            'page': self.page,
+            'per_page': self.per_page,
+            'total': total,
+            'last_page': last_page,
+            'next_after': self.next_after,
+            'has_next': has_next,
+        }
+
+        if mode == self.ITEM_MODE_VALIDATE:
+            return bound_pagination_class(meta=PaginationMeta(**meta), items=parsed_items)
+
+        # 신뢰 모드: 행 목록을 다시 순회하는 root_validator / List[T] 검증을 건너뜁니다.
+        return bound_pagination_class.construct(meta=PaginationMeta.construct(**meta), items=parsed_items)
\ No newline at end of file
@@ -1,12 +1,28 @@
+import hashlib
+import json
 from abc import abstractmethod, ABC
 from app.services.contracts.drivers.abstract import AbstractDriver
-from typing import Any, List, Optional, Tuple, Union
-from pymongo import UpdateOne, ASCENDING, DESCENDING
+from app.services.contracts.drivers.bulk_writer import BulkWriter
+from app.services.contracts.drivers.cursor_stream import CursorStream
+from app.services.contracts.drivers.document_counter import DocumentCounter
+from app.services.contracts.drivers.index_manager import IndexManager
+from app.services.contracts.drivers.keyset import Keyset
+from app.services.contracts.drivers.projection import Projection
+from typing import Any, Dict, List, Optional, Tuple, Union
+from pymongo import UpdateOne, IndexModel, ASCENDING, DESCENDING
 from pymongo.collection import Collection
 from datetime import datetime
 
 
 class AbstractMongodbDriver(AbstractDriver, ABC):
+    # True 로 설정한 드라이버는 content_hash 비교로 변경된 문서만 저장합니다. (delta sync)
+    use_content_hash: bool = False
+
+    # 조회 필터에서 제외할 메타 파라미터 (count: DocumentCounter 모드, fields: Projection, item_mode: 행 변환 방식)
+    META_PARAMS = ('page', 'per_page', 'count', 'fields', 'item_mode')
+
+    CONTENT_HASH_FIELD = 'content_hash'
+    HASH_EXCLUDED_FIELDS = ('_id', 'created_at', 'updated_at', 'content_hash')
 
     @property
     @abstractmethod
@@ -23,34 +39,87 @@ class AbstractMongodbDriver(AbstractDriver, ABC):
     def convert_types(self) -> dict:
         return {}
 
+    @property
+    def indexes(self) -> List[IndexModel]:
+        """
+        드라이버가 사용하는 인덱스 선언 (기본: primary_key unique)
+        조회/조인/갱신 주기 필터에 쓰는 키가 있으면 하위 드라이버에서 super().indexes 에 추가합니다.
+        """
+        return [IndexModel([(self.primary_key, ASCENDING)], unique=True)]
+
+    @property
+    def collection_options(self) -> Dict[str, Any]:
+        """컬렉션 생성 옵션 (기본: database.collection.block_compressor 블록 압축)"""
+        return IndexManager.default_options()
+
+    def index_manager(self) -> IndexManager:
+        """선언된 인덱스/컬렉션 옵션을 실제 DB 와 비교하고 맞추는 IndexManager 를 생성합니다."""
+        return IndexManager(self.collection, self.indexes, self.collection_options)
+
+    def async_driver(self, connection: str = 'mongodb') -> 'AsyncMongodbDriver':
+        """같은 조회/저장 규칙을 AsyncMongoClient 로 실행하는 비동기 드라이버를 생성합니다. (FastAPI 핸들러, asyncio 크롤러용)"""
+        from app.services.contracts.drivers.async_mongodb_driver import AsyncMongodbDriver
+        return AsyncMongodbDriver(self, connection)
+
     def _fetch_raw(self, single: bool = False) -> List[dict]:
+        spec = self._find_spec(single)
+
+        if single:
+            doc = self.collection.find_one(spec['filter'], spec['projection'])
+            return [doc] if doc else []
+
+        cursor = self.collection.find(spec['filter'], spec['projection'])
+        if spec['sort']:
+            cursor = cursor.sort(spec['sort'])
+
+        items = list(cursor.skip(spec['skip']).limit(spec['limit']))
+        return self._page_items(items, spec['sort'])
+
+    def _find_spec(self, single: bool = False) -> Dict[str, Any]:
+        """
+        set_arguments / set_pagination 상태로 find 조건(filter, projection, sort, skip, limit)을 만듭니다.
+        동기 드라이버와 비동기 드라이버(AsyncMongodbDriver)가 같은 조회 규칙을 쓰도록 I/O 와 분리합니다.
+        """
         # 1. 필터 조건 복사 (원본 args 보존)
         filters = (self.args or {}).copy()
 
-        # 2. 메타 파라미터(sort, page, per_page) 추출 및 필터에서 제거
+        # 2. 메타 파라미터(sort, page, per_page, after, count, fields) 추출 및 필터에서 제거
         # self.page와 self.per_page는 이미 부모 클래스나 필드에 존재하므로 필터에서만 제거합니다.
         sort_params = filters.pop('sort', None)
-        filters.pop('page', None)
-        filters.pop('per_page', None)
+        after = filters.pop('after', None)
+        projection = Projection.parse(filters.get('fields'))
+        for key in self.META_PARAMS:
+            filters.pop(key, None)
 
         if single:
-            doc = self.collection.find_one(filters)
-            return [doc] if doc else []
+            return {'filter': filters, 'projection': projection}
 
-        # 3. 쿼리 생성
-        cursor = self.collection.find(filters)
+        # 3. 정렬 처리
+        # 정렬 조건이 있거나 after 커서를 쓰는 경우 _id 를 붙여 순서를 유일하게 만들고 다음 페이지 커서를 발급합니다.
+        formatted_sort = self._format_sort(sort_params)
+        keyset_sort = Keyset.sort_keys(formatted_sort) if formatted_sort or after else None
 
-        # 4. 정렬 처리
-        if sort_params:
-            formatted_sort = self._format_sort(sort_params)
-            if formatted_sort:
-                cursor = cursor.sort(formatted_sort)
+        # 4. 쿼리 생성 (after 커서가 있으면 skip 대신 정렬 키 이후 조건으로 조회)
+        # 다음 페이지 커서를 만들 수 있도록 정렬 키는 projection 에서 빠지지 않게 합니다.
+        if keyset_sort:
+            projection = Projection.ensure(projection, [key for key, _ in keyset_sort])
 
-        # 5. 페이징 처리
-        skip = (self.page - 1) * self.per_page
-        cursor = cursor.skip(skip).limit(self.per_page)
+        # 5. 페이징 처리 (한 건 더 조회하여 건수를 세지 않고도 다음 페이지 여부를 판단)
+        return {
+            'filter': Keyset.apply(filters, keyset_sort, after) if after else filters,
+            'projection': projection,
+            'sort': keyset_sort,
+            'skip': 0 if after else (self.page - 1) * self.per_page,
+            'limit': self.per_page + 1,
+        }
 
-        return list(cursor)
+    def _page_items(self, items: List[dict], keyset_sort: Optional[List[Tuple[str, int]]]) -> List[dict]:
+        """limit+1 로 조회한 결과에서 has_next / next_after 를 기록하고 한 페이지 분량만 반환합니다."""
+        self.has_next = len(items) > self.per_page
+        items = items[:self.per_page]
+
+        self.next_after = Keyset.next_token(items, keyset_sort, self.per_page) if keyset_sort and self.has_next else None
+        return items
 
     def _format_sort(self, sort_params: Any) -> Optional[List[Tuple[str, int]]]:
         if not sort_params:
@@ -70,22 +139,57 @@ class AbstractMongodbDriver(AbstractDriver, ABC):
 
         return formatted if formatted else None
 
-    def _get_total_count(self) -> int:
+    def _get_total_count(self) -> Optional[int]:
+        return DocumentCounter.count(self.collection, *self._count_spec())
+
+    def _count_spec(self) -> Tuple[Dict[str, Any], Optional[str]]:
+        """건수 조회용 (필터, count 모드)"""
         # 카운트 시에도 필터 조건만 남기고 메타 정보는 제거
         filters = (self.args or {}).copy()
-        filters.pop('sort', None)
-        filters.pop('page', None)
-        filters.pop('per_page', None)
-        return self.collection.count_documents(filters)
+        count_mode = filters.pop('count', None)
+        for key in ('sort', 'after', *self.META_PARAMS):
+            filters.pop(key, None)
+        return filters, count_mode
 
-    def store(self, items: List[dict]) -> Any:
-        if not items:
-            return None
+    def iterate(self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 1000, projection: Any = None,
+                sort: Any = None, prefetch: bool = True) -> CursorStream:
+        """
+        조건에 맞는 문서를 하나의 서버 측 커서로 batch_size 건씩 반환하는 이터레이터를 생성합니다. (기본 정렬: _id)
+        projection 은 set_arguments 의 fields 와 같은 형식이며, prefetch 면 다음 배치를 미리 읽어 둡니다.
+        """
+        return CursorStream(
+            self.collection, filters, batch_size=batch_size, projection=Projection.parse(projection),
+            sort=self._format_sort(sort), prefetch=prefetch
+        )
 
-        now = datetime.now()
-        operations = []
+    def bulk_writer(self, **kwargs) -> BulkWriter:
+        """이 드라이버로 배치를 백그라운드에서 합쳐 기록하는 BulkWriter 를 생성합니다."""
+        return BulkWriter(self, **kwargs)
 
-        for item in items:
+    def store(self, items: List[dict], ordered: bool = True) -> Dict[str, int]:
+        """
+        PK 기준 upsert 저장 후 {'inserted', 'changed', 'unchanged'} 건수를 반환합니다.
+        ordered=False 면 unordered bulk_write 로 기록합니다. (PK 가 중복되지 않는 배치에서만 사용)
+        use_content_hash 가 켜진 드라이버는 원천 데이터(content_hash 필드가 없는 신규 수집 행)의
+        해시를 기존 문서와 비교하여 내용이 바뀐 문서만 기록합니다.
+        """
+        prepared = self._prepare_store(items)
+
+        # 변경 감지: 기존 문서의 content_hash 를 한 번에 조회하여 비교
+        existing_hashes = self._fetch_content_hashes([pk for pk, _ in prepared]) if self.use_content_hash else None
+
+        operations, stats = self._store_operations(prepared, existing_hashes)
+        if operations:
+            result = self.collection.bulk_write(operations, ordered=ordered)
+            self._apply_store_result(stats, result, existing_hashes)
+
+        return stats
+
+    def _prepare_store(self, items: List[dict]) -> List[Tuple[Any, dict]]:
+        """타입 변환 후 PK 가 있는 문서만 (pk, item) 목록으로 반환합니다."""
+        prepared = []
+
+        for item in items or []:
             # 1. 타입 변환 처리
             for key, set_type in self.convert_types.items():
                 if key in item and item[key] is not None:
@@ -96,12 +200,39 @@ class AbstractMongodbDriver(AbstractDriver, ABC):
             if not pk:
                 continue
 
-            # 3. 🚀 핵심: 전처리
+            prepared.append((pk, item))
+
+        return prepared
+
+    def _store_operations(self, prepared: List[Tuple[Any, dict]],
+                          existing_hashes: Optional[Dict[Any, Optional[str]]]) -> Tuple[List[UpdateOne], Dict[str, int]]:
+        """upsert 연산 목록과 (content_hash 비교 기준) 건수를 만듭니다."""
+        stats = {'inserted': 0, 'changed': 0, 'unchanged': 0}
+        now = datetime.now()
+
+        operations = []
+        for pk, item in prepared:
+            # 🚀 핵심: 전처리
             # 들어온 데이터에 혹시 created_at이 있다면 제거합니다.
             # (이유: 업데이트 시 기존 DB에 있는 진짜 생성 날짜를 지키기 위해)
             update_data = item.copy()
             update_data.pop('created_at', None)
 
+            if existing_hashes is not None and self.CONTENT_HASH_FIELD in update_data:
+                # DB 에서 읽어 와 필드를 덧붙인 문서(플래그/주소 매핑 등)는 원천 데이터 해시를 유지한 채 그대로 기록
+                stats['changed'] += 1
+            elif existing_hashes is not None:
+                content_hash = self.content_hash(update_data)
+                if pk not in existing_hashes:
+                    stats['inserted'] += 1
+                elif existing_hashes[pk] == content_hash:
+                    # 내용이 같으면 쓰기(및 updated_at 갱신)를 생략합니다.
+                    stats['unchanged'] += 1
+                    continue
+                else:
+                    stats['changed'] += 1
+                update_data[self.CONTENT_HASH_FIELD] = content_hash
+
             # updated_at은 언제나 현재 시간
             update_data['updated_at'] = now
 
@@ -119,7 +250,49 @@ class AbstractMongodbDriver(AbstractDriver, ABC):
                 upsert=True
             ))
 
-        if operations:
-            return self.collection.bulk_write(operations)
+        return operations, stats
+
+    @staticmethod
+    def _apply_store_result(stats: Dict[str, int], result: Any,
+                            existing_hashes: Optional[Dict[Any, Optional[str]]]):
+        # content_hash 비교를 하지 않은 경우 bulk_write 결과로 건수를 채웁니다.
+        if existing_hashes is None:
+            stats['inserted'] = result.upserted_count
+            stats['changed'] = result.matched_count
+
+    def update_by_keys(self, keys: List[Any], values: Dict[str, Any]) -> int:
+        """
+        PK 목록에 해당하는 문서들에 같은 값을 한 번의 update_many 로 기록합니다. (플래그 일괄 갱신용)
+        content_hash 는 건드리지 않으므로 원천 데이터 변경 감지에 영향을 주지 않습니다.
+        """
+        if not keys:
+            return 0
+
+        result = self.collection.update_many(*self._update_by_keys_spec(keys, values))
+        return result.modified_count
+
+    def _update_by_keys_spec(self, keys: List[Any], values: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return (
+            {self.primary_key: {'$in': list(keys)}},
+            {'$set': {**values, 'updated_at': datetime.now()}}
+        )
+
+    def _fetch_content_hashes(self, pks: List[Any]) -> Dict[Any, Optional[str]]:
+        """PK 목록에 해당하는 기존 문서의 content_hash 를 조회합니다."""
+        if not pks:
+            return {}
+
+        cursor = self.collection.find(*self._content_hash_spec(pks))
+        return {doc.get(self.primary_key): doc.get(self.CONTENT_HASH_FIELD) for doc in cursor}
+
+    def _content_hash_spec(self, pks: List[Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        return (
+            {self.primary_key: {'$in': pks}},
+            {self.primary_key: 1, self.CONTENT_HASH_FIELD: 1, '_id': 0}
+        )
 
-        return None
\ No newline at end of file
+    def content_hash(self, item: dict) -> str:
+        """메타 필드(_id, created_at, updated_at, content_hash)를 제외한 문서 내용의 해시값"""
+        payload = {k: v for k, v in item.items() if k not in self.HASH_EXCLUDED_FIELDS}
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(serialized.encode('utf-8'), digest_size=16).hexdigest()
@@ -0,0 +1,144 @@
+import copy
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from pymongo.errors import CursorNotFound
+
+from app.core.helpers.log import Log
+from app.facade import db
+from app.services.contracts.drivers.abstract import AbstractDriver
+from app.services.contracts.drivers.document_counter import DocumentCounter
+from app.services.contracts.drivers.keyset import Keyset
+from app.services.contracts.drivers.projection import Projection
+
+
+class AsyncMongodbDriver(AbstractDriver):
+    """
+    AbstractMongodbDriver 의 조회/저장 규칙을 pymongo AsyncMongoClient 로 실행하는 비동기 드라이버
+
+    - 조회 조건(keyset/projection/count 모드)과 upsert/content_hash 규칙은 원본 드라이버의 *_spec 메서드로 만들고 I/O 만 await 합니다.
+    - 조회마다 원본 드라이버의 복사본에 조건을 고정하므로, await 사이에 다른 요청이 조건을 바꿔도 결과가 섞이지 않습니다.
+    - AsyncMongoClient 는 이벤트 루프별로 생성되므로 FastAPI 핸들러 / asyncio 크롤러 안에서 사용합니다.
+
+    Usage:
+        async_driver = manager.driver('mongodb').async_driver()
+        pagination = await async_driver.clear().set_arguments({...}).set_pagination(1, 100).read()
+        await async_driver.store(items, ordered=False)
+    """
+
+    def __init__(self, driver, connection: str = 'mongodb'):
+        self.driver = driver
+        self.connection = connection
+        self.item_type = driver.item_type
+
+    @property
+    def primary_key(self) -> str:
+        return self.driver.primary_key
+
+    @property
+    def collection(self):
+        """원본 드라이버와 같은 데이터베이스/컬렉션의 AsyncCollection"""
+        collection = self.driver.collection
+        return db.get_async_mongodb_driver(self.connection) \
+            .get_database(collection.database.name) \
+            .get_collection(collection.name, codec_options=collection.codec_options)
+
+    def _snapshot(self):
+        """현재 조회 조건을 고정한 원본 드라이버 복사본"""
+        driver = copy.copy(self.driver)
+        driver.args = dict(self.args or {})
+        driver.page = self.page
+        driver.per_page = self.per_page
+        driver.use_pagination = self.use_pagination
+        driver.next_after = None
+        driver.has_next = None
+        return driver
+
+    async def read(self) -> Any:
+        """목록 조회 및 페이징 처리된 결과를 반환합니다."""
+        driver = self._snapshot()
+        collection = self.collection
+        spec = driver._find_spec()
+
+        cursor = collection.find(spec['filter'], spec['projection'])
+        if spec['sort']:
+            cursor = cursor.sort(spec['sort'])
+
+        items = driver._page_items(await cursor.skip(spec['skip']).limit(spec['limit']).to_list(None), spec['sort'])
+        total = await DocumentCounter.count_async(collection, *driver._count_spec())
+
+        self.next_after, self.has_next = driver.next_after, driver.has_next
+        return driver.build_pagination(items=items, total=total)
+
+    async def read_one(self) -> Optional[dict]:
+        """단일 항목을 조회합니다."""
+        spec = self._snapshot()._find_spec(single=True)
+        return await self.collection.find_one(spec['filter'], spec['projection'])
+
+    async def iterate(self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 1000,
+                      projection: Any = None, sort: Any = None) -> AsyncIterator[List[dict]]:
+        """
+        조건에 맞는 문서를 하나의 커서로 batch_size 건씩 반환합니다. (CursorStream 의 비동기 버전, 기본 정렬: _id)
+        배치 처리가 길어 커서가 만료되면 마지막으로 읽은 문서의 정렬 키 이후부터 다시 엽니다.
+        """
+        sort = Keyset.sort_keys(self.driver._format_sort(sort))
+        projection = Projection.ensure(Projection.parse(projection), [key for key, _ in sort])
+        batch_size = max(1, int(batch_size))
+        collection = self.collection
+        # 재개 시에도 아직 반환하지 않은 문서를 유지하도록 batch 는 재시도 루프 밖에서 만듭니다.
+        batch: List[dict] = []
+        after: Optional[str] = None
+
+        while True:
+            cursor = collection.find(Keyset.apply(dict(filters or {}), sort, after), projection,
+                                     sort=sort, batch_size=batch_size)
+            try:
+                async for doc in cursor:
+                    batch.append(doc)
+                    if len(batch) >= batch_size:
+                        after = Keyset.token(batch[-1], sort)
+                        yield batch
+                        batch = []
+
+                if batch:
+                    yield batch
+                return
+
+            except CursorNotFound:
+                if batch:
+                    after = Keyset.token(batch[-1], sort)
+                Log.get_logger('mongodb').warning(f"[AsyncMongodbDriver] {collection.name} 커서 만료 → 재개")
+
+            finally:
+                await cursor.close()
+
+    async def store(self, items: List[dict], ordered: bool = True) -> Dict[str, int]:
+        """AbstractMongodbDriver.store() 와 같은 규칙으로 PK 기준 upsert 저장합니다."""
+        driver = self.driver
+        collection = self.collection
+        prepared = driver._prepare_store(items)
+
+        existing_hashes = None
+        if driver.use_content_hash:
+            existing_hashes = {}
+            pks = [pk for pk, _ in prepared]
+            if pks:
+                async for doc in collection.find(*driver._content_hash_spec(pks)):
+                    existing_hashes[doc.get(driver.primary_key)] = doc.get(driver.CONTENT_HASH_FIELD)
+
+        operations, stats = driver._store_operations(prepared, existing_hashes)
+        if operations:
+            result = await collection.bulk_write(operations, ordered=ordered)
+            driver._apply_store_result(stats, result, existing_hashes)
+
+        return stats
+
+    async def update_by_keys(self, keys: List[Any], values: Dict[str, Any]) -> int:
+        """PK 목록에 해당하는 문서들에 같은 값을 한 번의 update_many 로 기록합니다."""
+        if not keys:
+            return 0
+
+        result = await self.collection.update_many(*self.driver._update_by_keys_spec(keys, values))
+        return result.modified_count
+
+
+__all__ = ['AsyncMongodbDriver']
@@ -0,0 +1,170 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.helpers.config import Config
+from app.core.helpers.log import Log
+
+
+class BulkWriter:
+    """
+    MongoDB 드라이버용 백그라운드 bulk writer
+
+    - submit() 으로 받은 배치를 별도 스레드에서 기록하므로, 호출측은 저장을 기다리지 않고 다음 페이지를 조회합니다.
+    - 대기 중인 배치를 coalesce_size 건까지 합쳐 하나의 unordered bulk_write 로 기록합니다.
+      (같은 PK 가 여러 배치에 있으면 마지막 배치의 값만 남깁니다.)
+    - 큐 크기를 max_pending 배치로 제한하여, writer 가 밀리면 submit() 이 블록되어 조회 속도를 늦춥니다. (backpressure)
+    - 배치별 on_done 콜백은 해당 배치가 실제로 기록된 뒤 제출 순서대로 호출되므로 체크포인트 저장에 사용할 수 있습니다.
+    - 한 번 기록에 실패하면 이후 배치는 기록하지 않고 콜백도 호출하지 않으며, submit/flush/close 가 같은 예외를 계속 발생시킵니다.
+
+    Usage:
+        with mongodb_driver.bulk_writer() as writer:
+            writer.submit(items, on_done=lambda: ...)
+        writer.report()  # 누적 건수 및 쓰기 지연 시간
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, driver, max_pending: Optional[int] = None, coalesce_size: Optional[int] = None):
+        self.driver = driver
+        self.logger = Log.get_logger('mongodb')
+        self.max_pending = int(max_pending or Config.get('database.bulk_writer.max_pending', 8))
+        self.coalesce_size = int(coalesce_size or Config.get('database.bulk_writer.coalesce_size', 5000))
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+        self.stats = {'items': 0, 'writes': 0, 'inserted': 0, 'changed': 0, 'unchanged': 0}
+        self._latency = {'total': 0.0, 'max': 0.0}
+
+    def __enter__(self) -> 'BulkWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 본문에서 예외가 난 경우에도 writer 스레드는 정리하되, 원래 예외를 가리지 않습니다.
+        self.close(raise_error=exc_type is None)
+
+    def submit(self, items: List[dict], on_done: Optional[Callable[[], None]] = None):
+        """
+        배치를 기록 대기열에 넣습니다. 대기열이 가득 차면 writer 가 따라잡을 때까지 블록됩니다.
+
+        Raises:
+            이전 배치 기록 중 발생한 예외
+        """
+        self._raise_error()
+        self._ensure_started()
+        self._queue.put((list(items or []), on_done))
+
+    def flush(self) -> Dict[str, Any]:
+        """지금까지 제출된 배치가 모두 기록될 때까지 기다린 뒤 누적 통계를 반환합니다."""
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+        return self.report()
+
+    def close(self, raise_error: bool = True) -> Dict[str, Any]:
+        """남은 배치를 모두 기록하고 writer 스레드를 종료합니다."""
+        if self._thread is not None:
+            self._queue.put(self._SENTINEL)
+            self._thread.join()
+            self._thread = None
+
+        report = self.report()
+        self.logger.info(f"[BulkWriter] {self.driver.__class__.__name__} | {report}")
+
+        if raise_error:
+            self._raise_error()
+        return report
+
+    def report(self) -> Dict[str, Any]:
+        """누적 기록 건수와 bulk_write 지연 시간(ms)"""
+        writes = self.stats['writes']
+        return {
+            **self.stats,
+            'avg_ms': round(self._latency['total'] / writes * 1000, 1) if writes else 0,
+            'max_ms': round(self._latency['max'] * 1000, 1),
+        }
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"bulk-writer-{self.driver.__class__.__name__}", daemon=True
+            )
+            self._thread.start()
+
+    def _raise_error(self):
+        # 실패 상태는 유지합니다. (지우면 writer 스레드가 이후 배치를 다시 기록하고 체크포인트 콜백을 호출함)
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        stop = False
+        while not stop:
+            entry = self._queue.get()
+            if entry is self._SENTINEL:
+                self._queue.task_done()
+                return
+
+            # 대기 중인 배치를 coalesce_size 까지 합칩니다.
+            group: List[Tuple[List[dict], Optional[Callable[[], None]]]] = [entry]
+            size = len(entry[0])
+            while size < self.coalesce_size:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if entry is self._SENTINEL:
+                    self._queue.task_done()
+                    stop = True
+                    break
+
+                group.append(entry)
+                size += len(entry[0])
+
+            try:
+                self._write(group)
+            except Exception as e:
+                self._fail(e)
+            finally:
+                for _ in group:
+                    self._queue.task_done()
+
+    def _write(self, group: List[Tuple[List[dict], Optional[Callable[[], None]]]]):
+        # 기록에 실패한 뒤로는 남은 배치의 저장과 콜백(체크포인트 저장 등)을 모두 건너뜁니다.
+        if self._error is not None:
+            return
+
+        # 같은 PK 는 마지막 배치의 값만 남깁니다. (unordered 실행 시 중복 upsert 경합 방지)
+        merged: Dict[Any, dict] = {}
+        for items, _ in group:
+            for item in items:
+                pk = item.get(self.driver.primary_key)
+                if pk:
+                    merged[pk] = item
+
+        if merged:
+            started = time.perf_counter()
+            store_stats = self.driver.store(list(merged.values()), ordered=False)
+            elapsed = time.perf_counter() - started
+
+            for key, value in (store_stats or {}).items():
+                self.stats[key] = self.stats.get(key, 0) + value
+            self.stats['items'] += len(merged)
+            self.stats['writes'] += 1
+            self._latency['total'] += elapsed
+            self._latency['max'] = max(self._latency['max'], elapsed)
+
+        for _, on_done in group:
+            if on_done:
+                on_done()
+
+    def _fail(self, error: Exception):
+        if self._error is None:
+            self._error = error
+        self.logger.error(f"[BulkWriter] {self.driver.__class__.__name__} 기록 실패: {str(error)}")
+
+
+__all__ = ['BulkWriter']
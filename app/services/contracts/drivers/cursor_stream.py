@@ -0,0 +1,125 @@
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pymongo.collection import Collection
+from pymongo.errors import CursorNotFound
+
+from app.core.helpers.log import Log
+from app.services.contracts.drivers.keyset import Keyset
+from app.services.contracts.drivers.projection import Projection
+
+
+class CursorStream:
+    """
+    하나의 서버 측 커서로 조회 결과를 배치(list) 단위로 흘려보내는 이터레이터
+
+    - 페이지마다 쿼리(+count)를 다시 보내는 read() 반복 대신, find() 커서 하나를 끝까지 읽습니다.
+    - prefetch 가 켜져 있으면 별도 스레드가 다음 배치를 미리 읽어 두므로, 호출측이 현재 배치를 처리하는 동안 조회가 겹쳐 진행됩니다.
+    - 배치 처리가 길어 서버 커서가 만료(CursorNotFound)되면 마지막으로 읽은 문서의 정렬 키 이후부터 커서를 다시 엽니다. (keyset)
+
+    Usage:
+        for batch in mongodb_driver.iterate({'dead': {'$ne': True}}, batch_size=1000, projection=['_id', 'bdMgtSn']):
+            ...
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, collection: Collection, filters: Optional[Dict[str, Any]] = None, batch_size: int = 1000,
+                 projection: Optional[Dict[str, int]] = None, sort: Optional[List[Tuple[str, int]]] = None,
+                 prefetch: bool = True):
+        self.collection = collection
+        self.filters = dict(filters or {})
+        self.batch_size = max(1, int(batch_size))
+        # 커서 재개를 위해 정렬 끝에 _id 를 붙이고, 정렬 키는 projection 에서 빠지지 않게 합니다.
+        self.sort = Keyset.sort_keys(sort)
+        self.projection = Projection.ensure(projection, [key for key, _ in self.sort])
+        self.prefetch = prefetch
+        self.logger = Log.get_logger('mongodb')
+
+        self.stats = {'batches': 0, 'items': 0, 'reopened': 0}
+
+    def __iter__(self) -> Iterator[List[dict]]:
+        if not self.prefetch:
+            return self._batches()
+        return self._prefetched()
+
+    def _batches(self) -> Iterator[List[dict]]:
+        batch: List[dict] = []
+        after: Optional[str] = None
+
+        while True:
+            cursor = self.collection.find(
+                Keyset.apply(self.filters, self.sort, after), self.projection,
+                sort=self.sort, batch_size=self.batch_size
+            )
+            try:
+                for doc in cursor:
+                    batch.append(doc)
+                    if len(batch) >= self.batch_size:
+                        after = Keyset.token(batch[-1], self.sort)
+                        yield self._emit(batch)
+                        batch = []
+
+                if batch:
+                    yield self._emit(batch)
+                return
+
+            except CursorNotFound:
+                # 배치 처리 중 커서가 만료됨 → 마지막으로 읽은 문서 이후부터 다시 엽니다.
+                if batch:
+                    after = Keyset.token(batch[-1], self.sort)
+                self.stats['reopened'] += 1
+                self.logger.warning(f"[CursorStream] {self.collection.name} 커서 만료 → 재개 ({self.stats['items']}건 이후)")
+
+            finally:
+                cursor.close()
+
+    def _prefetched(self) -> Iterator[List[dict]]:
+        # 다음 배치 1개만 미리 읽어 두어 메모리 사용량을 제한합니다.
+        buffer: queue.Queue = queue.Queue(maxsize=1)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for batch in self._batches():
+                    while not stop.is_set():
+                        try:
+                            buffer.put(batch, timeout=0.5)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+                buffer.put(self._SENTINEL)
+            except BaseException as e:
+                buffer.put(e)
+
+        thread = threading.Thread(target=produce, name=f"cursor-stream-{self.collection.name}", daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                entry = buffer.get()
+                if entry is self._SENTINEL:
+                    return
+                if isinstance(entry, BaseException):
+                    raise entry
+                yield entry
+        finally:
+            # 호출측이 중간에 반복을 멈춘 경우에도 조회 스레드를 정리합니다.
+            stop.set()
+            while thread.is_alive():
+                try:
+                    buffer.get_nowait()
+                except queue.Empty:
+                    pass
+                thread.join(timeout=0.1)
+
+    def _emit(self, batch: List[dict]) -> List[dict]:
+        self.stats['batches'] += 1
+        self.stats['items'] += len(batch)
+        return batch
+
+
+__all__ = ['CursorStream']
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo.collection import Collection
+
+from app.core.helpers.config import Config
+
+
+class DocumentCounter:
+    """
+    목록 조회 시 전체 건수(total) 계산 방식을 선택하는 헬퍼
+
+    - exact     : count_documents(filter) (기존 동작, 필터가 크면 인덱스/컬렉션 전체 스캔)
+    - estimated : 필터가 없으면 컬렉션 메타데이터 기반 estimated_document_count(), 필터가 있으면 cached 로 대체
+    - cached    : (컬렉션, 필터)별 count_documents 결과를 TTL 동안 프로세스 메모리에 보관하여 재사용
+    - none      : 건수를 세지 않음 (total=None, 다음 페이지 여부는 드라이버가 limit+1 조회로 has_next 에 기록)
+
+    모드는 조회 인자 'count' 또는 드라이버의 count_mode 로 지정하며, 없으면 database.count.mode 설정을 따릅니다.
+    """
+    EXACT = 'exact'
+    ESTIMATED = 'estimated'
+    CACHED = 'cached'
+    NONE = 'none'
+
+    MODES = (EXACT, ESTIMATED, CACHED, NONE)
+
+    # 캐시 키 수가 이 값을 넘으면 만료된 항목을 정리하고, 그래도 넘으면 전체를 비웁니다.
+    MAX_CACHE_SIZE = 1024
+
+    _cache: Dict[str, Tuple[float, int]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def resolve_mode(mode: Optional[str] = None) -> str:
+        mode = str(mode or Config.get('database.count.mode', DocumentCounter.EXACT) or DocumentCounter.EXACT).lower()
+        if mode not in DocumentCounter.MODES:
+            raise ValueError(f"지원하지 않는 count 모드입니다: {mode}")
+        return mode
+
+    @staticmethod
+    def count(collection: Collection, filters: Optional[Dict[str, Any]] = None,
+              mode: Optional[str] = None) -> Optional[int]:
+        """모드에 따라 전체 건수를 반환합니다. (none 모드는 None)"""
+        filters = filters or {}
+        mode = DocumentCounter.resolve_mode(mode)
+
+        if mode == DocumentCounter.NONE:
+            return None
+
+        if mode == DocumentCounter.ESTIMATED and not filters:
+            return collection.estimated_document_count()
+
+        if mode in (DocumentCounter.ESTIMATED, DocumentCounter.CACHED):
+            return DocumentCounter._cached_count(collection, filters)
+
+        return collection.count_documents(filters)
+
+    @staticmethod
+    async def count_async(collection: Any, filters: Optional[Dict[str, Any]] = None,
+                          mode: Optional[str] = None) -> Optional[int]:
+        """count() 의 비동기 버전 (AsyncCollection 용, cached 모드 캐시는 동기 조회와 공유)"""
+        filters = filters or {}
+        mode = DocumentCounter.resolve_mode(mode)
+
+        if mode == DocumentCounter.NONE:
+            return None
+
+        if mode == DocumentCounter.ESTIMATED and not filters:
+            return await collection.estimated_document_count()
+
+        if mode in (DocumentCounter.ESTIMATED, DocumentCounter.CACHED):
+            key = DocumentCounter._cache_key(collection, filters)
+            total = DocumentCounter._cache_get(key)
+            if total is None:
+                total = await collection.count_documents(filters)
+                DocumentCounter._cache_put(key, total)
+            return total
+
+        return await collection.count_documents(filters)
+
+    @staticmethod
+    def invalidate(collection: Optional[Collection] = None):
+        """캐시된 건수를 비웁니다. (collection 을 지정하면 해당 컬렉션만)"""
+        with DocumentCounter._lock:
+            if collection is None:
+                DocumentCounter._cache.clear()
+                return
+
+            prefix = f"{collection.full_name}:"
+            for key in [key for key in DocumentCounter._cache if key.startswith(prefix)]:
+                del DocumentCounter._cache[key]
+
+    @staticmethod
+    def _cached_count(collection: Collection, filters: Dict[str, Any]) -> int:
+        key = DocumentCounter._cache_key(collection, filters)
+        total = DocumentCounter._cache_get(key)
+        if total is None:
+            total = collection.count_documents(filters)
+            DocumentCounter._cache_put(key, total)
+        return total
+
+    @staticmethod
+    def _cache_key(collection: Any, filters: Dict[str, Any]) -> str:
+        return f"{collection.full_name}:{json.dumps(filters, sort_keys=True, ensure_ascii=False, default=str)}"
+
+    @staticmethod
+    def _cache_get(key: str) -> Optional[int]:
+        ttl = float(Config.get('database.count.ttl', 300))
+        with DocumentCounter._lock:
+            cached = DocumentCounter._cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _cache_put(key: str, total: int):
+        ttl = float(Config.get('database.count.ttl', 300))
+        now = time.monotonic()
+
+        with DocumentCounter._lock:
+            if len(DocumentCounter._cache) >= DocumentCounter.MAX_CACHE_SIZE:
+                expired = [k for k, (at, _) in DocumentCounter._cache.items() if now - at >= ttl]
+                for k in expired:
+                    del DocumentCounter._cache[k]
+                if len(DocumentCounter._cache) >= DocumentCounter.MAX_CACHE_SIZE:
+                    DocumentCounter._cache.clear()
+            DocumentCounter._cache[key] = (now, total)
+
+
+__all__ = ['DocumentCounter']
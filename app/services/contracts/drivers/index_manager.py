@@ -0,0 +1,179 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from pymongo import IndexModel
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from app.core.helpers.config import Config
+
+
+class IndexManager:
+    """
+    드라이버가 선언한 인덱스/컬렉션 옵션을 실제 DB 와 비교(diff)하고 맞추는(ensure) 헬퍼
+
+    - 인덱스는 이름 기준으로 비교하며, 키 순서/방향과 주요 옵션(unique, sparse, partialFilterExpression,
+      expireAfterSeconds)이 다르면 changed 로 분류합니다.
+    - 블록 압축(block_compressor)은 컬렉션 생성 시에만 지정할 수 있으므로, 없는 컬렉션은 선언된 옵션으로 생성하고
+      이미 있는 컬렉션은 불일치 여부만 보고합니다. (적용하려면 재적재 필요)
+    """
+
+    # 비교 대상 인덱스 옵션
+    OPTION_KEYS = ('unique', 'sparse', 'partialFilterExpression', 'expireAfterSeconds')
+
+    # rebuild 시 새 정의를 먼저 만들어 볼 임시 인덱스 이름 접미사
+    REBUILD_SUFFIX = '__rebuild'
+
+    # 같은 키의 인덱스가 이미 있어 임시 인덱스를 만들 수 없는 경우 (IndexOptionsConflict, IndexKeySpecsConflict)
+    CONFLICT_CODES = (85, 86)
+
+    def __init__(self, collection: Collection, indexes: List[IndexModel], options: Optional[Dict[str, Any]] = None):
+        self.collection = collection
+        self.indexes = indexes
+        self.options = options or {}
+
+    @staticmethod
+    def default_options() -> Dict[str, Any]:
+        """database.collection.block_compressor 설정 기반 컬렉션 생성 옵션 (기본 zstd)"""
+        compressor = Config.get('database.collection.block_compressor', 'zstd')
+        if not compressor:
+            return {}
+        return {'storageEngine': {'wiredTiger': {'configString': f"block_compressor={compressor}"}}}
+
+    def diff(self) -> Dict[str, Any]:
+        """선언과 실제 DB 의 차이를 반환합니다."""
+        exists = self.collection.name in self.collection.database.list_collection_names(
+            filter={'name': self.collection.name})
+        live = self.collection.index_information() if exists else {}
+        declared = {model.document['name']: model.document for model in self.indexes}
+
+        report = {
+            'collection': self.collection.full_name,
+            'exists': exists,
+            'ok': [], 'missing': [], 'changed': [],
+            # _id 기본 인덱스는 선언 대상이 아닙니다.
+            'extra': [name for name in live
+                      if name not in declared and name != '_id_' and not name.endswith(self.REBUILD_SUFFIX)],
+            'compressor': {
+                'declared': self._compressor(self.options),
+                'live': self._live_compressor() if exists else None,
+            },
+        }
+
+        for name, document in declared.items():
+            if name not in live:
+                report['missing'].append(name)
+            elif self._normalize(document) != self._normalize(live[name]):
+                report['changed'].append(name)
+            else:
+                report['ok'].append(name)
+
+        compressor = report['compressor']
+        compressor['match'] = not compressor['declared'] or compressor['declared'] == compressor['live']
+        return report
+
+    def ensure(self, rebuild: bool = False, drop_extra: bool = False) -> Dict[str, Any]:
+        """
+        없는 컬렉션은 선언된 옵션으로 생성하고 누락된 인덱스를 만듭니다.
+        rebuild 면 정의가 바뀐 인덱스를 새 정의로 교체하고(_rebuild), drop_extra 면 선언되지 않은 인덱스를 삭제합니다.
+        인덱스별 생성 실패(중복 키로 인한 unique 생성 실패 등)는 errors 에 기록하고 나머지를 계속 진행합니다.
+        """
+        report = self.diff()
+        result = {**report, 'created': [], 'rebuilt': [], 'dropped': [], 'errors': {}}
+
+        if not report['exists']:
+            self.collection.database.create_collection(self.collection.name, **self.options)
+
+        declared = {model.document['name']: model for model in self.indexes}
+
+        for name in report['changed'] if rebuild else []:
+            try:
+                self._rebuild(name, declared[name])
+                result['rebuilt'].append(name)
+            except OperationFailure as e:
+                result['errors'][name] = str(e)
+
+        for name in report['missing']:
+            try:
+                self.collection.create_indexes([declared[name]])
+                result['created'].append(name)
+            except OperationFailure as e:
+                result['errors'][name] = str(e)
+
+        for name in report['extra'] if drop_extra else []:
+            self.collection.drop_index(name)
+            result['dropped'].append(name)
+
+        return result
+
+    def _rebuild(self, name: str, model: IndexModel):
+        """
+        정의가 바뀐 인덱스를 교체합니다. (실패해도 기존 인덱스가 남도록 처리)
+
+        1) 새 정의를 임시 이름으로 먼저 생성합니다. 중복 키로 unique 생성이 실패하는 등 빌드가 실패하면
+           기존 인덱스를 그대로 두고 예외를 올립니다.
+        2) 빌드가 확인되면 기존/임시 인덱스를 지우고 선언된 이름으로 생성합니다. (인덱스 이름은 변경할 수 없음)
+           이 단계에서 생성이 실패하면 기존 정의로 되돌립니다.
+        기존 인덱스와 키가 같아(옵션만 변경) 임시 인덱스를 둘 수 없는 경우는 1) 을 건너뛰고 2) 의 되돌리기만 적용합니다.
+        """
+        live = self.collection.index_information()
+        previous = live[name]
+        temp_name = f"{name}{self.REBUILD_SUFFIX}"
+        if temp_name in live:
+            self.collection.drop_index(temp_name)
+
+        staged = False
+        try:
+            self.collection.create_indexes([self._model(model.document, temp_name)])
+            staged = True
+        except OperationFailure as e:
+            if e.code not in self.CONFLICT_CODES:
+                raise
+
+        self.collection.drop_index(name)
+        if staged:
+            self.collection.drop_index(temp_name)
+
+        try:
+            self.collection.create_indexes([model])
+        except OperationFailure:
+            self.collection.create_indexes([self._model(previous, name)])
+            raise
+
+    @staticmethod
+    def _model(spec: Dict[str, Any], name: str) -> IndexModel:
+        """인덱스 정의(document 또는 index_information 항목)를 지정한 이름의 IndexModel 로 만듭니다."""
+        options = {key: value for key, value in spec.items() if key not in ('key', 'name', 'v', 'ns')}
+        key = spec['key'].items() if hasattr(spec['key'], 'items') else spec['key']
+        return IndexModel(list(key), name=name, **options)
+
+    def _live_compressor(self) -> Optional[str]:
+        try:
+            stats = next(self.collection.aggregate([{'$collStats': {'storageStats': {}}}]), {})
+            creation = stats.get('storageStats', {}).get('wiredTiger', {}).get('creationString', '')
+            match = re.search(r'block_compressor=(\w*)', creation)
+            if match:
+                return match.group(1) or 'none'
+        except OperationFailure:
+            pass
+        return self._compressor(self.collection.options())
+
+    @staticmethod
+    def _compressor(options: Dict[str, Any]) -> Optional[str]:
+        config_string = options.get('storageEngine', {}).get('wiredTiger', {}).get('configString', '')
+        match = re.search(r'block_compressor=(\w+)', config_string)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _normalize(spec: Dict[str, Any]) -> Dict[str, Any]:
+        key = spec['key'].items() if hasattr(spec['key'], 'items') else spec['key']
+        normalized = {'key': [(field, direction if isinstance(direction, str) else int(direction))
+                              for field, direction in key]}
+        for option in IndexManager.OPTION_KEYS:
+            value = spec.get(option)
+            if value not in (None, False):
+                normalized[option] = value
+        return normalized
+
+
+__all__ = ['IndexManager']
@@ -0,0 +1,126 @@
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from pymongo import ASCENDING
+
+
+class InvalidCursorError(ValueError):
+    """after 커서 토큰을 해석할 수 없거나 현재 정렬 조건과 맞지 않을 때 발생합니다."""
+    pass
+
+
+class Keyset:
+    """
+    MongoDB keyset(seek) 페이지네이션 헬퍼
+
+    - skip 대신 '직전 페이지 마지막 문서의 정렬 키 값' 이후를 조회하므로 N 페이지도 1 페이지와 같은 비용으로 조회합니다.
+    - 정렬 키 뒤에 항상 _id 를 붙여 순서를 유일하게 만들고, 마지막 문서의 정렬 키 값을 불투명한 after 토큰으로 인코딩합니다.
+      (ObjectId / datetime 등은 bson Extended JSON 으로 보존)
+
+    Usage:
+        sort = Keyset.sort_keys([('road_code_id', 1)])
+        query = Keyset.apply(filters, sort, after)
+        next_after = Keyset.next_token(items, sort, per_page)
+    """
+
+    TIEBREAKER = '_id'
+
+    @staticmethod
+    def sort_keys(sort: Optional[List[Tuple[str, int]]] = None) -> List[Tuple[str, int]]:
+        """정렬 조건 끝에 _id 를 붙여 유일한 정렬 순서를 만듭니다."""
+        keys = list(sort or [])
+        if Keyset.TIEBREAKER not in [key for key, _ in keys]:
+            direction = keys[-1][1] if keys else ASCENDING
+            keys.append((Keyset.TIEBREAKER, direction))
+        return keys
+
+    @staticmethod
+    def encode(values: List[Any]) -> str:
+        payload = json_util.dumps(values, json_options=json_util.RELAXED_JSON_OPTIONS)
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(token: str) -> List[Any]:
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            values = json_util.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        except Exception:
+            raise InvalidCursorError(f"잘못된 after 커서입니다: {token}")
+
+        if not isinstance(values, list):
+            raise InvalidCursorError(f"잘못된 after 커서입니다: {token}")
+        return values
+
+    @staticmethod
+    def seek_filter(sort: List[Tuple[str, int]], values: List[Any]) -> Dict[str, Any]:
+        """
+        (k1, k2, ..., _id) > (v1, v2, ..., id) 조건을 MongoDB 쿼리로 변환합니다.
+        {'$or': [{k1: {$gt: v1}}, {k1: v1, k2: {$gt: v2}}, ...]}
+
+        MongoDB 는 null/누락 값을 가장 작은 값으로 정렬하지만 {$gt: None} 은 아무 문서와도 일치하지 않으므로,
+        null 정렬 값은 _seek 에서 $ne / null 일치 조건으로 바꿉니다. (직전 값의 동등 조건 {k: None} 은 null/누락 모두 일치)
+        """
+        if len(values) != len(sort):
+            raise InvalidCursorError("after 커서가 현재 정렬 조건과 맞지 않습니다.")
+
+        clauses = []
+        for i, (key, direction) in enumerate(sort):
+            seek = Keyset._seek(key, direction, values[i])
+            if seek is None:
+                continue
+            clause = {prev_key: values[j] for j, (prev_key, _) in enumerate(sort[:i])}
+            clause.update(seek)
+            clauses.append(clause)
+
+        return clauses[0] if len(clauses) == 1 else {'$or': clauses}
+
+    @staticmethod
+    def _seek(key: str, direction: int, value: Any) -> Optional[Dict[str, Any]]:
+        """정렬 방향에서 value 뒤에 오는 값 조건 (뒤에 올 값이 없으면 None)"""
+        if direction == ASCENDING:
+            # null 다음은 null/누락이 아닌 모든 값
+            return {key: {'$ne': None}} if value is None else {key: {'$gt': value}}
+
+        # 내림차순에서 null/누락은 마지막이므로 그 뒤에 오는 값이 없고, 그 밖의 값 뒤에는 null/누락 문서가 이어집니다.
+        if value is None:
+            return None
+        if key == Keyset.TIEBREAKER:
+            return {key: {'$lt': value}}
+        return {'$or': [{key: {'$lt': value}}, {key: None}]}
+
+    @staticmethod
+    def apply(filters: Dict[str, Any], sort: List[Tuple[str, int]], after: Optional[str]) -> Dict[str, Any]:
+        """조회 조건에 after 커서 이후 조건을 결합합니다."""
+        if not after:
+            return filters
+
+        seek = Keyset.seek_filter(sort, Keyset.decode(after))
+        return {'$and': [filters, seek]} if filters else seek
+
+    @staticmethod
+    def next_token(items: List[Any], sort: List[Tuple[str, int]], per_page: int) -> Optional[str]:
+        """페이지가 가득 찼으면 마지막 문서 기준 다음 after 토큰을, 마지막 페이지면 None 을 반환합니다."""
+        if not items or len(items) < per_page:
+            return None
+
+        return Keyset.token(items[-1], sort)
+
+    @staticmethod
+    def token(doc: Any, sort: List[Tuple[str, int]]) -> str:
+        """문서의 정렬 키 값으로 after 토큰을 만듭니다."""
+        return Keyset.encode([Keyset._value(doc, key) for key, _ in sort])
+
+    @staticmethod
+    def _value(doc: Any, key: str) -> Any:
+        # 점 표기(a.b) 정렬 키와 DTO 항목 모두 지원
+        value = doc
+        for part in key.split('.'):
+            if isinstance(value, dict):
+                value = value.get(part)
+            else:
+                value = getattr(value, part, None)
+        return value
+
+
+__all__ = ['Keyset', 'InvalidCursorError']
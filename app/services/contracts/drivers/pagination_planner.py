@@ -0,0 +1,86 @@
+import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.core.helpers.config import Config
+from app.services.contracts.drivers.abstract import AbstractDriver
+
+
+class PaginationPlanner:
+    """
+    원격 API 목록 조회용 페이지 플래너
+
+    1페이지 응답의 totalCount(meta.total) 로 마지막 페이지를 계산한 뒤,
+    나머지 페이지를 스레드 풀에서 동시에 조회합니다.
+    - 드라이버는 싱글톤으로 공유되므로 페이지마다 얕은 복사본을 만들어 args/page 상태를 분리합니다.
+    - 결과는 페이지 순서대로 반환되므로 호출측의 이어하기(page 워터마크) 로직을 그대로 쓸 수 있습니다.
+    - totalCount 를 주지 않는 응답이면 짧은 페이지가 나올 때까지 순차 조회로 대체하며,
+      페이지 상한으로 조용히 잘라내지 않습니다.
+    """
+
+    def __init__(self, driver: AbstractDriver, per_page: int = 100, concurrency: Optional[int] = None):
+        self.driver = driver
+        self.per_page = per_page
+        self.concurrency = max(1, int(concurrency or Config.get('http.page_concurrency', 4)))
+
+    def pages(self, args: Optional[Dict[str, Any]] = None, start_page: int = 1) -> Iterator[Tuple[int, Any]]:
+        """
+        (page, pagination) 을 페이지 순서대로 반환하는 제너레이터입니다.
+
+        Args:
+            args: 드라이버 조회 조건
+            start_page: 시작 페이지 (이어하기 시 사용)
+        """
+        args = dict(args or {})
+
+        first = self._read(args, start_page)
+        yield start_page, first
+
+        total = int(first.meta.total or 0)
+        if total > 0:
+            last_page = first.meta.last_page
+            yield from self._read_concurrently(args, range(start_page + 1, last_page + 1))
+            return
+
+        # totalCount 미제공 응답: 마지막 페이지를 알 수 없으므로 순차 조회
+        page, pagination = start_page, first
+        while len(pagination.items) >= self.per_page:
+            page += 1
+            pagination = self._read(args, page)
+            yield page, pagination
+
+    def _read_concurrently(self, args: Dict[str, Any], pages: range) -> Iterator[Tuple[int, Any]]:
+        if not pages:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            # 메모리 사용량 제한을 위해 동시 요청 수의 2배까지만 미리 요청합니다.
+            window = deque()
+            page_iter = iter(pages)
+
+            for page in page_iter:
+                window.append((page, executor.submit(self._read, args, page)))
+                if len(window) >= self.concurrency * 2:
+                    break
+
+            while window:
+                page, future = window.popleft()
+                yield page, future.result()
+
+                next_page = next(page_iter, None)
+                if next_page is not None:
+                    window.append((next_page, executor.submit(self._read, args, next_page)))
+
+    def _read(self, args: Dict[str, Any], page: int) -> Any:
+        # 페이지마다 복사본으로 조회합니다. 변환 핸들러처럼 상태를 가진 협력 객체는 드라이버의 __copy__ 에서 분리해야 합니다.
+        driver = copy.copy(self.driver)
+        return (
+            driver.clear()
+            .set_arguments(dict(args))
+            .set_pagination(page=page, per_page=self.per_page)
+            .read()
+        )
+
+
+__all__ = ['PaginationPlanner']
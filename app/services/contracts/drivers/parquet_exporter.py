@@ -0,0 +1,199 @@
+import json
+import os
+import shutil
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.core.helpers.config import Config
+from app.core.helpers.log import Log
+
+
+class ParquetExporter:
+    """
+    MongoDB 조회 배치를 시군구/법정동 코드로 파티션된 Parquet 스냅샷으로 기록하는 헬퍼
+
+    - 출력 구조: {output_dir}/{collection}/sigungu={5자리}/bjdong={5자리}/part-00000.parquet (hive 파티션)
+      pyarrow.dataset / pandas.read_parquet 로 디렉토리를 그대로 읽을 수 있습니다.
+    - 파티션 코드는 문서의 법정동 코드 필드(sigunguCd+bjdongCd, bjdCode, bjd_code, item_code)에서 찾습니다.
+      도로명코드/관리번호처럼 앞 5자리만 시군구 코드인 필드는 시군구만 쓰고 법정동은 기본 파티션에 기록하며,
+      코드가 없으면 __HIVE_DEFAULT_PARTITION__ 에 기록합니다.
+    - 파티션별 버퍼가 row_group_size 에 도달하면 파일 하나로 기록하고, 전체 버퍼가 max_buffered_rows 를 넘으면
+      가장 큰 파티션부터 기록하여 메모리 사용량을 제한합니다.
+    - 스키마는 내보내기 전에 $sample 표본 문서의 필드/타입으로 정합니다. (schema_of, 컬렉션 전체를 추가로 읽지 않음)
+      date 만 있는 필드는 timestamp, 나머지는 문자열 / 중첩 값은 JSON 문자열, 문서에 없는 필드는 타입이 있는 null 로 기록합니다.
+    - 표본에 없던 필드는 내보내는 중에 문자열 컬럼으로 스키마 끝에 추가하고, 최종 스키마를 _common_metadata 로 남깁니다.
+      (먼저 기록된 파일에는 해당 컬럼이 없으므로 읽을 때 pq.read_schema('_common_metadata') 스키마를 지정하면 null 로 채워집니다.)
+    - {collection}.partial 에 기록한 뒤 완료되면 기존 스냅샷과 교체하므로, 중단된 내보내기가 기존 스냅샷을 훼손하지 않습니다.
+
+    Usage:
+        exporter = ParquetExporter(output_dir)
+        schema = ParquetExporter.schema_of(collection)
+        stats = exporter.export(collection.name, CursorStream(collection, {}, batch_size=5000, prefetch=True), schema)
+    """
+
+    DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+    # 법정동 코드(10자리)를 찾을 필드 (앞에서부터 먼저 있는 값 사용)
+    CODE_FIELDS = ('bjdCode', 'bjd_code', 'item_code')
+
+    # 앞 5자리만 시군구 코드인 필드 (도로명코드, 건물관리번호) → 법정동은 기본 파티션
+    SIGUNGU_FIELDS = ('road_code', 'road_address_id')
+
+    def __init__(self, output_dir: Optional[str] = None, row_group_size: Optional[int] = None,
+                 max_buffered_rows: Optional[int] = None, compression: Optional[str] = None):
+        self.output_dir = output_dir or Config.get('database.export.parquet_path') \
+            or os.path.join(Config.get('app.storage_root'), 'parquet')
+        self.row_group_size = int(row_group_size or Config.get('database.export.row_group_size', 100000))
+        self.max_buffered_rows = int(max_buffered_rows or Config.get('database.export.max_buffered_rows', 500000))
+        self.compression = compression or Config.get('database.export.compression', 'zstd')
+        self.schema_sample_size = int(Config.get('database.export.schema_sample_size', 10000))
+        self.logger = Log.get_logger('mongodb')
+
+    @staticmethod
+    def partition_of(doc: Dict[str, Any]) -> Tuple[str, str]:
+        """문서의 (시군구 코드, 법정동 코드) 파티션 값"""
+        if doc.get('sigunguCd'):
+            return str(doc['sigunguCd']), str(doc.get('bjdongCd') or '00000')
+
+        for field in ParquetExporter.CODE_FIELDS:
+            code = str(doc.get(field) or '')
+            if len(code) >= 2 and code[:2].isdigit():
+                code = code[:10].ljust(10, '0')
+                return code[:5], code[5:10]
+
+        for field in ParquetExporter.SIGUNGU_FIELDS:
+            code = str(doc.get(field) or '')
+            if len(code) >= 5 and code[:5].isdigit():
+                return code[:5], ParquetExporter.DEFAULT_PARTITION
+
+        return ParquetExporter.DEFAULT_PARTITION, ParquetExporter.DEFAULT_PARTITION
+
+    @staticmethod
+    def schema_of(collection, sample_size: Optional[int] = None) -> pa.Schema:
+        """
+        $sample 표본 문서의 최상위 필드와 BSON 타입으로 내보내기 스키마를 만듭니다.
+        date(와 null)만 있는 필드는 timestamp, 그 외는 문자열이며 _id 를 맨 앞에 둡니다.
+        """
+        sample_size = int(sample_size or Config.get('database.export.schema_sample_size', 10000))
+        pipeline = [
+            {'$sample': {'size': sample_size}},
+            {'$project': {'fields': {'$objectToArray': '$$ROOT'}}},
+            {'$unwind': '$fields'},
+            {'$group': {'_id': '$fields.k', 'types': {'$addToSet': {'$type': '$fields.v'}}}},
+        ]
+        types = {doc['_id']: set(doc['types']) for doc in collection.aggregate(pipeline, allowDiskUse=True)}
+
+        fields = []
+        for name in sorted(types, key=lambda key: (key != '_id', key)):
+            non_null = types[name] - {'null', 'missing'}
+            data_type = pa.timestamp('ms') if non_null and non_null <= {'date'} else pa.string()
+            fields.append(pa.field(name, data_type))
+
+        return pa.schema(fields)
+
+    def export(self, collection_name: str, batches: Iterable[List[Dict[str, Any]]], schema: pa.Schema) -> Dict[str, int]:
+        """
+        배치 이터러블을 schema 로 기록하여 컬렉션 스냅샷을 만들고 {'rows', 'files', 'partitions', 'added_fields'} 를 반환합니다.
+        schema 에 없는 필드가 나오면 문자열 컬럼으로 넓혀 이후 파일부터 기록합니다.
+        """
+        target = os.path.join(self.output_dir, collection_name)
+        partial = f"{target}.partial"
+        if os.path.exists(partial):
+            shutil.rmtree(partial)
+        os.makedirs(partial)
+
+        buffers: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        sequences: Dict[Tuple[str, str], int] = {}
+        stats = {'rows': 0, 'files': 0, 'partitions': 0, 'added_fields': 0}
+        buffered = 0
+        known = set(schema.names)
+
+        def flush(key: Tuple[str, str]):
+            nonlocal buffered
+            rows = buffers.pop(key, None)
+            if not rows:
+                return
+
+            sequence = sequences.get(key, 0)
+            sequences[key] = sequence + 1
+            directory = os.path.join(partial, f"sigungu={key[0]}", f"bjdong={key[1]}")
+            os.makedirs(directory, exist_ok=True)
+
+            pq.write_table(self._table(rows, schema), os.path.join(directory, f"part-{sequence:05d}.parquet"),
+                           row_group_size=self.row_group_size, compression=self.compression)
+            buffered -= len(rows)
+            stats['files'] += 1
+
+        for batch in batches:
+            for doc in batch:
+                unseen = doc.keys() - known
+                if unseen:
+                    # 표본에 없던 필드: 아직 버퍼에 있는 행은 새 스키마로 기록되고, 이미 기록된 파일은 null 로 읽힙니다.
+                    schema = pa.schema(list(schema) + [pa.field(name, pa.string()) for name in sorted(unseen)])
+                    known.update(unseen)
+                    stats['added_fields'] += len(unseen)
+
+                key = self.partition_of(doc)
+                rows = buffers.setdefault(key, [])
+                rows.append(doc)
+                buffered += 1
+
+                if len(rows) >= self.row_group_size:
+                    flush(key)
+
+            stats['rows'] += len(batch)
+
+            # 전체 버퍼가 한도를 넘으면 큰 파티션부터 절반 이하로 줄입니다.
+            if buffered >= self.max_buffered_rows:
+                for key in sorted(buffers, key=lambda k: len(buffers[k]), reverse=True):
+                    flush(key)
+                    if buffered <= self.max_buffered_rows // 2:
+                        break
+
+        for key in list(buffers):
+            flush(key)
+        stats['partitions'] = len(sequences)
+        pq.write_metadata(schema, os.path.join(partial, '_common_metadata'))
+
+        # 완료된 스냅샷으로 교체 (이전 실행이 남긴 .old 가 있으면 rename 이 실패하므로 먼저 지웁니다.)
+        previous = f"{target}.old"
+        if os.path.exists(previous):
+            shutil.rmtree(previous)
+        if os.path.exists(target):
+            os.rename(target, previous)
+        os.rename(partial, target)
+        if os.path.exists(previous):
+            shutil.rmtree(previous)
+
+        self.logger.info(f"[ParquetExporter] {collection_name} → {target} | {stats}")
+        return stats
+
+    @staticmethod
+    def _table(rows: List[Dict[str, Any]], schema: pa.Schema) -> pa.Table:
+        """고정 스키마로 테이블을 만듭니다. (문서에 없는 필드는 null, 스키마에 없는 필드는 무시)"""
+        arrays = []
+        for field in schema:
+            values = [row.get(field.name) for row in rows]
+            if pa.types.is_timestamp(field.type):
+                values = [value if isinstance(value, datetime) else None for value in values]
+            else:
+                values = [ParquetExporter._text(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    @staticmethod
+    def _text(value: Any) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return str(value)
+
+
+__all__ = ['ParquetExporter']
@@ -0,0 +1,68 @@
+from typing import Any, Dict, Iterable, Optional
+
+
+class InvalidProjectionError(ValueError):
+    """조회 인자 'fields' 를 projection 으로 변환할 수 없을 때 발생합니다."""
+    pass
+
+
+class Projection:
+    """
+    조회 인자 'fields' 를 MongoDB projection 으로 변환하는 헬퍼
+
+    - ['a', 'b'] 또는 'a,b'        → 지정 필드만 포함 {'a': 1, 'b': 1}
+    - ['-geo_polygon'] 또는 '-a,-b' → 지정 필드만 제외 {'geo_polygon': 0}
+    - dict 는 이미 projection 으로 보고 그대로 사용합니다.
+    MongoDB 는 _id 외에 포함/제외를 섞을 수 없으므로 섞어서 지정하면 InvalidProjectionError(ValueError) 가 발생합니다.
+    일부 필드만 읽은 문서를 store() 로 다시 저장하면 content_hash 가 부분 문서 기준으로 계산되므로 읽기 전용 경로에서만 사용합니다.
+    """
+
+    @staticmethod
+    def parse(fields: Any) -> Optional[Dict[str, int]]:
+        if not fields:
+            return None
+
+        if isinstance(fields, dict):
+            projection = {str(key): int(bool(value)) for key, value in fields.items()}
+        else:
+            if isinstance(fields, str):
+                fields = fields.split(',')
+
+            projection = {}
+            for field in fields:
+                field = str(field).strip()
+                if not field:
+                    continue
+                if field.startswith('-'):
+                    projection[field[1:]] = 0
+                else:
+                    projection[field] = 1
+
+        modes = {value for key, value in projection.items() if key != '_id'}
+        if len(modes) > 1:
+            raise InvalidProjectionError(f"fields 에 포함/제외 필드를 함께 지정할 수 없습니다: {fields}")
+
+        return projection or None
+
+    @staticmethod
+    def is_inclusion(projection: Optional[Dict[str, int]]) -> bool:
+        return bool(projection) and any(value for key, value in projection.items() if key != '_id')
+
+    @staticmethod
+    def ensure(projection: Optional[Dict[str, int]], keys: Iterable[str]) -> Optional[Dict[str, int]]:
+        """정렬 키/필수 필드처럼 항상 필요한 필드가 projection 으로 빠지지 않도록 보정합니다."""
+        if not projection:
+            return projection
+
+        projection = dict(projection)
+        inclusion = Projection.is_inclusion(projection)
+        for key in keys:
+            if inclusion:
+                projection[key] = 1
+            else:
+                projection.pop(key, None)
+
+        return projection or None
+
+
+__all__ = ['Projection', 'InvalidProjectionError']
@@ -0,0 +1,105 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.helpers.config import Config
+from app.core.helpers.log import Log
+
+
+class UnitOfWork:
+    """
+    여러 건을 빌드하는 동안 생긴 MongoDB 쓰기를 모아 두었다가 컬렉션별 unordered bulk_write 로 한 번에 기록하는 버퍼
+
+    - register() 는 저장하지 않고 드라이버(컬렉션)별로 문서를 모읍니다. 같은 PK 는 마지막에 등록된 값만 남깁니다.
+      (좌표 저장 후 continuous_id 를 채워 다시 저장하는 경우처럼 한 문서를 여러 번 저장해도 한 번만 기록됩니다.)
+    - flush() 는 컬렉션마다 store(ordered=False) 를 한 번씩 호출하므로, 건별 store([...]) 왕복이 배치당 컬렉션 수만큼으로 줄어듭니다.
+    - 등록된 문서 수가 max_items 를 넘으면 자동으로 flush 하여 메모리 사용량을 제한합니다.
+    - 버퍼에 있는 문서는 flush 전까지 MongoDB 에서 조회되지 않으므로, 같은 배치 안에서 방금 쓴 문서를 다시 읽는 흐름은
+      MongoDB 조회 전에 lookup() 으로 버퍼를 먼저 확인합니다. (배치 내 중복 항목의 외부 API 재호출/중복 저장 방지)
+
+    Usage:
+        with UnitOfWork() as uow:
+            for item in items:
+                address_service.build_by_address_raw(item, uow=uow)
+        uow.report()  # 컬렉션별 기록 건수
+    """
+
+    def __init__(self, max_items: Optional[int] = None):
+        self.logger = Log.get_logger('mongodb')
+        self.max_items = int(max_items or Config.get('database.unit_of_work.max_items', 5000))
+
+        # id(driver) → (driver, {pk: item})
+        self._buffers: Dict[int, Tuple[Any, Dict[Any, dict]]] = {}
+        self._size = 0
+
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._latency = {'total': 0.0, 'writes': 0}
+
+    def __enter__(self) -> 'UnitOfWork':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 본문에서 예외가 난 경우에는 일부만 빌드된 배치를 기록하지 않고 버립니다.
+        if exc_type is None:
+            self.flush()
+        else:
+            self.clear()
+
+    def register(self, driver, items: List[dict]):
+        """드라이버의 PK 기준으로 문서를 버퍼에 등록합니다. (PK 가 없는 문서는 store() 와 같이 무시)"""
+        _, buffer = self._buffers.setdefault(id(driver), (driver, {}))
+        for item in items or []:
+            pk = item.get(driver.primary_key)
+            if not pk:
+                continue
+            if pk not in buffer:
+                self._size += 1
+            buffer[pk] = item
+
+        if self._size >= self.max_items:
+            self.flush()
+
+    def lookup(self, driver, field: str, value: Any) -> List[dict]:
+        """아직 기록하지 않은 드라이버 버퍼에서 field 값이 일치하는 문서를 등록 순서대로 반환합니다."""
+        if value is None or id(driver) not in self._buffers:
+            return []
+        _, buffer = self._buffers[id(driver)]
+        return [item for item in buffer.values() if item.get(field) == value]
+
+    def flush(self) -> Dict[str, Dict[str, int]]:
+        """버퍼의 문서를 컬렉션별 unordered bulk_write 로 기록하고 누적 통계를 반환합니다."""
+        buffers, self._buffers, self._size = self._buffers, {}, 0
+
+        for driver, buffer in buffers.values():
+            if not buffer:
+                continue
+
+            started = time.perf_counter()
+            store_stats = driver.store(list(buffer.values()), ordered=False)
+            self._latency['total'] += time.perf_counter() - started
+            self._latency['writes'] += 1
+
+            stats = self.stats.setdefault(driver.__class__.__name__, {'items': 0, 'writes': 0})
+            stats['items'] += len(buffer)
+            stats['writes'] += 1
+            for key, value in (store_stats or {}).items():
+                stats[key] = stats.get(key, 0) + value
+
+        return self.stats
+
+    def clear(self):
+        """기록하지 않고 버퍼를 비웁니다."""
+        self._buffers, self._size = {}, 0
+
+    def report(self) -> Dict[str, Any]:
+        """컬렉션별 누적 기록 건수와 bulk_write 평균 지연 시간(ms)"""
+        writes = self._latency['writes']
+        return {
+            **self.stats,
+            'avg_ms': round(self._latency['total'] / writes * 1000, 1) if writes else 0,
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+
+__all__ = ['UnitOfWork']
@@ -12,12 +12,17 @@ class PaginationDto(GenericModel, Generic[T]):
     """
     page: int = Field(1, title='현재 페이지')
     per_page: int = Field(1, title='페이지별 아이템 수량')
-    total: int = Field(1, title='총 아이템 수')
+    total: Optional[int] = Field(1, title='총 아이템 수 (count=none 이면 null)')
     items: List[T] = Field(default_factory=list, title='아이템 목록')
+    next_after: Optional[str] = Field(None, title='다음 페이지 커서 (after 파라미터로 전달)')
+    has_next: Optional[bool] = Field(None, title='다음 페이지 존재 여부')
 
     # last_page를 property로 만들면 데이터가 바뀔 때마다 자동으로 계산됩니다.
     @property
     def last_page(self) -> int:
+        if self.total is None:
+            # 건수를 세지 않은 경우 다음 페이지 여부로만 판단합니다.
+            return self.page + 1 if self.has_next else self.page
         if self.total <= 0:
             return 1
         return math.ceil(self.total / self.per_page)
@@ -39,4 +44,15 @@ class MongoModel(BaseModel):
         """ObjectId 객체를 문자열로 변환"""
         if v is None:
             return None
-        return str(v)
\ No newline at end of file
+        return str(v)
+
+    @classmethod
+    def construct_trusted(cls, **values):
+        """
+        검증 없이 생성합니다. (item_mode=construct)
+        construct() 는 validator 를 실행하지 않으므로 _id → 문자열 변환만 직접 수행합니다.
+        """
+        _id = values.get('_id')
+        if _id is not None and not isinstance(_id, str):
+            values['_id'] = str(_id)
+        return cls.construct(**values)
\ No newline at end of file
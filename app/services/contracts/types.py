@@ -1,4 +1,4 @@
-from typing import Union, List, Tuple, Dict, Generic, TypeVar
+from typing import Union, List, Tuple, Dict, Generic, TypeVar, Optional
 from pydantic import BaseModel, root_validator
 from pydantic.generics import GenericModel
 
@@ -7,8 +7,13 @@ T = TypeVar("T")
 class PaginationMeta(BaseModel):
     page: int
     per_page: int
-    total: int
-    last_page: int
+    # count 모드가 none 이면 전체 건수/마지막 페이지를 계산하지 않습니다. (None)
+    total: Optional[int] = None
+    last_page: Optional[int] = None
+    # 다음 페이지 존재 여부 (limit+1 조회 또는 total 로 계산)
+    has_next: Optional[bool] = None
+    # keyset 페이지네이션용 다음 페이지 커서 (마지막 페이지거나 정렬 기준이 없으면 None)
+    next_after: Optional[str] = None
 
 class Pagination(GenericModel, Generic[T]):
     meta: PaginationMeta
@@ -1,17 +1,26 @@
 # app/services/location/boundary/drivers/mongodb.py
 
-from typing import List, Optional, Any
-from copy import deepcopy
+from typing import Any, Dict, Iterator, List, Optional
+from copy import copy, deepcopy
+from pymongo import IndexModel, ASCENDING, GEOSPHERE
 from pymongo.collection import UpdateOne, Collection
 from app.services.location.boundary.dto import BoundaryItemDto
 from app.services.location.boundary.drivers.interface import BoundaryStoreResult, BoundaryInterface
 from app.services.location.boundary.types.boundary import STATE
+from app.services.contracts.drivers.keyset import Keyset
+from app.services.contracts.drivers.document_counter import DocumentCounter
+from app.services.contracts.drivers.projection import Projection
+from app.services.contracts.drivers.cursor_stream import CursorStream
+from app.services.contracts.drivers.index_manager import IndexManager
 from app.facade import db
 
 
 class MongoDBDriver(BoundaryInterface):
     client: Collection
 
+    # projection 과 무관하게 항상 조회할 필드 (BoundaryItemDto 필수 필드)
+    REQUIRED_FIELDS = [name for name, field in BoundaryItemDto.__fields__.items() if field.required]
+
     def __init__(self):
         # 인터페이스 초기화 (필요 시)
         super().__init__()
@@ -19,13 +28,43 @@ class MongoDBDriver(BoundaryInterface):
         database_name = 'landmark'
         collection_name = 'boundary'
         self.client = db.get_mongodb_driver(driver_name).get_database(database_name).get_collection(collection_name)
+        self.driver_name = driver_name
+
+    @property
+    def async_client(self):
+        """같은 경계 컬렉션의 AsyncCollection (현재 이벤트 루프용 AsyncMongoClient)"""
+        return db.get_async_mongodb_driver(self.driver_name) \
+            .get_database(self.client.database.name) \
+            .get_collection(self.client.name, codec_options=self.client.codec_options)
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        """경계 컬렉션 인덱스 선언 (mongodb_index:* 명령어로 생성/검증)"""
+        return [
+            # store() upsert 키
+            IndexModel([('item_code', ASCENDING), ('location_type', ASCENDING), ('jurisdiction_type', ASCENDING)],
+                       unique=True),
+            # 계층 싱크/법정동 순회: 지역 구분별 item_code 순 조회
+            IndexModel([('location_type', ASCENDING), ('item_code', ASCENDING)]),
+            # 위경도 기반 $near 조회
+            IndexModel([('geo_polygon', GEOSPHERE)]),
+        ]
+
+    @property
+    def collection_options(self) -> Dict[str, Any]:
+        return IndexManager.default_options()
+
+    def index_manager(self) -> IndexManager:
+        return IndexManager(self.client, self.indexes, self.collection_options)
 
     def _build_read_process(self):
         args = self.args or {}
         filters = {}
-        projection = {}
         sorts = args.get('sort', [])
 
+        # fields 로 필요한 필드만 조회하되, BoundaryItemDto 필수 필드는 항상 포함합니다.
+        projection = Projection.ensure(Projection.parse(args.get('fields')), self.REQUIRED_FIELDS) or {}
+
         location_fields = [
             'location_type', 'jurisdiction_type', 'item_code', 'item_name',
             'state_code', 'district_code', 'township_code', 'village_code'
@@ -34,7 +73,8 @@ class MongoDBDriver(BoundaryInterface):
             if args.get(field):
                 filters[field] = args[field]
 
-        if args.get('use_polygon') == 0:
+        # fields 로 폴리곤을 명시하지 않았다면 use_polygon=0 일 때 폴리곤을 제외합니다.
+        if args.get('use_polygon') == 0 and not Projection.is_inclusion(projection):
             projection['geo_polygon'] = 0
 
         self.count_filters = deepcopy(filters)
@@ -50,6 +90,14 @@ class MongoDBDriver(BoundaryInterface):
             }
             sorts = []
 
+        # 정렬 끝에 _id 를 붙여 순서를 고정하고 after 커서로 이어서 조회할 수 있게 합니다.
+        # 위치 기반($near) 조회는 거리순이므로 after 커서를 쓰지 않습니다.
+        self.after = None
+        if 'geo_polygon' not in filters:
+            self.after = args.get('after')
+            sorts = Keyset.sort_keys([tuple(sort) for sort in sorts])
+            projection = Projection.ensure(projection, [key for key, _ in sorts]) or {}
+
         self.filters = filters
         self.projection = projection
         self.sorts = sorts if len(sorts) > 0 else None
@@ -60,21 +108,74 @@ class MongoDBDriver(BoundaryInterface):
 
         if single:
             doc = self.client.find_one(self.filters, self.projection)
-            return [BoundaryItemDto(**doc)] if doc else []
+            return self.make_items([doc]) if doc else []
+
+        return self._page_docs(list(self._find_cursor(self.client)))
 
-        skip = (self.page - 1) * self.per_page
-        cursor = self.client.find(self.filters, self.projection)
+    def _find_cursor(self, collection):
+        cursor = collection.find(Keyset.apply(self.filters, self.sorts, self.after), self.projection)
 
         if self.sorts:
             cursor = cursor.sort(self.sorts)
 
-        # DB에서 가져온 dict 데이터를 BoundaryItemDto로 즉시 변환
-        return [BoundaryItemDto(**doc) for doc in cursor.skip(skip).limit(self.per_page)]
+        # after 커서가 있으면 skip 없이 정렬 키 이후부터 조회합니다.
+        # 한 건 더 조회하여 건수를 세지 않고도 다음 페이지 여부를 판단합니다.
+        if not self.after:
+            cursor = cursor.skip((self.page - 1) * self.per_page)
+        return cursor.limit(self.per_page + 1)
+
+    def _page_docs(self, docs: List[dict]) -> List[BoundaryItemDto]:
+        self.has_next = len(docs) > self.per_page
+        docs = docs[:self.per_page]
+
+        # DTO 변환 시 _id 가 문자열로 바뀌므로 원본 문서 기준으로 다음 페이지 커서를 만듭니다.
+        self.next_after = Keyset.next_token(docs, self.sorts, self.per_page) if self.sorts and self.has_next else None
+
+        # DB에서 가져온 dict 데이터를 BoundaryItemDto로 즉시 변환 (item_mode 에 따라 검증 생략/원본 유지)
+        return self.make_items(docs)
+
+    async def read_async(self) -> Any:
+        """
+        read() 의 비동기 버전 (AsyncMongoClient 사용)
+        공유 드라이버의 조회 조건이 await 사이에 바뀌지 않도록 복사본에 조건을 고정하여 조회합니다.
+        """
+        driver = copy(self)
+        driver._build_read_process()
+        collection = driver.async_client
+
+        items = driver._page_docs(await driver._find_cursor(collection).to_list(None))
+        total = await DocumentCounter.count_async(collection, driver.count_filters, (driver.args or {}).get('count'))
+        return driver.build_pagination(items=items, total=total)
+
+    async def read_one_async(self) -> Optional[BoundaryItemDto]:
+        """read_one() 의 비동기 버전 (AsyncMongoClient 사용)"""
+        driver = copy(self)
+        driver._build_read_process()
+
+        doc = await driver.async_client.find_one(driver.filters, driver.projection)
+        return driver.make_items([doc])[0] if doc else None
+
+    def iterate(self, batch_size: int = 1000, prefetch: bool = True) -> Iterator[List[BoundaryItemDto]]:
+        """
+        set_arguments 로 지정한 조건의 경계 데이터를 하나의 커서로 batch_size 건씩 BoundaryItemDto 리스트로 반환합니다.
+        위치 기반($near) 조회는 지원하지 않습니다.
+        """
+        self._build_read_process()
+        if 'geo_polygon' in self.filters:
+            raise ValueError("위치 기반 조회는 iterate 를 지원하지 않습니다.")
+
+        # 드라이버는 공유 객체이므로 조건을 스트림 생성 시점에 고정합니다.
+        stream = CursorStream(
+            self.client, self.filters, batch_size=batch_size, projection=self.projection or None,
+            sort=self.sorts, prefetch=prefetch
+        )
+        mode = self.item_mode()
+        return (self.make_items(batch, mode) for batch in stream)
 
-    def _get_total_count(self) -> int:
+    def _get_total_count(self) -> Optional[int]:
         if not hasattr(self, 'count_filters'):
             self._build_read_process()
-        return self.client.count_documents(self.count_filters)
+        return DocumentCounter.count(self.client, self.count_filters, (self.args or {}).get('count'))
 
     def store(self, items: List[BoundaryItemDto]) -> BoundaryStoreResult:
         operations = []
@@ -1,12 +1,15 @@
 # app/services/location/boundary/drivers/vworld.py
 
+import copy
 from typing import Any, List, Optional, Dict
-import requests
 from app.services.location.boundary.dto import BoundaryItemDto
 from app.services.location.boundary.drivers.interface import BoundaryInterface
 from app.services.location.boundary.handlers.build_boundary_item_handler import BuildBoundaryItemHandler
 from app.services.location.boundary.types.boundary import STATE, DISTRICT, TOWNSHIP, VILLAGE, LEGAL
 from app.core.helpers.config import Config
+from app.core.helpers.http import Http
+from app.core.helpers.response_cache import ResponseCache
+from app.facade import rate_limiter
 
 
 class VWorldDriver(BoundaryInterface):
@@ -20,6 +23,17 @@ class VWorldDriver(BoundaryInterface):
         self.build_boundary_item_handler = build_boundary_item_handler
         self._last_response_raw: Optional[dict] = None
 
+    def __copy__(self) -> 'VWorldDriver':
+        """
+        동시 페이지 조회(PaginationPlanner)용 복사본을 만듭니다.
+        변환 핸들러는 set_item().handle() 로 item/result 를 바꾸므로, 스레드 간에 섞이지 않도록 복사본마다 별도 인스턴스를 둡니다.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.build_boundary_item_handler = copy.copy(self.build_boundary_item_handler)
+        clone._last_response_raw = None
+        return clone
+
     # 시도(STATE) 전용 매핑 데이터
     STATE_MAPPING = {
         '서울특별시': {'short_name': '서울시', 'manual_order': 0},
@@ -72,7 +86,6 @@ class VWorldDriver(BoundaryInterface):
 
         url = 'https://api.vworld.kr/req/data'
         params = {
-            'key': Config.get('vworld.key'),
             'domain': Config.get('vworld.domain'),
             'format': 'json',
             'crs': 'EPSG:4326',
@@ -95,9 +108,15 @@ class VWorldDriver(BoundaryInterface):
         elif loc_type == STATE:
             params['geomFilter'] = 'BOX(124.60,33.10,131.87,38.61)'
 
-        # API 호출
-        response = requests.get(url, params=params)
-        data = response.json()
+        def request() -> bytes:
+            service_key = rate_limiter.acquire('vworld', Config.get('vworld.key'))
+            response = Http.get(url, params={'key': service_key, **params})
+            rate_limiter.report('vworld', service_key, Http.status_history(response))
+            response.raise_for_status()
+            return response.content
+
+        # API 호출 (캐시 적중 시 토큰/쿼터 소모 없이 원본 응답 재사용)
+        data = ResponseCache.fetch('vworld', url, params, request, should_cache=self._cacheable)
         self._last_response_raw = data
 
         if data.get('response', {}).get('status') == 'OK':
@@ -109,6 +128,11 @@ class VWorldDriver(BoundaryInterface):
 
         return []
 
+    @staticmethod
+    def _cacheable(data: Any) -> bool:
+        """정상 응답(OK / 결과 없음)만 캐시합니다. (인증키 오류, 요청 제한 초과 등 ERROR 응답 제외)"""
+        return isinstance(data, dict) and data.get('response', {}).get('status') in ('OK', 'NOT_FOUND')
+
     def _map_to_handler_input(self, feature: dict, loc_type: str, config: dict) -> dict:
         """이전 프로그램의 callback_item_props 로직을 현재 규격에 맞게 이식"""
         props = feature['properties']
@@ -1,7 +1,10 @@
-from typing import Optional, List, Any
+import asyncio
+from copy import copy
+from typing import Iterator, Optional, List, Any
 from app.services.location.boundary.manager import BoundaryManager
 from app.services.location.boundary.dto import BoundaryItemDto, BoundaryPaginationDto
 from app.services.location.boundary.drivers.interface import BoundaryStoreResult
+from app.services.contracts.drivers.pagination_planner import PaginationPlanner
 
 
 class BoundaryService:
@@ -28,6 +31,42 @@ class BoundaryService:
             .read()
         )
 
+    async def get_boundaries_async(self, params: dict, driver_name: Optional[str] = None) -> BoundaryPaginationDto:
+        """
+        get_boundaries() 의 비동기 버전 (API 핸들러용)
+        공유 드라이버 대신 복사본에 조건을 지정하고, 비동기 조회를 지원하지 않는 드라이버는 스레드에서 조회합니다.
+        """
+        page = int(params.get('page', 1))
+        per_page = int(params.get('per_page', 20))
+
+        driver = copy(self.boundary_manager.driver(driver_name)) \
+            .clear() \
+            .set_arguments(params) \
+            .set_pagination(page=page, per_page=per_page)
+
+        if hasattr(driver, 'read_async'):
+            return await driver.read_async()
+        return await asyncio.to_thread(driver.read)
+
+    async def get_boundary_async(self, params: dict, driver_name: Optional[str] = None) -> Optional[BoundaryItemDto]:
+        """get_boundary() 의 비동기 버전 (API 핸들러용)"""
+        driver = copy(self.boundary_manager.driver(driver_name)).clear().set_arguments(params)
+
+        if hasattr(driver, 'read_one_async'):
+            return await driver.read_one_async()
+        return await asyncio.to_thread(driver.read_one)
+
+    def iterate_boundaries(self, params: dict, batch_size: int = 1000) -> Iterator[List[BoundaryItemDto]]:
+        """
+        MongoDB 의 지역 경계 목록을 페이지 조회 반복 없이 하나의 커서로 batch_size 건씩 조회합니다. (대량 작업용)
+        """
+        return (
+            self.boundary_manager.driver(self.DRIVER_MONGODB)
+            .clear()
+            .set_arguments(params)
+            .iterate(batch_size=batch_size)
+        )
+
     def get_boundary(self, params: dict, driver_name: Optional[str] = None) -> Optional[BoundaryItemDto]:
         """
         단일 지역 경계 데이터를 조회합니다.
@@ -64,51 +103,57 @@ class BoundaryService:
 
         return vworld_result.meta
 
+    def sync_all_from_vworld(self, location_type: str, per_page: int = 100, args: Optional[dict] = None,
+                             concurrency: Optional[int] = None) -> int:
+        """
+        VWorld 1페이지의 total 로 전체 페이지를 계산하여 나머지 페이지를 동시에 조회/저장합니다.
+        저장된 총 건수를 반환합니다.
+        """
+        planner = PaginationPlanner(
+            self.boundary_manager.driver(self.DRIVER_VWORLD),
+            per_page=per_page,
+            concurrency=concurrency
+        )
+
+        total_stored = 0
+        for _, vworld_result in planner.pages({'location_type': location_type, **(args or {})}):
+            if vworld_result.items:
+                self.store_boundaries(vworld_result.items)
+                total_stored += len(vworld_result.items)
+
+        return total_stored
+
     def sync_hierarchy(self, parent_type: str, current_type: str):
         """
         [계층 싱크] 상위 지역(parent_type) 코드를 기반으로 현재 지역(current_type)을 동기화합니다.
         """
-        page = 1
         total_stored = 0
 
-        while True:
-            # [수정] params에 page를 명시적으로 전달해야 합니다.
-            parent_pagination = self.get_boundaries(
-                params={
-                    'location_type': parent_type,
-                    'page': page,
-                    'per_page': 100  # 한 번에 많이 처리하도록 설정 권장
-                },
-                driver_name=self.DRIVER_MONGODB
-            )
-
-            # 더 이상 읽을 상위 데이터가 없거나 아이템이 비어있으면 종료
-            if not parent_pagination.items:
-                break
-
-            for parent_item in parent_pagination.items:
-                # VWorld 드라이버를 통해 하위 데이터 조회
-                vworld_result = (
-                    self.boundary_manager.driver(self.DRIVER_VWORLD)
-                    .clear()
-                    .set_arguments({
-                        'location_type': current_type,
+        # 상위 지역 목록은 하나의 커서로 배치 단위 조회합니다.
+        parent_batches = self.iterate_boundaries(
+            params={
+                'location_type': parent_type,
+                'fields': ['item_code', 'item_name'],
+                # 직접 적재한 경계 데이터이므로 DTO 검증을 생략합니다.
+                'item_mode': 'construct'
+            },
+            batch_size=100
+        )
+
+        for parent_items in parent_batches:
+            for parent_item in parent_items:
+                # VWorld 드라이버를 통해 하위 데이터 조회 (total 기준 전체 페이지)
+                stored = self.sync_all_from_vworld(
+                    location_type=current_type,
+                    per_page=1000,
+                    args={
                         'item_code': parent_item.item_code,
                         'jurisdiction_type': 'legal'
-                    })
-                    .read()
+                    }
                 )
 
-                if vworld_result.items:
-                    self.store_boundaries(vworld_result.items)
-                    total_stored += len(vworld_result.items)
-                    print(f"  -> [{current_type}] {parent_item.item_name} 하위 데이터 {len(vworld_result.items)}개 동기화")
-
-            # [핵심 수정] 마지막 페이지인지 체크하여 탈출 조건 강화
-            if page >= parent_pagination.meta.last_page:
-                break
-
-            # 다음 페이지로 이동
-            page += 1
+                if stored:
+                    total_stored += stored
+                    print(f"  -> [{current_type}] {parent_item.item_name} 하위 데이터 {stored}개 동기화")
 
         return total_stored
\ No newline at end of file
@@ -1,9 +1,10 @@
 from typing import Any, List, Optional, Dict
-import requests
 from app.services.location.boundary.drivers.interface import BoundaryInterface
 from app.services.location.boundary.handlers.build_boundary_item_handler import BuildBoundaryItemHandler
 from app.services.location.boundary.types.boundary import STATE, DISTRICT, TOWNSHIP, VILLAGE, LEGAL
 from app.core.helpers.config import Config
+from app.core.helpers.http import Http
+from app.core.helpers.response_cache import ResponseCache
 
 
 class VworldDriver(BoundaryInterface):
@@ -95,9 +96,9 @@ class VworldDriver(BoundaryInterface):
         elif self.arguments('bbox'):
             params['geomFilter'] = f"BOX({','.join(map(str, self.arguments('bbox')))})"
 
-        # 4. API 호출 및 결과 처리
-        response = requests.get(url, params=params)
-        data = response.json()
+        # 4. API 호출 및 결과 처리 (원본 응답 캐시 적용)
+        data = ResponseCache.fetch('vworld', url, params, lambda: Http.get_content(url, params=params),
+                                   should_cache=self._cacheable)
         self._last_response_raw = data
 
         if data.get('response', {}).get('status') == 'OK':
@@ -107,6 +108,11 @@ class VworldDriver(BoundaryInterface):
 
         return []
 
+    @staticmethod
+    def _cacheable(data: Any) -> bool:
+        """정상 응답(OK / 결과 없음)만 캐시합니다. (인증키 오류, 요청 제한 초과 등 ERROR 응답 제외)"""
+        return isinstance(data, dict) and data.get('response', {}).get('status') in ('OK', 'NOT_FOUND')
+
     def _map_to_handler_input(self, feature: dict, loc_type: str, config: dict) -> dict:
         """
         VWorld API 원본 데이터를 BuildBoundaryItemHandler가 인식할 수 있는
@@ -1,33 +1,279 @@
+import hashlib
+import io
 import os
+import time
+import zipfile
 from abc import ABC, abstractmethod
-from typing import List, Generator
+from typing import Any, Dict, List, Generator, Optional, Tuple
 import unicodedata
+import pyarrow as pa
+from app.core.helpers.config import Config
+from app.services.location.raw.drivers.arrow_text_reader import ArrowTextReader
 from app.services.location.raw.drivers.driver_interface import DriverInterface
 
 
 class AbstractTextDriver(DriverInterface, ABC):
+    """
+    주소DB 텍스트 파일 드라이버
+
+    file_path 는 디스크의 텍스트 파일 경로이거나, 압축을 풀지 않은 ZIP 안의 파일을 가리키는
+    '{zip 경로}!{파일명}' 형식의 경로입니다. (directory_path 에 ZIP 경로를 주면 이 형식으로 목록을 반환)
+    ZIP 안의 파일은 압축 해제와 cp949 디코딩을 읽으면서 수행하므로 current/ 에 풀어 둘 필요가 없습니다.
+
+    임포트 파서는 두 가지입니다. (jgk.import.parser)
+    - line  : 줄마다 split('|') 후 parse_row 로 문서 생성
+    - arrow : pyarrow CSV 리더로 블록 단위 파싱 후 transform_columns 로 열 단위 변환 (COLUMNS 선언 필요)
+    """
+
+    # ZIP 경로와 ZIP 안의 파일명 구분자
+    ZIP_MEMBER_SEPARATOR = '!'
+
+    PARSERS = ('line', 'arrow')
+
+    # 일반 파일 체크섬에 사용할 앞/뒤 구간 크기 (파일 전체를 읽지 않고 변경 여부만 확인)
+    CHECKSUM_SAMPLE_SIZE = 1 << 20
+
+    # 파일 레이아웃 순서의 컬럼명 (arrow 파서용)
+    COLUMNS: Tuple[str, ...] = ()
 
     @property
     @abstractmethod
     def file_prefix(self) -> str:
         pass
 
+    @abstractmethod
+    def parse_row(self, parts: List[str]) -> Optional[dict]:
+        """'|' 로 나눈 한 줄을 저장할 문서로 변환합니다. (컬럼 수가 부족한 줄은 None)"""
+        pass
+
+    def transform_columns(self, batch) -> Dict[str, Any]:
+        """
+        arrow 파서가 읽은 RecordBatch 를 저장할 문서의 컬럼(이름 → 배열)으로 변환합니다.
+        parse_row 와 같은 필드/값/순서를 만들어야 하며, 기본 구현은 COLUMNS 를 그대로 사용합니다.
+        """
+        return {name: batch.column(name) for name in self.COLUMNS}
+
+    @staticmethod
+    def decode_member_name(info: zipfile.ZipInfo) -> str:
+        """ZIP 안의 파일명 (UTF-8 플래그가 없으면 CP437 로 읽힌 바이트를 CP949 로 재해석하여 한글 깨짐 방지)"""
+        if info.flag_bits & 0x800:
+            return info.filename
+        try:
+            return info.filename.encode('cp437').decode('cp949')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return info.filename
+
+    @classmethod
+    def split_source(cls, file_path: str) -> Tuple[str, Optional[str]]:
+        """'{zip 경로}!{파일명}' 을 (zip 경로, 파일명) 으로 나눕니다. 일반 파일이면 (file_path, None)"""
+        marker = f".zip{cls.ZIP_MEMBER_SEPARATOR}"
+        if marker not in file_path:
+            return file_path, None
+
+        zip_path, _, member = file_path.partition(marker)
+        return f"{zip_path}.zip", member
+
+    def _zip_member(self, zip_ref: zipfile.ZipFile, member: str) -> Optional[zipfile.ZipInfo]:
+        for info in zip_ref.infolist():
+            if not info.is_dir() and self.decode_member_name(info) == member:
+                return info
+        return None
+
+    def source_exists(self, file_path: str) -> bool:
+        """파일(또는 ZIP 안의 파일)이 있는지 확인합니다."""
+        zip_path, member = self.split_source(file_path)
+        if member is None:
+            return os.path.exists(file_path)
+        if not os.path.isfile(zip_path):
+            return False
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            return self._zip_member(zip_ref, member) is not None
+
+    def source_name(self, file_path: str) -> str:
+        """로그/완료 표시에 쓰는 파일명 (ZIP 안의 파일은 ZIP 안에서의 파일명)"""
+        _, member = self.split_source(file_path)
+        return os.path.basename(member if member is not None else file_path)
+
+    def source_mtime(self, file_path: str) -> int:
+        """파일 수정 시각 (ZIP 안의 파일은 ZIP 에 기록된 수정 시각이므로 같은 월 자료를 다시 받아도 바뀌지 않습니다.)"""
+        zip_path, member = self.split_source(file_path)
+        if member is None:
+            return int(os.path.getmtime(file_path))
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            info = self._zip_member(zip_ref, member)
+            return self._zip_mtime(info) if info else 0
+
+    @staticmethod
+    def _zip_mtime(info: zipfile.ZipInfo) -> int:
+        return int(time.mktime(info.date_time + (0, 0, -1)))
+
+    def source_size(self, file_path: str) -> int:
+        """압축 해제 기준 파일 크기 (병렬 임포트 시 큰 파일부터 배정하는 데 사용)"""
+        zip_path, member = self.split_source(file_path)
+        if member is None:
+            return os.path.getsize(file_path)
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            info = self._zip_member(zip_ref, member)
+            return info.file_size if info else 0
+
+    def source_fingerprint(self, file_path: str) -> Dict[str, Any]:
+        """
+        임포트 매니페스트 키 (파일명, 크기, 수정 시각, 체크섬)
+        ZIP 안의 파일은 ZIP 에 기록된 CRC32 를, 일반 파일은 앞/뒤 CHECKSUM_SAMPLE_SIZE 구간의 sha1 을 체크섬으로 사용하므로
+        파일 전체를 읽지 않습니다.
+        """
+        zip_path, member = self.split_source(file_path)
+        if member is not None:
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                info = self._zip_member(zip_ref, member)
+                if info is None:
+                    raise FileNotFoundError(file_path)
+                return {
+                    'file_name': self.source_name(file_path),
+                    'size': info.file_size,
+                    'mtime': self._zip_mtime(info),
+                    'checksum': f"crc32:{info.CRC:08x}",
+                }
+
+        size = os.path.getsize(file_path)
+        digest = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(self.CHECKSUM_SAMPLE_SIZE))
+            if size > self.CHECKSUM_SAMPLE_SIZE:
+                f.seek(max(self.CHECKSUM_SAMPLE_SIZE, size - self.CHECKSUM_SAMPLE_SIZE))
+                digest.update(f.read())
+
+        return {
+            'file_name': self.source_name(file_path),
+            'size': size,
+            'mtime': int(os.path.getmtime(file_path)),
+            'checksum': f"sha1-sample:{digest.hexdigest()}",
+        }
+
+    def _open_binary(self, file_path: str, zip_ref: Optional[zipfile.ZipFile] = None):
+        zip_path, member = self.split_source(file_path)
+        if member is None:
+            return open(file_path, 'rb')
+
+        info = self._zip_member(zip_ref, member)
+        if info is None:
+            raise FileNotFoundError(file_path)
+        return zip_ref.open(info)
 
     def read_file_lines(self, file_path: str) -> Generator[str, None, None]:
         """인코딩을 명시적으로 cp949로 고정하되, 깨지는 문자는 무시하고 루프를 유지합니다."""
-        if not os.path.exists(file_path):
+        if not self.source_exists(file_path):
             return
 
+        zip_path, member = self.split_source(file_path)
+        zip_ref = zipfile.ZipFile(zip_path, 'r') if member is not None else None
+
         # 💡 'replace' 옵션은 깨진 바이트를 '?'로 치환하여 루프가 중단되지 않게 합니다.
         # 한국 공공데이터 텍스트 파일은 cp949가 표준입니다.
-        with open(file_path, 'r', encoding='cp949', errors='replace') as f:
-            for line in f:
-                yield line.strip()
+        try:
+            with io.TextIOWrapper(self._open_binary(file_path, zip_ref), encoding='cp949', errors='replace') as f:
+                for line in f:
+                    yield line.strip()
+        finally:
+            if zip_ref is not None:
+                zip_ref.close()
+
+    def count_lines(self, file_path: str) -> int:
+        """파일(또는 ZIP 안의 파일)의 행 수"""
+        if not self.source_exists(file_path):
+            return 0
+
+        zip_path, member = self.split_source(file_path)
+        zip_ref = zipfile.ZipFile(zip_path, 'r') if member is not None else None
+        try:
+            with self._open_binary(file_path, zip_ref) as f:
+                return sum(line.count(b'\n') for line in f)
+        finally:
+            if zip_ref is not None:
+                zip_ref.close()
+
+    def iter_items(self, file_path: str) -> Generator[dict, None, None]:
+        """파일을 한 줄씩 읽어 파싱한 문서를 하나씩 반환합니다."""
+        for line in self.read_file_lines(file_path):
+            if not line:
+                continue
+
+            item = self.parse_row(line.split('|'))
+            if item is not None:
+                yield item
+
+    @staticmethod
+    def _chunk_size(chunk_size: Optional[int] = None) -> int:
+        return max(1, int(chunk_size or Config.get('jgk.import.chunk_size', 5000)))
+
+    def iter_chunks(self, file_path: str, chunk_size: Optional[int] = None,
+                    parser: Optional[str] = None) -> Generator[List[dict], None, None]:
+        """
+        파싱한 문서를 chunk_size 건씩 묶어 반환합니다.
+        파일 전체를 리스트로 만들지 않으므로 메모리 사용량은 파일 크기가 아닌 chunk_size 에 비례합니다.
+        """
+        parser = parser or Config.get('jgk.import.parser', 'line')
+        if parser not in self.PARSERS:
+            raise ValueError(f"지원하지 않는 파서입니다: {parser} (허용: {', '.join(self.PARSERS)})")
+
+        if parser == 'arrow':
+            yield from self.iter_arrow_chunks(file_path, chunk_size)
+            return
+
+        chunk_size = self._chunk_size(chunk_size)
+        chunk: List[dict] = []
+
+        for item in self.iter_items(file_path):
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def iter_arrow_chunks(self, file_path: str, chunk_size: Optional[int] = None) -> Generator[List[dict], None, None]:
+        """pyarrow CSV 리더로 파싱하고 transform_columns 로 변환한 문서를 chunk_size 건씩 반환합니다."""
+        if not self.COLUMNS:
+            raise NotImplementedError(f"{self.__class__.__name__} 는 arrow 파서용 COLUMNS 를 선언하지 않았습니다.")
+        if not self.source_exists(file_path):
+            return
+
+        chunk_size = self._chunk_size(chunk_size)
+        reader = ArrowTextReader(self.COLUMNS, extra_columns=self._extra_columns(file_path))
+
+        zip_path, member = self.split_source(file_path)
+        zip_ref = zipfile.ZipFile(zip_path, 'r') if member is not None else None
+        try:
+            with self._open_binary(file_path, zip_ref) as binary:
+                for batch in reader.read_batches(binary):
+                    table = pa.table(self.transform_columns(batch))
+                    for offset in range(0, table.num_rows, chunk_size):
+                        yield table.slice(offset, chunk_size).to_pylist()
+        finally:
+            if zip_ref is not None:
+                zip_ref.close()
+
+    def _extra_columns(self, file_path: str) -> int:
+        """첫 줄의 컬럼 수가 선언보다 많으면 (줄 끝 구분자 등) 남는 컬럼 수"""
+        lines = self.read_file_lines(file_path)
+        try:
+            first = next((line for line in lines if line), '')
+        finally:
+            lines.close()
+        return max(0, len(first.split('|')) - len(self.COLUMNS)) if first else 0
 
     def get_file_list(self, directory: str, prefix: str = "") -> List[str]:
         """
         NFC(완성형)와 NFD(조합형) 프리픽스를 모두 허용하여 파일 목록을 추출합니다.
+        directory 가 ZIP 파일이면 ZIP 안의 파일을 '{zip 경로}!{파일명}' 형식으로 반환합니다.
         """
+        if directory.endswith('.zip') and os.path.isfile(directory):
+            return self._get_zip_member_list(directory, prefix)
+
         if not os.path.isdir(directory):
             return []
 
@@ -48,5 +294,21 @@ class AbstractTextDriver(DriverInterface, ABC):
 
         return sorted(file_list)
 
+    def _get_zip_member_list(self, zip_path: str, prefix: str = "") -> List[str]:
+        nfc_prefix = unicodedata.normalize('NFC', prefix)
+
+        file_list = []
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+
+                member = self.decode_member_name(info)
+                name = unicodedata.normalize('NFC', os.path.basename(member))
+                if name.endswith('.txt') and name.startswith(nfc_prefix):
+                    file_list.append(f"{zip_path}{self.ZIP_MEMBER_SEPARATOR}{member}")
+
+        return sorted(file_list)
+
     def store(self, items: List[dict]):
-        raise NotImplementedError("Text 드라이버는 저장 기능을 지원하지 않습니다.")
\ No newline at end of file
+        raise NotImplementedError("Text 드라이버는 저장 기능을 지원하지 않습니다.")
@@ -2,12 +2,13 @@ import json
 import re
 import requests
 from abc import abstractmethod
-from typing import List
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import Any, List
 
 from app.services.contracts.drivers.abstract import AbstractDriver
 from app.core.helpers.config import Config
+from app.core.helpers.http import Http
+from app.core.helpers.response_cache import ResponseCache
+from app.facade import rate_limiter
 
 
 class AbstractVworldDriver(AbstractDriver):
@@ -27,13 +28,12 @@ class AbstractVworldDriver(AbstractDriver):
         }
 
     def _call_api(self, params: dict) -> dict:
-        """Vworld API 공통 호출 메서드 (JSON 이스케이프 문자 보정 및 Retry/Timeout 적용)"""
+        """Vworld API 공통 호출 메서드 (JSON 이스케이프 문자 보정 및 응답 캐시/Rate Limit/Retry/Timeout 적용)"""
 
         url = f"{self.config['host']}{self.call_config.get('api_path')}"
 
         # 공통 파라미터 설정
         default_params = {
-            'key': Config.get('vworld.key'),
             'domain': Config.get('vworld.domain'),
             'format': 'json',
             'crs': 'EPSG:4326',
@@ -46,40 +46,43 @@ class AbstractVworldDriver(AbstractDriver):
         }
         request_params = {**default_params, **params}
 
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
+        def request() -> bytes:
+            service_key = rate_limiter.acquire('vworld', Config.get('vworld.key'))
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+            # 공유 커넥션 풀 + 공통 재시도/타임아웃 정책 (app/configs/http.py)
+            response = Http.get(url, params={'key': service_key, **request_params})
+            rate_limiter.report('vworld', service_key, Http.status_history(response))
+            response.raise_for_status()
+            return response.content
 
-        with requests.Session() as session:
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
+        try:
+            # 캐시 적중 시 토큰/쿼터 소모 없이 원본 응답을 재사용합니다.
+            return ResponseCache.fetch('vworld', url, request_params, request, decode=self._decode,
+                                       should_cache=self._cacheable)
 
-            try:
-                response = session.get(url, params=request_params, timeout=10)
-                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"📡 API 호출 실패: {url} | Params: {params} | Error: {e}")
+            raise e
+        except json.JSONDecodeError as e:
+            print(f"❌ JSON 파싱 최종 실패: {url} | Error: {e}")
+            raise e
 
-                # 🚀 [수정 지점] JSON 파싱 에러 방지를 위한 보정 로직
-                raw_text = response.text
-                try:
-                    # 일반적인 상황에서는 바로 파싱
-                    return json.loads(raw_text)
-                except json.JSONDecodeError:
-                    # 이스케이프 에러 발생 시 (예: "시설-4\2") 
-                    # 정상적인 이스케이프 패턴이 아닌 역슬래시(\)를 이중 역슬래시(\\)로 치환
-                    fixed_text = re.sub(r'\\(?![/u"\\bdfnrt])', r'\\\\', raw_text)
-                    return json.loads(fixed_text)
+    @staticmethod
+    def _cacheable(data: Any) -> bool:
+        """정상 응답(OK / 결과 없음)만 캐시합니다. (인증키 오류, 요청 제한 초과 등 ERROR 응답 제외)"""
+        return isinstance(data, dict) and data.get('response', {}).get('status') in ('OK', 'NOT_FOUND')
 
-            except requests.exceptions.RequestException as e:
-                print(f"📡 API 호출 실패: {url} | Params: {params} | Error: {e}")
-                raise e
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON 파싱 최종 실패: {url} | Error: {e}")
-                raise e
+    @staticmethod
+    def _decode(content: bytes) -> dict:
+        # 🚀 [수정 지점] JSON 파싱 에러 방지를 위한 보정 로직
+        try:
+            # 일반적인 상황에서는 바로 파싱
+            return Http.loads(content)
+        except ValueError:
+            # 이스케이프 에러 발생 시 (예: "시설-4\2")
+            # 정상적인 이스케이프 패턴이 아닌 역슬래시(\)를 이중 역슬래시(\\)로 치환
+            fixed_text = re.sub(r'\\(?![/u"\\bdfnrt])', r'\\\\', content.decode('utf-8', errors='replace'))
+            return json.loads(fixed_text)
 
     def store(self, items: List[dict]):
         raise NotImplementedError("주소검색 API 드라이버는 저장 기능을 지원하지 않습니다.")
\ No newline at end of file
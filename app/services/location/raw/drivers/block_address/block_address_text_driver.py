@@ -1,10 +1,16 @@
-import os
-from typing import List
+from typing import Any, Dict, List, Optional
 from app.services.location.raw.drivers.abstract_text_driver import AbstractTextDriver
+from app.services.location.raw.drivers.arrow_text_reader import ArrowTextReader
 
 
 class BlockAddressTextDriver(AbstractTextDriver):
 
+    # 파일 레이아웃 순서의 컬럼명 (arrow 파서용, 11개 / 0번 건물관리번호 = road_address_id)
+    COLUMNS = (
+        'road_address_id', 'serial_no', 'bjd_code', 'si_nm', 'sgg_nm', 'emd_nm', 'li_nm',
+        'mountain_yn', 'lnbr_mnnm', 'lnbr_slno', 'representative_yn',
+    )
+
     @property
     def file_prefix(self) -> str:
         return '지번_'
@@ -21,35 +27,11 @@ class BlockAddressTextDriver(AbstractTextDriver):
             # 서비스에서 [item['file_path'] for item in pagination.items] 로 쓰므로 형식을 맞춤
             return [{'file_path': f} for f in files]
 
-        # 2. 파일 경로가 들어온 경우: 파일 내용 파싱 (서비스의 import_single_file 대응)
-        if file_path and os.path.exists(file_path):
+        # 2. 파일 경로가 들어온 경우: 파일 내용 파싱 (임포트는 iter_chunks 로 스트리밍하므로 read() 조회용)
+        if file_path and self.source_exists(file_path):
             results = []
-            lines = self.read_file_lines(file_path)
-
-            for line in lines:
-                if not line: continue
-
-                parts = line.split('|')
-                if len(parts) < 11:
-                    continue
-
-                bd_mgt_sn = parts[0]
-                serial_no = parts[1]
-
-                results.append({
-                    'block_address_id': f"{bd_mgt_sn}_{serial_no}",
-                    'road_address_id': bd_mgt_sn,
-                    'serial_no': serial_no,
-                    'bjd_code': parts[2],
-                    'si_nm': parts[3],
-                    'sgg_nm': parts[4],
-                    'emd_nm': parts[5],
-                    'li_nm': parts[6],
-                    'mountain_yn': parts[7],
-                    'lnbr_mnnm': parts[8],
-                    'lnbr_slno': parts[9],
-                    'representative_yn': parts[10]
-                })
+            for item in self.iter_items(file_path):
+                results.append(item)
 
                 if single:
                     break
@@ -58,6 +40,36 @@ class BlockAddressTextDriver(AbstractTextDriver):
 
         return []
 
+    def parse_row(self, parts: List[str]) -> Optional[dict]:
+        """관련지번 한 줄을 문서로 변환합니다."""
+        if len(parts) < 11:
+            return None
+
+        bd_mgt_sn = parts[0]
+        serial_no = parts[1]
+
+        return {
+            'block_address_id': f"{bd_mgt_sn}_{serial_no}",
+            'road_address_id': bd_mgt_sn,
+            'serial_no': serial_no,
+            'bjd_code': parts[2],
+            'si_nm': parts[3],
+            'sgg_nm': parts[4],
+            'emd_nm': parts[5],
+            'li_nm': parts[6],
+            'mountain_yn': parts[7],
+            'lnbr_mnnm': parts[8],
+            'lnbr_slno': parts[9],
+            'representative_yn': parts[10]
+        }
+
+    def transform_columns(self, batch) -> Dict[str, Any]:
+        """parse_row 와 같은 문서를 열 단위로 만듭니다. (block_address_id = 건물관리번호_일련번호)"""
+        return {
+            'block_address_id': ArrowTextReader.join(batch.column('road_address_id'), batch.column('serial_no')),
+            **{name: batch.column(name) for name in self.COLUMNS},
+        }
+
     def _get_total_count(self) -> int:
         """목록 조회일 때는 파일 개수를, 파싱일 때는 행 수를 반환합니다."""
         file_path = self.arguments('file_path')
@@ -66,8 +78,7 @@ class BlockAddressTextDriver(AbstractTextDriver):
         if directory_path:
             return len(self.get_file_list(directory_path, prefix=self.file_prefix))
 
-        if file_path and os.path.exists(file_path):
-            with open(file_path, 'rb') as f:
-                return sum(line.count(b'\n') for line in f)
+        if file_path:
+            return self.count_lines(file_path)
 
         return 0
\ No newline at end of file
@@ -1,5 +1,7 @@
 
-from typing import Collection
+from typing import Collection, List
+
+from pymongo import IndexModel, ASCENDING
 
 from app.services.location.raw.drivers.abstract_mongodb_driver import AbstractMongodbDriver
 from app.services.location.raw.drivers.driver_interface import DriverInterface
@@ -21,4 +23,11 @@ class PointGeometryMongodbDriver(AbstractMongodbDriver, DriverInterface):
     def convert_types(self) -> dict:
         return {
             'manage_id': str
-        }
\ No newline at end of file
+        }
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        return super().indexes + [
+            # 주소 빌드: 건물관리번호 + 갱신일 기준 좌표 조회
+            IndexModel([('bdMgtSn', ASCENDING), ('updated_at', ASCENDING)]),
+        ]
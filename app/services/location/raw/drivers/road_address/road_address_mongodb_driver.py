@@ -1,5 +1,7 @@
 
-from typing import Collection
+from typing import Collection, List
+
+from pymongo import IndexModel, ASCENDING
 
 from app.services.location.raw.drivers.abstract_mongodb_driver import AbstractMongodbDriver
 from app.services.location.raw.drivers.driver_interface import DriverInterface
@@ -21,4 +23,11 @@ class RoadAddressMongodbDriver(AbstractMongodbDriver, DriverInterface):
     def convert_types(self) -> dict:
         return {
             'road_address_id': str
-        }
\ No newline at end of file
+        }
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        return super().indexes + [
+            # 도로명코드 집계의 $lookup (road_code → road_address)
+            IndexModel([('road_code', ASCENDING)]),
+        ]
@@ -1,10 +1,16 @@
-import os
-from typing import List
+from typing import Any, Dict, List, Optional
 from app.services.location.raw.drivers.abstract_text_driver import AbstractTextDriver
+from app.services.location.raw.drivers.arrow_text_reader import ArrowTextReader
 
 
 class RoadAddressTextDriver(AbstractTextDriver):
 
+    # 파일 레이아웃 순서의 컬럼명 (arrow 파서용, 11개)
+    COLUMNS = (
+        'manage_no', 'road_code', 'emd_serial_no', 'is_basement', 'build_mnnm', 'build_slno',
+        'basic_area_no', 'change_reason', 'notice_date', 'prev_road_addr', 'has_detail',
+    )
+
     @property
     def file_prefix(self) -> str:
         return '주소_'
@@ -22,46 +28,10 @@ class RoadAddressTextDriver(AbstractTextDriver):
             return [{'file_path': f} for f in files]
 
         # 2. 파일 경로가 들어온 경우: 도로명주소(건물) 데이터 파싱
-        if file_path and os.path.exists(file_path):
+        if file_path and self.source_exists(file_path):
             results = []
-            # 부모 클래스에서 정의한 cp949 기반 Safe Read 사용
-            lines = self.read_file_lines(file_path)
-
-            for line in lines:
-                if not line: continue
-
-                parts = line.split('|')
-                # 이미지 레이아웃 상 11개의 컬럼이 존재함
-                if len(parts) < 11:
-                    continue
-
-                # 이미지 정의서 기반 매핑
-                manage_no = parts[0]      # 관리번호 (PK)
-                road_code = parts[1]      # 도로명코드
-                emd_serial_no = parts[2]  # 읍면동일련번호
-                is_basement = parts[3]    # 지하여부 (0:지상, 1:지하, 2:공중, 3:수상)
-                build_mnnm = parts[4]     # 건물본번
-                build_slno = parts[5]     # 건물부번
-                basic_area_no = parts[6]  # 기초구역번호(우편번호)
-                change_reason = parts[7]  # 변경사유코드
-                notice_date = parts[8]    # 고시일자
-                prev_road_addr = parts[9] # 변경전 도로명주소
-                has_detail = parts[10]    # 상세주소 부여여부
-
-                results.append({
-                    'road_address_id': manage_no, # 관리번호를 ID로 사용
-                    'manage_no': manage_no,
-                    'road_code': road_code,
-                    'emd_serial_no': emd_serial_no,
-                    'is_basement': is_basement,
-                    'build_mnnm': int(build_mnnm) if build_mnnm.isdigit() else 0,
-                    'build_slno': int(build_slno) if build_slno.isdigit() else 0,
-                    'basic_area_no': basic_area_no,
-                    'change_reason': change_reason,
-                    'notice_date': notice_date,
-                    'prev_road_addr': prev_road_addr,
-                    'has_detail': has_detail
-                })
+            for item in self.iter_items(file_path):
+                results.append(item)
 
                 if single:
                     break
@@ -70,6 +40,47 @@ class RoadAddressTextDriver(AbstractTextDriver):
 
         return []
 
+    def parse_row(self, parts: List[str]) -> Optional[dict]:
+        """도로명주소(건물) 한 줄을 문서로 변환합니다."""
+        # 이미지 레이아웃 상 11개의 컬럼이 존재함
+        if len(parts) < 11:
+            return None
+
+        # 이미지 정의서 기반 매핑
+        manage_no = parts[0]      # 관리번호 (PK)
+        road_code = parts[1]      # 도로명코드
+        emd_serial_no = parts[2]  # 읍면동일련번호
+        is_basement = parts[3]    # 지하여부 (0:지상, 1:지하, 2:공중, 3:수상)
+        build_mnnm = parts[4]     # 건물본번
+        build_slno = parts[5]     # 건물부번
+        basic_area_no = parts[6]  # 기초구역번호(우편번호)
+        change_reason = parts[7]  # 변경사유코드
+        notice_date = parts[8]    # 고시일자
+        prev_road_addr = parts[9] # 변경전 도로명주소
+        has_detail = parts[10]    # 상세주소 부여여부
+
+        return {
+            'road_address_id': manage_no, # 관리번호를 ID로 사용
+            'manage_no': manage_no,
+            'road_code': road_code,
+            'emd_serial_no': emd_serial_no,
+            'is_basement': is_basement,
+            'build_mnnm': int(build_mnnm) if build_mnnm.isdigit() else 0,
+            'build_slno': int(build_slno) if build_slno.isdigit() else 0,
+            'basic_area_no': basic_area_no,
+            'change_reason': change_reason,
+            'notice_date': notice_date,
+            'prev_road_addr': prev_road_addr,
+            'has_detail': has_detail
+        }
+
+    def transform_columns(self, batch) -> Dict[str, Any]:
+        """parse_row 와 같은 문서를 열 단위로 만듭니다. (건물 본번/부번은 정수 변환)"""
+        columns = {name: batch.column(name) for name in self.COLUMNS}
+        columns['build_mnnm'] = ArrowTextReader.to_int(columns['build_mnnm'])
+        columns['build_slno'] = ArrowTextReader.to_int(columns['build_slno'])
+        return {'road_address_id': columns['manage_no'], **columns}
+
     def _get_total_count(self) -> int:
         """목록 조회일 때는 파일 개수를, 파싱일 때는 행 수를 반환합니다."""
         file_path = self.arguments('file_path')
@@ -78,9 +89,8 @@ class RoadAddressTextDriver(AbstractTextDriver):
         if directory_path:
             return len(self.get_file_list(directory_path, prefix=self.file_prefix))
 
-        if file_path and os.path.exists(file_path):
+        if file_path and self.source_exists(file_path):
             # 인코딩 이슈를 피하기 위해 Binary 모드로 행 수 계산
-            with open(file_path, 'rb') as f:
-                return sum(line.count(b'\n') for line in f)
+            return self.count_lines(file_path)
 
         return 0
\ No newline at end of file
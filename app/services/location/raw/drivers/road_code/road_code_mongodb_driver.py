@@ -1,5 +1,7 @@
 
-from typing import Collection
+from typing import Collection, List
+
+from pymongo import IndexModel, ASCENDING
 
 from app.services.location.raw.drivers.abstract_mongodb_driver import AbstractMongodbDriver
 from app.services.location.raw.drivers.driver_interface import DriverInterface
@@ -21,4 +23,12 @@ class RoadCodeMongodbDriver(AbstractMongodbDriver, DriverInterface):
     def convert_types(self) -> dict:
         return {
             'road_code_id': str
-        }
\ No newline at end of file
+        }
+
+    @property
+    def indexes(self) -> List[IndexModel]:
+        return super().indexes + [
+            # 공간정보 빌드: 미매핑(address_id) / 갱신 주기 도래(updated_at) 대상 조회
+            IndexModel([('address_id', ASCENDING)]),
+            IndexModel([('updated_at', ASCENDING)]),
+        ]
@@ -1,10 +1,17 @@
-import os
-from typing import List
+from typing import Any, Dict, List, Optional
 from app.services.location.raw.drivers.abstract_text_driver import AbstractTextDriver
+from app.services.location.raw.drivers.arrow_text_reader import ArrowTextReader
 
 
 class RoadCodeTextDriver(AbstractTextDriver):
 
+    # 파일 레이아웃 순서의 컬럼명 (arrow 파서용, 17개)
+    COLUMNS = (
+        'road_code', 'road_nm', 'road_nm_eng', 'emd_sn', 'sido_nm', 'sido_nm_eng', 'sgg_nm', 'sgg_nm_eng',
+        'emd_nm', 'emd_nm_eng', 'emd_se', 'emd_code', 'use_yn', 'change_reason', 'change_history',
+        'notice_date', 'expire_date',
+    )
+
     @property
     def file_prefix(self) -> str:
         return '개선_도로명코드_'
@@ -20,60 +27,10 @@ class RoadCodeTextDriver(AbstractTextDriver):
             return [{'file_path': f} for f in files]
 
         # 2. 파일 경로가 들어온 경우: 데이터 파싱
-        if file_path and os.path.exists(file_path):
+        if file_path and self.source_exists(file_path):
             results = []
-            lines = self.read_file_lines(file_path)
-
-            for line in lines:
-                if not line: continue
-
-                parts = line.split('|')
-                # 17번 컬럼(말소일자)까지 있으므로 최소 17개 이상의 컬럼 확인
-                if len(parts) < 17:
-                    continue
-
-                # 데이터 매핑 (인덱스는 0부터 시작)
-                road_code      = parts[0]   # 0: 도로명코드 (12자리)
-                road_nm        = parts[1]   # 1: 도로명
-                road_nm_eng    = parts[2]   # 2: 도로명 로마자
-                emd_sn         = parts[3]   # 3: 읍면동일련번호 (2자리)
-                sido_nm        = parts[4]   # 4: 시도명
-                sido_nm_eng    = parts[5]   # 5: 시도명 로마자
-                sgg_nm         = parts[6]   # 6: 시군구명
-                sgg_nm_eng     = parts[7]   # 7: 시군구명 로마자
-                emd_nm         = parts[8]   # 8: 읍면동명
-                emd_nm_eng     = parts[9]   # 9: 읍면동명 로마자
-                emd_se         = parts[10]  # 10: 읍면동구분
-                emd_code       = parts[11]  # 11: 읍면동코드
-                use_yn         = parts[12]  # 12: 사용여부
-                change_reason  = parts[13]  # 13: 변경사유 (0~4, 9)
-                change_history = parts[14]  # 14: 변경이력정보
-                notice_date    = parts[15]  # 15: 고시일자 (YYYYMMDD)
-                expire_date    = parts[16]  # 16: 말소일자 (YYYYMMDD)
-
-                # PK 결론: 데이터 유실 방지를 위한 조합형 ID
-                road_code_id = f"{road_code}_{emd_sn}"
-
-                results.append({
-                    'road_code_id': road_code_id,
-                    'road_code': road_code,
-                    'road_nm': road_nm,
-                    'road_nm_eng': road_nm_eng,
-                    'emd_sn': emd_sn,
-                    'sido_nm': sido_nm,
-                    'sido_nm_eng': sido_nm_eng,
-                    'sgg_nm': sgg_nm,
-                    'sgg_nm_eng': sgg_nm_eng,
-                    'emd_nm': emd_nm,
-                    'emd_nm_eng': emd_nm_eng,
-                    'emd_se': emd_se,
-                    'emd_code': emd_code,
-                    'use_yn': use_yn,
-                    'change_reason': change_reason,
-                    'change_history': change_history,
-                    'notice_date': notice_date,
-                    'expire_date': expire_date
-                })
+            for item in self.iter_items(file_path):
+                results.append(item)
 
                 if single:
                     break
@@ -82,6 +39,62 @@ class RoadCodeTextDriver(AbstractTextDriver):
 
         return []
 
+    def parse_row(self, parts: List[str]) -> Optional[dict]:
+        """도로명코드 한 줄을 문서로 변환합니다."""
+        # 17번 컬럼(말소일자)까지 있으므로 최소 17개 이상의 컬럼 확인
+        if len(parts) < 17:
+            return None
+
+        # 데이터 매핑 (인덱스는 0부터 시작)
+        road_code      = parts[0]   # 0: 도로명코드 (12자리)
+        road_nm        = parts[1]   # 1: 도로명
+        road_nm_eng    = parts[2]   # 2: 도로명 로마자
+        emd_sn         = parts[3]   # 3: 읍면동일련번호 (2자리)
+        sido_nm        = parts[4]   # 4: 시도명
+        sido_nm_eng    = parts[5]   # 5: 시도명 로마자
+        sgg_nm         = parts[6]   # 6: 시군구명
+        sgg_nm_eng     = parts[7]   # 7: 시군구명 로마자
+        emd_nm         = parts[8]   # 8: 읍면동명
+        emd_nm_eng     = parts[9]   # 9: 읍면동명 로마자
+        emd_se         = parts[10]  # 10: 읍면동구분
+        emd_code       = parts[11]  # 11: 읍면동코드
+        use_yn         = parts[12]  # 12: 사용여부
+        change_reason  = parts[13]  # 13: 변경사유 (0~4, 9)
+        change_history = parts[14]  # 14: 변경이력정보
+        notice_date    = parts[15]  # 15: 고시일자 (YYYYMMDD)
+        expire_date    = parts[16]  # 16: 말소일자 (YYYYMMDD)
+
+        # PK 결론: 데이터 유실 방지를 위한 조합형 ID
+        road_code_id = f"{road_code}_{emd_sn}"
+
+        return {
+            'road_code_id': road_code_id,
+            'road_code': road_code,
+            'road_nm': road_nm,
+            'road_nm_eng': road_nm_eng,
+            'emd_sn': emd_sn,
+            'sido_nm': sido_nm,
+            'sido_nm_eng': sido_nm_eng,
+            'sgg_nm': sgg_nm,
+            'sgg_nm_eng': sgg_nm_eng,
+            'emd_nm': emd_nm,
+            'emd_nm_eng': emd_nm_eng,
+            'emd_se': emd_se,
+            'emd_code': emd_code,
+            'use_yn': use_yn,
+            'change_reason': change_reason,
+            'change_history': change_history,
+            'notice_date': notice_date,
+            'expire_date': expire_date
+        }
+
+    def transform_columns(self, batch) -> Dict[str, Any]:
+        """parse_row 와 같은 문서를 열 단위로 만듭니다. (road_code_id = 도로명코드_읍면동일련번호)"""
+        return {
+            'road_code_id': ArrowTextReader.join(batch.column('road_code'), batch.column('emd_sn')),
+            **{name: batch.column(name) for name in self.COLUMNS},
+        }
+
     def _get_total_count(self) -> int:
         file_path = self.arguments('file_path')
         directory_path = self.arguments('directory_path')
@@ -89,8 +102,7 @@ class RoadCodeTextDriver(AbstractTextDriver):
         if directory_path:
             return len(self.get_file_list(directory_path, prefix=self.file_prefix))
 
-        if file_path and os.path.exists(file_path):
-            with open(file_path, 'rb') as f:
-                return sum(line.count(b'\n') for line in f)
+        if file_path:
+            return self.count_lines(file_path)
 
         return 0
\ No newline at end of file
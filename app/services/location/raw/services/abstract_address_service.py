@@ -1,8 +1,8 @@
 import os
-import logging
-import glob
 from abc import abstractmethod
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
+
+from app.facade import import_manifest
 
 from app.services.location.raw.managers.abstract_manager import AbstractManager
 from app.services.location.raw.managers.block_address_manager import BlockAddressManager
@@ -23,38 +23,16 @@ class AbstractAddressService(AbstractService):
     def manager(self) -> Union[AbstractManager, BlockAddressManager, RoadAddressManager, BuildingGroupManager]:
         pass
 
-    def should_process_file(self, file_path: str) -> bool:
+    def should_process_file(self, file_path: str, fingerprint: Optional[Dict[str, Any]] = None) -> bool:
         """
-        FINISH 또는 SKIP 로그를 확인하여 파일 처리 여부를 결정합니다.
-        logrotate된 파일까지 모두 검사합니다.
+        임포트 매니페스트에서 같은 파일(파일명/크기/수정 시각/체크섬)이 이미 완료되었는지 확인하여 처리 여부를 결정합니다.
+        (dataset 은 서비스의 logger_name)
         """
-        current_mtime = int(os.path.getmtime(file_path))
-        file_name = os.path.basename(file_path)
-
-        patterns = [
-            f"✅ FINISH: {file_name} (mtime: {current_mtime})",
-            f"⏭️  SKIP: {file_name} (mtime: {current_mtime})"
-        ]
-
-        for handler in self.logger.handlers:
-            if isinstance(handler, logging.FileHandler):
-                base_log_path = handler.baseFilename
-                log_files = [base_log_path] + glob.glob(f"{base_log_path}.*")
-
-                for log_file in log_files:
-                    if not os.path.exists(log_file):
-                        continue
-                    try:
-                        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            if any(pattern in content for pattern in patterns):
-                                return False
-                    except Exception:
-                        continue
-        return True
+        fingerprint = fingerprint or self.manager.text_driver.source_fingerprint(file_path)
+        return not import_manifest.is_done(self.logger_name, fingerprint)
 
     def get_import_target_files(self, directory_path: str) -> List[str]:
-        """디렉토리 내 파일 목록을 추출합니다."""
+        """디렉토리(또는 압축을 풀지 않은 ZIP) 내 파일 목록을 추출합니다."""
         pagination = self.manager.text_driver.clear().set_arguments({
             'directory_path': directory_path
         }).read()
@@ -63,33 +41,35 @@ class AbstractAddressService(AbstractService):
         return [item['file_path'] for item in items if os.path.basename(item['file_path'])]
 
     def import_single_file(self, file_path: str) -> int:
-        """공통 임포트 프로세스 (체크 -> 읽기 -> 저장 -> 로그)"""
-        file_name = os.path.basename(file_path)
-        current_mtime = int(os.path.getmtime(file_path))
+        """
+        공통 임포트 프로세스 (체크 -> 읽기 -> 저장 -> 매니페스트/로그)
 
-        if not self.should_process_file(file_path):
+        파일을 chunk_size 건씩 파싱하여 bulk writer 에 넘기므로, 앞 청크를 저장하는 동안 다음 청크를 파싱합니다.
+        대기열이 가득 차면 파싱이 멈추므로 메모리 사용량은 파일 크기와 무관하게 chunk_size × max_pending 으로 제한됩니다.
+        """
+        fingerprint = self.manager.text_driver.source_fingerprint(file_path)
+        file_name = fingerprint['file_name']
+        current_mtime = fingerprint['mtime']
+
+        if not self.should_process_file(file_path, fingerprint):
             self.logger.info(f"⏭️  SKIP: {file_name} (mtime: {current_mtime}) (이미 처리됨)")
             return 0
 
         self.logger.info(f"🚀 START: {file_name} 임포트 시작 (mtime: {current_mtime})")
+        import_manifest.start(self.logger_name, fingerprint)
 
         try:
-            pagination = self.manager.text_driver.clear().set_arguments({
-                'file_path': file_path
-            }).read()
-
-            all_items = pagination.items
-
-            if not all_items:
-                self.logger.info(f"✅ FINISH: {file_name} (mtime: {current_mtime}) (0건)")
-                return 0
-
-            self.manager.mongodb_driver.store(all_items)
-            total_saved = len(all_items)
+            total_saved = 0
+            with self.manager.mongodb_driver.bulk_writer() as writer:
+                for chunk in self.manager.text_driver.iter_chunks(file_path):
+                    writer.submit(chunk)
+                    total_saved += len(chunk)
 
+            import_manifest.finish(self.logger_name, fingerprint, total_saved, writer.report())
             self.logger.info(f"✅ FINISH: {file_name} (mtime: {current_mtime}) (총 {total_saved}건)")
             return total_saved
 
         except Exception as e:
+            import_manifest.fail(self.logger_name, fingerprint, str(e))
             self.logger.error(f"❌ ERROR: {file_name} - {str(e)}")
-            raise e
\ No newline at end of file
+            raise e
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from app.core.helpers.config import Config
 from app.core.helpers.log import Log
+from app.services.location.raw.drivers.abstract_text_driver import AbstractTextDriver
 
 
 class AddressDBDownloadService:
@@ -16,6 +17,16 @@ class AddressDBDownloadService:
         self.base_dir = f"{Config.get('app.project_root')}/resources/juso_go_kr/address_db"
         self.current_dir = os.path.join(self.base_dir, "current")
         self.base_url = "https://business.juso.go.kr/api/jst/download"
+        # zip 이면 텍스트 드라이버가 ZIP 에서 바로 읽으므로 current/ 에 압축을 풀지 않습니다.
+        self.source = Config.get('jgk.import.source', 'zip')
+
+    def import_source(self) -> str:
+        """임포트할 파일 목록 위치 (zip 모드에서는 가장 최근 ZIP, 없거나 current 모드이면 current/ 디렉토리)"""
+        if self.source == 'zip':
+            zip_files = sorted(glob.glob(os.path.join(self.base_dir, "*.zip")), reverse=True)
+            if zip_files:
+                return zip_files[0]
+        return self.current_dir
 
     def run(self):
         """서비스 메인 실행 로직"""
@@ -36,6 +47,14 @@ class AddressDBDownloadService:
             if self._download_file(url, dest_path):
                 downloaded = True
 
+        # 2-1. ZIP 에서 바로 읽는 경우: 압축 해제를 생략하고 이전에 풀어 둔 current 를 정리
+        if downloaded and self.source == 'zip':
+            if os.path.exists(self.current_dir):
+                shutil.rmtree(self.current_dir)
+                self.logger.info("🧹 ZIP 직접 읽기 모드: current 디렉토리를 삭제했습니다.")
+            self._cleanup_old_files()
+            return
+
         # 2. 압축 해제 판단 (다운로드 성공했거나, 파일은 있는데 current가 없는 경우)
         if downloaded:
             should_extract = False
@@ -110,10 +129,7 @@ class AddressDBDownloadService:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 for file_info in zip_ref.infolist():
                     # 💡 CP437 바이트를 CP949로 재해석하여 한글 깨짐 방지
-                    try:
-                        decoded_name = file_info.filename.encode('cp437').decode('cp949')
-                    except:
-                        decoded_name = file_info.filename
+                    decoded_name = AbstractTextDriver.decode_member_name(file_info)
 
                     target_path = os.path.join(self.current_dir, decoded_name)
 
@@ -3,6 +3,7 @@ from app.services.location.raw.managers.continuous_geometry_manager import Conti
 from app.services.location.raw.managers.abstract_manager import AbstractManager
 from app.services.location.raw.services.abstract_service import AbstractService
 from app.core.helpers.log import Log
+from app.services.contracts.drivers.unit_of_work import UnitOfWork
 
 
 class ContinuousGeometryService(AbstractService):
@@ -18,11 +19,21 @@ class ContinuousGeometryService(AbstractService):
     def manager(self) -> AbstractManager:
         return self._manager
 
-    def get_detail_by_chain(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def get_detail_by_chain(self, params: Dict[str, Any], uow: Optional[UnitOfWork] = None) -> Optional[Dict[str, Any]]:
+        """
+        uow 가 주어지면 VWorld 수집 결과를 바로 저장하지 않고 UnitOfWork 에 등록합니다.
+        같은 배치에서 이미 버퍼에 등록한 ID 는 MongoDB/VWorld 를 조회하지 않고 버퍼의 문서를 반환합니다.
+        """
         mongodb_driver = self.manager.driver(self.DRIVER_MONGODB)
         item = None
         target_id = params.get('id')
 
+        # 0. 같은 배치에서 수집해 아직 기록하지 않은 데이터 조회
+        if target_id and uow is not None:
+            buffered = uow.lookup(mongodb_driver, 'id', target_id)
+            if buffered:
+                return buffered[-1]
+
         # 1. 기존 데이터 조회 (ID가 있을 경우)
         # updated_at 필터를 쿼리에 포함하여 is_expired 호출 생략
         if target_id:
@@ -45,7 +56,10 @@ class ContinuousGeometryService(AbstractService):
             if item:
                 item['bdMgtSn'] = params.get('bdMgtSn')
                 # 🚀 store 시 manage_id 등을 활용해 중복 Insert 방지 확인 필요
-                mongodb_driver.store([item])
+                if uow is not None:
+                    uow.register(mongodb_driver, [item])
+                else:
+                    mongodb_driver.store([item])
 
         return item
 
@@ -1,7 +1,8 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from app.services.location.raw.managers.abstract_manager import AbstractManager
 from app.services.location.raw.services.abstract_service import AbstractService
 from app.core.helpers.log import Log
+from app.services.contracts.drivers.unit_of_work import UnitOfWork
 
 
 class PointGeometryService(AbstractService):
@@ -17,14 +18,26 @@ class PointGeometryService(AbstractService):
     def manager(self) -> AbstractManager:
         return self._manager
 
-    def get_list_by_chain(self, params: Dict[str, Any]) -> Any:
+    def get_list_by_chain(self, params: Dict[str, Any], uow: Optional[UnitOfWork] = None) -> Any:
+        """
+        uow 가 주어지면 VWorld 수집 결과를 바로 저장하지 않고 UnitOfWork 에 등록합니다.
+        같은 배치에서 이미 수집해 버퍼에 등록한 건물관리번호는 MongoDB/VWorld 를 조회하지 않고 버퍼의 좌표를 반환합니다.
+        """
         mongodb_driver = self.manager.driver(self.DRIVER_MONGODB)
         bd_mgt_sn = params.get('bd_mgt_sn')
 
+        if uow is not None:
+            buffered = uow.lookup(mongodb_driver, 'bdMgtSn', bd_mgt_sn)
+            if buffered:
+                return mongodb_driver.clear().set_pagination(params['page'], params['per_page']).set_arguments({
+                    'item_mode': mongodb_driver.ITEM_MODE_RAW
+                }).build_pagination(buffered[:params['per_page']], len(buffered))
+
         pagination = mongodb_driver.clear().set_pagination(
             params['page'], params['per_page']).set_arguments({
             'bdMgtSn': bd_mgt_sn,
-            'updated_at': params.get('updated_at')
+            'updated_at': params.get('updated_at'),
+            'count': 'none'
         }).read()
 
         items = pagination.items
@@ -72,7 +85,10 @@ class PointGeometryService(AbstractService):
                     valid_items.append(item)
 
             if valid_items:
-                mongodb_driver.store(valid_items)
+                if uow is not None:
+                    uow.register(mongodb_driver, valid_items)
+                else:
+                    mongodb_driver.store(valid_items)
                 pagination.items = valid_items
 
         return pagination
@@ -1,6 +1,8 @@
 from typing import Optional
 
 from app.services.contracts.dto import PaginationDto
+from app.services.contracts.drivers.keyset import Keyset
+from app.services.contracts.drivers.document_counter import DocumentCounter
 from app.services.location.raw.managers.road_address_manager import RoadAddressManager
 from app.services.location.raw.services.abstract_address_service import AbstractAddressService
 from datetime import datetime, timedelta
@@ -17,9 +19,16 @@ class RoadCodeService(AbstractAddressService):
     def manager(self) -> RoadAddressManager:
         return self._manager
 
-    def get_road_code_aggregate(self, page: int = 1, per_page: int = 1000, match_params: Optional[dict] = None) -> PaginationDto:
-        # 페이지네이션을 위한 skip 계산
+    def get_road_code_aggregate(self, page: int = 1, per_page: int = 1000, match_params: Optional[dict] = None,
+                                after: Optional[str] = None, count: Optional[str] = None) -> PaginationDto:
+        """
+        도로명코드 + 도로명주소/건물군/지번주소 결합 목록을 road_code_id 순으로 조회합니다.
+        after 커서(meta.next_after)를 넘기면 $skip 없이 직전 페이지 이후부터 조회하므로
+        깊은 페이지도 첫 페이지와 같은 비용이며, 조회 중 문서가 갱신되어도 건너뛰는 항목이 없습니다.
+        count 는 전체 건수 계산 방식입니다. (DocumentCounter 모드, 반복 조회 시 none 권장)
+        """
         driver = self.manager.mongodb_driver
+        sort = Keyset.sort_keys([('road_code_id', 1)])
 
         now = datetime.now()
         role_date = now - timedelta(days=7)
@@ -35,28 +44,32 @@ class RoadCodeService(AbstractAddressService):
                 'dead': {'$ne': True},
             }
 
-        total = driver.set_arguments(match)._get_total_count()
+        # 집계 결과는 직접 적재한 원천 데이터이므로 페이징 객체를 검증 없이 만듭니다. (item_mode=raw)
+        driver.clear().set_arguments({'item_mode': 'raw'}).set_pagination(page=page, per_page=per_page)
+        total = DocumentCounter.count(driver.collection, match, count)
 
-        skip_count = (page - 1) * per_page
+        # 1. 이번 페이지에 해당하는 도로명코드 키만 먼저 조회합니다. (road_code_id 인덱스 범위 조회)
+        # 결합 단계의 $unwind 로 빠지거나 늘어나는 행과 무관하게 다음 페이지 커서를 정하기 위해 분리합니다.
+        cursor = driver.collection.find(Keyset.apply(match, sort, after), {'road_code_id': 1}).sort(sort)
+        if not after:
+            cursor = cursor.skip((page - 1) * per_page)
+        keys = list(cursor.limit(per_page + 1))
+
+        driver.has_next = len(keys) > per_page
+        keys = keys[:per_page]
+        driver.next_after = Keyset.next_token(keys, sort, per_page) if driver.has_next else None
+        if not keys:
+            return driver.build_pagination([], total)
 
         pipeline = [
             {
-                '$match': match
-            },
-            # 2. 페이지네이션을 위한 정렬 및 제한 단계 추가
-            # 💡 정렬은 페이지네이션 결과의 일관성을 위해 반드시 필요함
-            {
-                '$sort': {
-                    'road_code_id': 1  # 또는 원하는 정렬 기준
-                }
-            },
-            {
-                '$skip': skip_count
+                '$match': {'_id': {'$in': [key['_id'] for key in keys]}}
             },
+            # 2. 페이지네이션 결과의 일관성을 위해 키 조회와 같은 순서로 정렬
             {
-                '$limit': per_page
+                '$sort': dict(sort)  # road_code_id, _id
             },
-            # 1. 조인 및 데이터 결합 로직 유지
+            # 3. 조인 및 데이터 결합 로직 유지
             {
                 '$lookup': {
                     'from': 'location_raw_road_address',
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-import requests
 from typing import List, Any
 from app.services.message.webhook.drivers.driver_interface import DriverInterface
 from app.core.helpers.config import Config
 from app.core.helpers.log import Log
+from app.core.helpers.http import Http
 
 
 class AbstractSlackDriver(ABC):
@@ -51,7 +51,7 @@ class AbstractSlackDriver(ABC):
                 else:
                     payload = {"text": str(item)}
 
-                response = requests.post(self.webhook_url, json=payload, timeout=5)
+                response = Http.post(self.webhook_url, json=payload, timeout=5)
 
                 if response.status_code == 200:
                     results.append(True)
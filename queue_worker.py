@@ -6,6 +6,7 @@ from typing import Any
 from app.core.runner import run_with_services
 from app.core.logger import log_exception
 from app.facade import queue
+from app.core.helpers.config import Config
 from app.core.helpers.log import Log
 
 # 🚀 중요: facade.queue 내부에 선언된 celery 앱 인스턴스 참조
@@ -38,7 +39,7 @@ def run_worker(worker_logger: logging.Logger, log_config: Any) -> None:
         celery_app.worker_main([
             'worker',
             '--loglevel=info',
-            '--concurrency=1',
+            f"--concurrency={int(Config.get('queue.worker_concurrency', 1))}",
             '-n', 'landmark_worker@%h'
         ])
     except Exception as e: